@@ -0,0 +1,56 @@
+"""
+Per-call latency of the list-based Board against the BitBoard engine.
+
+Run from the repository root:
+    python -m benchmarks.bench_board
+"""
+import copy
+
+from benchmarks.common import format_latency, time_per_call
+from tictactoe.bitboard import BitBoard
+from tictactoe.board import Board, Symbol
+from tictactoe.move import MoveType
+
+# A mid-game position without a winner
+POSITION = [
+    (MoveType.MM, Symbol.X),
+    (MoveType.HG, Symbol.O),
+    (MoveType.BD, Symbol.X),
+    (MoveType.HD, Symbol.O),
+]
+
+
+def setup(board_cls):
+    board = board_cls()
+    for move, symbol in POSITION:
+        board.set_move(move, symbol)
+    return board
+
+
+def main():
+    operations = {
+        "has_winner": lambda board: board.has_winner,
+        "is_full": lambda board: board.is_full,
+        "is_draw": lambda board: board.is_draw,
+        "is_move_valid": lambda board: lambda: board.is_move_valid(MoveType.BG),
+        "get": lambda board: lambda: board.get(MoveType.MM),
+        "set_move": lambda board: lambda: board.set_move(MoveType.BG, Symbol.X),
+        "push + pop": lambda board: lambda: (board.push(MoveType.BG, Symbol.X), board.pop()),
+        "copy": lambda board: board.copy,
+    }
+
+    print(f"{'operation':<15}{'Board':>12}{'BitBoard':>12}{'speedup':>10}")
+    for name, bind in operations.items():
+        list_time = time_per_call(bind(setup(Board)))
+        bit_time = time_per_call(bind(setup(BitBoard)))
+        print(
+            f"{name:<15}{format_latency(list_time):>12}{format_latency(bit_time):>12}"
+            f"{list_time / bit_time:>9.1f}x"
+        )
+
+    board = setup(Board)
+    print(f"{'deepcopy':<15}{format_latency(time_per_call(lambda: copy.deepcopy(board), number=1_000)):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Environment steps per second: make_vec_env(TicTacToeEnv) against the NumPy
+TicTacToeVecEnv, with a random opponent and with a PPO checkpoint opponent.
+
+Run from the repository root:
+    python -m benchmarks.bench_env
+"""
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from stable_baselines3.common.env_util import make_vec_env
+
+from tictactoe.training.env import TicTacToeEnv
+from tictactoe.training.opponent_pool import OpponentPool
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+DURATION_SECONDS = 2.0
+
+
+def steps_per_second(env, duration: float = DURATION_SECONDS) -> float:
+    rng = np.random.default_rng(0)
+    env.reset()
+    steps = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        env.step(rng.integers(9, size=env.num_envs))
+        steps += env.num_envs
+    return steps / (time.perf_counter() - start_time)
+
+
+def main():
+    random_dir = tempfile.mkdtemp()
+    checkpoint_dir = tempfile.mkdtemp()
+    shutil.copy("models/ppo_tictactoe_hard.zip", f"{checkpoint_dir}/ppo_tictactoe_batch_1.zip")
+
+    try:
+        for opponent, models_dir in (("random", random_dir), ("PPO checkpoint", checkpoint_dir)):
+            pool = OpponentPool(models_dir=models_dir)
+            print(f"Opponent: {opponent}")
+            dummy = make_vec_env(TicTacToeEnv, n_envs=4, env_kwargs={"opponent_pool": pool})
+            print(f"  {'make_vec_env(TicTacToeEnv, 4)':<32}{steps_per_second(dummy):>12,.0f} steps/sec")
+            for num_envs in (4, 256, 4096):
+                env = TicTacToeVecEnv(num_envs, opponent_pool=pool)
+                print(f"  {f'TicTacToeVecEnv({num_envs})':<32}{steps_per_second(env):>12,.0f} steps/sec")
+    finally:
+        shutil.rmtree(random_dir)
+        shutil.rmtree(checkpoint_dir)
+
+
+if __name__ == "__main__":
+    main()
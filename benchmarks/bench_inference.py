@@ -0,0 +1,52 @@
+"""
+ReinforcementAgent inference latency: stable_baselines3 predict against the
+NumPy backend, plus a check that both pick the same deterministic action on
+every reachable position.
+
+Run from the repository root (after `python export_policy.py`):
+    python -m benchmarks.bench_inference
+"""
+import numpy as np
+
+from benchmarks.common import format_latency, time_per_call
+from tictactoe.agents_collection.reinforcement_agent import ModelDifficulty
+from tictactoe.model_registry import registry
+from tictactoe.solver import iter_positions, terminal_value
+
+BATCH_SIZE = 1024
+
+
+def main():
+    positions = np.array(
+        [cells for cells in iter_positions() if terminal_value(cells) is None], dtype=np.int8
+    )
+    single = positions[:1]
+    batch = positions[np.arange(BATCH_SIZE) % len(positions)]
+
+    for difficulty in ModelDifficulty:
+        sb3_model = registry.get(f"models/{difficulty.value}.zip")
+        numpy_model = registry.get(f"models/{difficulty.value}.npz")
+
+        sb3_actions, _ = sb3_model.predict(positions, deterministic=True)
+        numpy_actions, _ = numpy_model.predict(positions, deterministic=True)
+        agreement = np.mean(sb3_actions == numpy_actions)
+
+        sb3_single = time_per_call(lambda: sb3_model.predict(single, deterministic=True), number=1000)
+        numpy_single = time_per_call(lambda: numpy_model.predict(single, deterministic=True), number=1000)
+        sb3_batch = time_per_call(lambda: sb3_model.predict(batch, deterministic=True), number=100)
+        numpy_batch = time_per_call(lambda: numpy_model.predict(batch, deterministic=True), number=100)
+
+        print(f"{difficulty.name}: same action on {agreement:.2%} of {len(positions)} positions")
+        print(f"  {'':<18}{'SB3':>12}{'NumPy':>12}{'speedup':>10}")
+        print(
+            f"  {'(1, 9)':<18}{format_latency(sb3_single):>12}{format_latency(numpy_single):>12}"
+            f"{sb3_single / numpy_single:>9.1f}x"
+        )
+        print(
+            f"  {f'({BATCH_SIZE}, 9)':<18}{format_latency(sb3_batch):>12}{format_latency(numpy_batch):>12}"
+            f"{sb3_batch / numpy_batch:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Games/sec of many concurrent ReinforcementAgent games played in threads,
+each agent predicting on its own against all of them sharing an
+InferenceService that batches their forward passes.
+
+Run from the repository root:
+    python -m benchmarks.bench_inference_service
+"""
+import random
+import threading
+import time
+
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ReinforcementAgent
+from tictactoe.board import Board
+from tictactoe.game import Game
+from tictactoe.inference_service import InferenceService
+
+NUM_THREADS = 32
+GAMES_PER_THREAD = 50
+
+
+def games_per_sec(make_agent) -> float:
+    def play(seed: int):
+        opponent = RandomAgent()
+        opponent.seed(seed)
+        game = Game(Board(), make_agent(), opponent, rng=random.Random(seed))
+        for _ in range(GAMES_PER_THREAD):
+            game.play()
+            game.board.reset()
+            game.player_manager.reset()
+
+    threads = [threading.Thread(target=play, args=(seed,)) for seed in range(NUM_THREADS)]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return NUM_THREADS * GAMES_PER_THREAD / (time.perf_counter() - start_time)
+
+
+def main():
+    for backend in InferenceBackend:
+        direct = games_per_sec(lambda: ReinforcementAgent(backend=backend))
+        with InferenceService(ReinforcementAgent(backend=backend)) as service:
+            batched = games_per_sec(lambda: ReinforcementAgent(backend=backend, inference_service=service))
+        print(f"{backend.name}: {NUM_THREADS} threads, {direct:,.0f} games/sec direct, "
+              f"{batched:,.0f} games/sec batched ({batched / direct:.1f}x)")
+        print(service.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Legal move generation inside RandomAgent.choose_move: the previous list
+comprehension (MoveType list rebuilt per call, full-board scans for each
+candidate) against the precomputed move tables and the Board's empty-square mask.
+
+Run from the repository root:
+    python -m benchmarks.bench_moves
+"""
+from benchmarks.bench_board import setup
+from benchmarks.common import format_latency, time_per_call
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.board import Board, Symbol
+from tictactoe.move import MoveType
+
+
+class ListScanRandomAgent(RandomAgent):
+    """RandomAgent with the move generation of the list-based implementation."""
+
+    def get_valid_moves(self, board):
+        return [
+            move
+            for move in list(MoveType)
+            if not all(cell != Symbol.EMPTY for row in board.get_board() for cell in row)
+            and move in list(MoveType)
+            and board.get(move) == Symbol.EMPTY
+        ]
+
+
+def main():
+    boards = {"empty board": Board(), "mid-game board": setup(Board)}
+    scan_agent, table_agent = ListScanRandomAgent(), RandomAgent()
+
+    print(f"{'RandomAgent.choose_move':<28}{'list scan':>12}{'move table':>12}{'speedup':>10}")
+    for name, board in boards.items():
+        scan_time = time_per_call(lambda: scan_agent.choose_move(board))
+        table_time = time_per_call(lambda: table_agent.choose_move(board))
+        print(
+            f"{name:<28}{format_latency(scan_time):>12}{format_latency(table_time):>12}"
+            f"{scan_time / table_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
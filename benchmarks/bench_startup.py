@@ -0,0 +1,50 @@
+"""
+Cold-start cost of importing config.py, with lazy model loading against
+loading the three ReinforcementAgent models up front (the previous behavior).
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import subprocess
+import sys
+import time
+
+SNIPPETS = {
+    "import config (lazy)": "import config",
+    "import config + load all models": (
+        "import config\n"
+        "for agent in (config.REINFORCEMENT_AGENT_EASY, config.REINFORCEMENT_AGENT_MEDIUM,"
+        " config.REINFORCEMENT_AGENT_HARD):\n"
+        "    agent.model"
+    ),
+    "import config + one RL move": (
+        "import config\n"
+        "from tictactoe.board import Board\n"
+        "config.REINFORCEMENT_AGENT_HARD.choose_move(Board())"
+    ),
+}
+
+CHECK_SNIPPET = "import sys, config; print('stable_baselines3' in sys.modules, 'torch' in sys.modules)"
+
+
+def run(code: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True, capture_output=True)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def main(repeat: int = 3):
+    for name, code in SNIPPETS.items():
+        print(f"{name:<35}{run(code, repeat):8.2f} s")
+
+    output = subprocess.run(
+        [sys.executable, "-c", CHECK_SNIPPET], check=True, capture_output=True, text=True
+    ).stdout.split()
+    print(f"After 'import config': stable_baselines3 imported={output[0]}, torch imported={output[1]}")
+
+
+if __name__ == "__main__":
+    main()
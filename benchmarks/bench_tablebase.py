@@ -0,0 +1,33 @@
+"""
+Minimax table (dict of canonical positions read into each process) against
+the memory-mapped tablebase: load time and MinimaxAgent.choose_move latency.
+
+Run from the repository root (after `python build_tablebase.py`):
+    python -m benchmarks.bench_tablebase
+"""
+from benchmarks.bench_board import setup
+from benchmarks.common import format_latency, time_per_call
+from tictactoe.agents_collection.minimax_agent import TABLE_PATH, MinimaxAgent
+from tictactoe.board import Board
+from tictactoe.solver import load_table
+from tictactoe.tablebase import TABLEBASE_PATH, Tablebase
+
+
+def main():
+    load = time_per_call(lambda: load_table(TABLE_PATH), number=20)
+    open_mmap = time_per_call(lambda: Tablebase(TABLEBASE_PATH).close(), number=1000)
+    print(f"{'':<24}{'table':>12}{'tablebase':>12}{'speedup':>9}")
+    print(f"{'load / open':<24}{format_latency(load):>12}{format_latency(open_mmap):>12}{load / open_mmap:>9.1f}x")
+
+    board = setup(Board)
+    table_agent, tablebase_agent = MinimaxAgent(), MinimaxAgent(tablebase_path=TABLEBASE_PATH)
+    table_move = time_per_call(lambda: table_agent.choose_move(board))
+    tablebase_move = time_per_call(lambda: tablebase_agent.choose_move(board))
+    print(
+        f"{'choose_move':<24}{format_latency(table_move):>12}{format_latency(tablebase_move):>12}"
+        f"{table_move / tablebase_move:>9.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
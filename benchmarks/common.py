@@ -0,0 +1,24 @@
+import timeit
+
+from typing import Callable
+
+
+def time_per_call(fn: Callable[[], object], number: int = 10_000, repeat: int = 5) -> float:
+    """
+    Time a callable with timeit.
+    Args:
+        fn (Callable): Function called without arguments
+        number (int): Calls per measurement
+        repeat (int): Number of measurements, the fastest one is kept
+    Returns:
+        float: Seconds per call
+    """
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def format_latency(seconds: float) -> str:
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:8.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.2f} us"
+    return f"{seconds * 1e3:8.2f} ms"
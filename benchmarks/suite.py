@@ -0,0 +1,210 @@
+"""
+Benchmark suite: board operations, agent decisions, full games and training
+environment steps, with fixed seeds. Results can be saved as a baseline and
+later runs compared against it, failing when a metric regresses.
+
+Run from the repository root:
+    python -m benchmarks.suite                        # Print the results
+    python -m benchmarks.suite --save                 # Update benchmarks/baseline.json
+    python -m benchmarks.suite --compare              # Exit with 1 on a >20% regression
+    python -m benchmarks.suite --compare --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from benchmarks.bench_board import setup
+from benchmarks.common import format_latency, time_per_call
+from tictactoe.board import Board
+from tictactoe.move import MoveType
+
+BASELINE_PATH = "benchmarks/baseline.json"
+DEFAULT_THRESHOLD = 0.2
+SEED = 0
+
+
+@dataclass
+class Metric:
+    value: float
+    unit: str  # "s" (latency per call) or "1/s" (throughput)
+
+    @property
+    def higher_is_better(self) -> bool:
+        return self.unit == "1/s"
+
+    def format(self) -> str:
+        if self.unit == "s":
+            return format_latency(self.value)
+        return f"{self.value:>12,.0f}/s"
+
+
+def latency(fn: Callable[[], object], number: int = 50_000) -> Metric:
+    # More repeats than the micro-benchmarks: the fastest run is compared against the baseline
+    return Metric(time_per_call(fn, number=number, repeat=9), "s")
+
+
+def throughput(run: Callable[[], int], repeat: int = 3) -> Metric:
+    """Best rate over `repeat` runs, `run` returning the number of units it processed."""
+    best = 0.0
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        count = run()
+        best = max(best, count / (time.perf_counter() - start_time))
+    return Metric(best, "1/s")
+
+
+def bench_board() -> Dict[str, Metric]:
+    board = setup(Board)
+    return {
+        "board.has_winner": latency(board.has_winner),
+        "board.is_full": latency(board.is_full),
+        "board.is_move_valid": latency(lambda: board.is_move_valid(MoveType.BG)),
+        "move.all_moves": latency(MoveType.all_moves),
+    }
+
+
+def bench_agents() -> Dict[str, Metric]:
+    from tictactoe.agents_collection.random_agent import RandomAgent
+    from tictactoe.agents_collection.reinforcement_agent import ReinforcementAgent
+    from tictactoe.board import Symbol
+
+    board = setup(Board)
+    random_agent = RandomAgent()
+    random_agent.seed(SEED)
+    reinforcement_agent = ReinforcementAgent()
+    reinforcement_agent.seed(SEED)
+    reinforcement_agent.symbol = Symbol.X
+    reinforcement_agent.choose_move(board)  # Load the model outside of the measure
+    return {
+        "agent.get_valid_moves": latency(lambda: random_agent.get_valid_moves(board)),
+        "random_agent.choose_move": latency(lambda: random_agent.choose_move(board)),
+        "reinforcement_agent.choose_move": latency(lambda: reinforcement_agent.choose_move(board), number=500),
+    }
+
+
+def bench_game(num_games: int = 2_000) -> Dict[str, Metric]:
+    from tictactoe.agents_collection.random_agent import RandomAgent
+    from tictactoe.game import Game
+
+    def run():
+        player_a, player_b = RandomAgent(), RandomAgent()
+        player_a.seed(SEED)
+        player_b.seed(SEED + 1)
+        game = Game(Board(), player_a, player_b, rng=random.Random(SEED))
+        for _ in range(num_games):
+            game.play()
+            game.board.reset()
+            game.player_manager.reset()
+        return num_games
+
+    return {"game.play": throughput(run)}
+
+
+def bench_env(num_steps: int = 20_000) -> Dict[str, Metric]:
+    from tictactoe.training.env import TicTacToeEnv
+    from tictactoe.training.opponent_pool import OpponentPool
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        # No checkpoint: the opponent plays randomly
+        env = TicTacToeEnv(opponent_pool=OpponentPool(models_dir=models_dir))
+
+        def run():
+            np.random.seed(SEED)
+            rng = np.random.default_rng(SEED)
+            env.reset(seed=SEED)
+            for _ in range(num_steps):
+                _, _, terminated, truncated, _ = env.step(int(rng.integers(9)))
+                if terminated or truncated:
+                    env.reset()
+            return num_steps
+
+        return {"env.step": throughput(run)}
+
+
+BENCHMARKS = (bench_board, bench_agents, bench_game, bench_env)
+
+
+def run_suite() -> Dict[str, Metric]:
+    metrics = {}
+    for bench in BENCHMARKS:
+        metrics.update(bench())
+    return metrics
+
+
+def compare(baseline: Dict[str, Metric], current: Dict[str, Metric], threshold: float) -> List[str]:
+    """
+    Names of the metrics more than `threshold` (relative) worse than the
+    baseline. Metrics missing from one side are not compared.
+    """
+    regressions = []
+    for name, metric in current.items():
+        reference = baseline.get(name)
+        if reference is None or reference.value <= 0:
+            continue
+        if metric.higher_is_better:
+            change = (reference.value - metric.value) / reference.value
+        else:
+            change = (metric.value - reference.value) / reference.value
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def save_results(metrics: Dict[str, Metric], path: str):
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": {name: asdict(metric) for name, metric in metrics.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Metric]:
+    with open(path) as f:
+        return {name: Metric(**metric) for name, metric in json.load(f)["metrics"].items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baseline.")
+    parser.add_argument("--compare", action="store_true", help="Fail if a metric regressed from the baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Tolerated relative regression.")
+    args = parser.parse_args()
+
+    metrics = run_suite()
+    baseline = load_results(args.baseline) if args.compare else {}
+
+    header = f"{'benchmark':<34}{'result':>16}"
+    print(header + f"{'baseline':>16}{'change':>9}" if baseline else header)
+    for name, metric in metrics.items():
+        line = f"{name:<34}{metric.format():>16}"
+        if name in baseline:
+            reference = baseline[name]
+            line += f"{reference.format():>16}{metric.value / reference.value - 1:>+9.1%}"
+        print(line)
+
+    if args.save:
+        save_results(metrics, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    if args.compare:
+        regressions = compare(baseline, metrics, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"No regression beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
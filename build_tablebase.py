@@ -0,0 +1,15 @@
+import argparse
+import time
+
+from tictactoe.tablebase import TABLEBASE_PATH, build_tablebase
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Solve every reachable position into a memory-mappable tablebase (value, best moves, depth)."
+    )
+    parser.add_argument("--output", default=TABLEBASE_PATH)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    positions = build_tablebase(args.output)
+    print(f"Solved {positions} positions into {args.output} in {time.perf_counter() - start_time:.2f}s")
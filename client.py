@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+
+from tictactoe.client import play_interactive, run_loadgen
+from tictactoe.server import DEFAULT_HOST, DEFAULT_PORT
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play against a server.py agent, or load test the server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--agent", default="MINIMAX_AGENT", help="Name of the agent in config.py.")
+    parser.add_argument("--symbol", choices=("X", "O"), help="Symbol of the client (random by default).")
+    parser.add_argument(
+        "--loadgen",
+        action="store_true",
+        help="Play scripted random matches and report matches/sec and move round-trip latencies.",
+    )
+    parser.add_argument("--matches", type=int, default=10_000, help="Matches played by --loadgen.")
+    parser.add_argument("--concurrency", type=int, default=1000, help="Connections open at once with --loadgen.")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.loadgen:
+        stats = asyncio.run(
+            run_loadgen(args.agent, args.matches, args.concurrency, args.host, args.port, args.seed)
+        )
+        print(stats.report())
+    else:
+        asyncio.run(play_interactive(args.agent, args.symbol, args.host, args.port))
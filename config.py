@@ -2,15 +2,20 @@ from dataclasses import dataclass
 
 from tictactoe.player import Player, HumanPlayer
 
+from tictactoe.agents_collection.mcts_agent import MCTSAgent
+from tictactoe.agents_collection.minimax_agent import MinimaxAgent
 from tictactoe.agents_collection.random_agent import RandomAgent
-from tictactoe.agents_collection.reinforcement_agent import ReinforcementAgent, ModelDifficulty
+from tictactoe.agents_collection.reinforcement_agent import ReinforcementAgent, ModelDifficulty, InferenceBackend
 
 HUMAN_ONE = HumanPlayer(name="Player A")
 HUMAN_TWO = HumanPlayer(name="Player B")
 RANDOM_AGENT = RandomAgent()
+MINIMAX_AGENT = MinimaxAgent()
+MCTS_AGENT = MCTSAgent(iterations=1000)
 REINFORCEMENT_AGENT_EASY = ReinforcementAgent(model_difficulty=ModelDifficulty.EASY)
 REINFORCEMENT_AGENT_MEDIUM = ReinforcementAgent(model_difficulty=ModelDifficulty.MEDIUM)
 REINFORCEMENT_AGENT_HARD = ReinforcementAgent(model_difficulty=ModelDifficulty.HARD)
+REINFORCEMENT_AGENT_TABULAR = ReinforcementAgent(backend=InferenceBackend.TABULAR)
 
 @dataclass(frozen=True)
 class Config:
@@ -18,5 +23,6 @@ class Config:
     Configuration for the game.
     """
     NUM_GAMES: int = 1000
+    SEED: int = 42
     PLAYER_A: Player = RANDOM_AGENT
     PLAYER_B: Player = REINFORCEMENT_AGENT_HARD
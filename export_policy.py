@@ -0,0 +1,22 @@
+import argparse
+import os
+
+from tictactoe.agents_collection.reinforcement_agent import ModelDifficulty
+from tictactoe.numpy_policy import export_policy
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export the policy network of PPO zip files to NumPy weights files (.npz)."
+    )
+    parser.add_argument(
+        "models",
+        nargs="*",
+        default=[f"models/{difficulty.value}.zip" for difficulty in ModelDifficulty],
+        help="PPO zip files to export (default: every ModelDifficulty model).",
+    )
+    args = parser.parse_args()
+
+    for model_path in args.models:
+        output_path = os.path.splitext(model_path)[0] + ".npz"
+        export_policy(model_path, output_path)
+        print(f"Exported {model_path} -> {output_path}")
@@ -0,0 +1,30 @@
+import argparse
+import itertools
+
+from tictactoe.game import Game
+from tictactoe.game_record import opening_stats, read_records
+from tictactoe.move import MoveType
+
+MOVE_NAMES = {move.square: move.name for move in MoveType}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a game log written by main.py --record.")
+    parser.add_argument("path")
+    parser.add_argument("--show", type=int, default=0, help="Also print the first N games.")
+    args = parser.parse_args()
+
+    for i, record in enumerate(itertools.islice(read_records(args.path), args.show)):
+        moves = " ".join(MOVE_NAMES[square] for square in record.moves)
+        latency = sum(record.latencies) / len(record.latencies) * 1e6
+        print(f"#{i}: player A {record.player_a_symbol.value}, {moves} -> {record.winner.value} ({latency:.0f}us/move)")
+
+    print("Results of player A by symbol and opening:")
+    stats = opening_stats(read_records(args.path))
+    for (symbol, square), results in sorted(stats.items(), key=lambda item: (item[0][0].value, item[0][1])):
+        games = sum(results.values())
+        print(
+            f"{symbol.value} {MOVE_NAMES[square]}: {games} games, "
+            f"won {results[Game.Winner.PLAYER_A] / games:.1%}, "
+            f"draw {results[Game.Winner.DRAW] / games:.1%}, "
+            f"lost {results[Game.Winner.PLAYER_B] / games:.1%}"
+        )
@@ -0,0 +1,23 @@
+import argparse
+import time
+
+from tictactoe.league import CACHE_PATH, MODELS_DIR, League, discover_agents
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Round-robin league between every agent and model checkpoint, with Elo ratings."
+    )
+    parser.add_argument("--games", type=int, default=1000, help="Games per pairing and symbol assignment.")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    parser.add_argument("--cache", default=CACHE_PATH, help="JSON file caching the pairing results.")
+    args = parser.parse_args()
+
+    league = League(discover_agents(args.models_dir), args.games, args.seed, args.cache)
+    start_time = time.perf_counter()
+    league.run(args.workers)
+    elapsed = time.perf_counter() - start_time
+
+    print(league.report())
+    print(f"\nPlayed {league.games_played} new games in {elapsed:.2f}s")
@@ -1,75 +1,103 @@
-from enum import Enum
+import argparse
+import time
 
 from config import Config
 
+from tictactoe.batch_game import BatchGame
 from tictactoe.board import Board
-from tictactoe.player import Player, PlayerType
-from tictactoe.player_manager import PlayerManager
+from tictactoe.game import Game
+from tictactoe.game_record import GameRecorder
+from tictactoe.instrumentation import Instrumentation
+from tictactoe.tournament import run_tournament
 
-class Game:
-    class Winner(Enum):
-        DRAW = "draw"
-        PLAYER_A = "playerA"
-        PLAYER_B = "playerB"
 
-    def __init__(self, board: Board, playerA: Player, playerB: Player):
-        self.board = board
-        self.playerA = playerA
-        self.playerB = playerB
-        self.player_manager = PlayerManager(playerA, playerB)
-        
-        if playerA.player_type == PlayerType.HUMAN or playerB.player_type == PlayerType.HUMAN:
-            self.show_board = True
-        else:
-            self.show_board = False
-
-    def play(self) -> Winner:
-        """
-        Play a game between two players.
-        Returns:
-            EndGame: The result of the game from the perspective of the first player.
-        """
-        # Running a game until a win or all moves played
-        while True:
-            player = self.player_manager.current_player
-            print(f"{player} turn (symbol: {player.symbol}):") if self.show_board else None
-            
-            move = player.choose_move(self.board)
-            self.board.set_move(move, player.symbol)
-            
-            print(self.board) if self.show_board else None
-
-            is_won, winner_symbol = self.board.has_winner()
-            if is_won:
-                winner = self.player_manager.get_player_from_symbol(winner_symbol)
-                print(f"{winner} won!") if self.show_board else None
-                return Game.Winner.PLAYER_A if winner == self.playerA else Game.Winner.PLAYER_B
-
-            if self.board.is_full():
-                print("It's a draw!") if self.show_board else None
-                return Game.Winner.DRAW
-            self.player_manager.switch_player()
-
-
-if __name__ == "__main__":
-    game = Game(Board(), Config.PLAYER_A, Config.PLAYER_B)
-    
-    stats = {
-        Game.Winner.DRAW: 0,
-        Game.Winner.PLAYER_A: 0,
-        Game.Winner.PLAYER_B: 0,
-    }
-    
-    for _ in range(Config.NUM_GAMES):
-        result = game.play()
-        stats[result] += 1
-        game.board.reset()
-        game.player_manager.reset()
-        
-    
+def print_stats(stats, num_games):
     print("Game stats:")
     print(f"{str(Config.PLAYER_A)} vs {str(Config.PLAYER_B)}")
-    print(f"Number of games: {Config.NUM_GAMES}")
+    print(f"Number of games: {num_games}")
     print(f"Draw: {stats[Game.Winner.DRAW]}")
     print(f"{str(Config.PLAYER_A)} wins: {stats[Game.Winner.PLAYER_A]}")
     print(f"{str(Config.PLAYER_B)} wins: {stats[Game.Winner.PLAYER_B]}")
+    for player in (Config.PLAYER_A, Config.PLAYER_B):
+        policy_cache = getattr(player, "policy_cache", None)
+        if policy_cache is not None:
+            print(f"{str(player)} policy cache: {policy_cache.hit_rate:.1%} hit rate ({len(policy_cache)} positions)")
+        iterations_per_sec = getattr(player, "iterations_per_sec", None)
+        if iterations_per_sec:
+            print(f"{str(player)} search: {iterations_per_sec:,.0f} iterations/sec")
+        fallback_moves = getattr(player, "fallback_moves", None)
+        if fallback_moves:
+            print(f"{str(player)} illegal predictions replaced by random moves: {fallback_moves}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Tic-Tac-Toe games between the players of config.py.")
+    parser.add_argument("--num-games", type=int, default=Config.NUM_GAMES)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Play all games at once with the vectorized simulator (agents only).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Shard the games over this many processes (tournament mode, agents only).",
+    )
+    parser.add_argument("--seed", type=int, default=Config.SEED, help="Master seed of the tournament mode.")
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="Append every game (moves, symbols, result, decision latencies) to this binary log.",
+    )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="Measure decision latencies, board operations and games/sec.",
+    )
+    parser.add_argument("--metrics-json", metavar="PATH", help="Save the --instrument metrics to a JSON file.")
+    args = parser.parse_args()
+    args.instrument = args.instrument or args.metrics_json is not None
+
+    if (args.record or args.instrument) and (args.batch or args.workers > 0):
+        parser.error("--record and --instrument are only available for sequential games.")
+
+    if args.batch:
+        start_time = time.perf_counter()
+        stats = BatchGame(Config.PLAYER_A, Config.PLAYER_B).play(args.num_games)
+        elapsed = time.perf_counter() - start_time
+        print_stats(stats, args.num_games)
+        print(f"Simulated in {elapsed:.2f}s ({args.num_games / elapsed:,.0f} games/sec)")
+    elif args.workers > 0:
+        stats, games_per_sec = run_tournament(
+            Config.PLAYER_A, Config.PLAYER_B, args.num_games, args.workers, args.seed
+        )
+        print_stats(stats, args.num_games)
+        print(f"Played with {args.workers} workers ({games_per_sec:,.0f} games/sec)")
+    else:
+        recorder = GameRecorder(args.record) if args.record else None
+        instrumentation = Instrumentation() if args.instrument else None
+        game = Game(
+            Board(), Config.PLAYER_A, Config.PLAYER_B, recorder=recorder, instrumentation=instrumentation
+        )
+
+        stats = {
+            Game.Winner.DRAW: 0,
+            Game.Winner.PLAYER_A: 0,
+            Game.Winner.PLAYER_B: 0,
+        }
+
+        for _ in range(args.num_games):
+            result = game.play()
+            stats[result] += 1
+            game.board.reset()
+            game.player_manager.reset()
+
+        print_stats(stats, args.num_games)
+        if instrumentation is not None:
+            print(instrumentation.report())
+            if args.metrics_json:
+                instrumentation.save_json(args.metrics_json)
+        if recorder is not None:
+            recorder.close()
+            print(f"Recorded {recorder.games} games in {recorder.path}")
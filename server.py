@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+
+import config
+
+from tictactoe.agent import Agent
+from tictactoe.server import DEFAULT_HOST, DEFAULT_PORT, GameServer
+
+# Every agent of config.py, by its name there (e.g. MINIMAX_AGENT)
+AGENTS = {name: value for name, value in vars(config).items() if isinstance(value, Agent)}
+
+
+async def main(args):
+    server = GameServer(AGENTS, max_workers=args.workers, seed=args.seed, batch_inference=args.batch_inference)
+    port = await server.start(args.host, args.port)
+    print(f"Serving {', '.join(AGENTS)} on {args.host}:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host concurrent matches against the agents of config.py.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="Threads computing the agent moves.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random symbol assignment.")
+    parser.add_argument(
+        "--batch-inference",
+        action="store_true",
+        help="Batch the model predictions of concurrent ReinforcementAgent matches.",
+    )
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.batch_game import BatchGame
+from tictactoe.cells import O_CELL, X_CELL, board_to_cells, cells_to_board, winning_boards
+from tictactoe.game import Game
+from tictactoe.move import MoveType
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        MoveType.H_row(), MoveType.M_row(), MoveType.B_row(),
+        MoveType.G_col(), MoveType.M_col(), MoveType.D_col(),
+        MoveType.H_diag(), MoveType.D_diag(),
+    ],
+)
+def test_winning_boards(line):
+    """Test that every line is detected as a win for its owner only."""
+    boards = np.zeros((1, 9), dtype=np.int8)
+    for move in line:
+        boards[0, move.square] = X_CELL
+    assert winning_boards(boards, X_CELL)[0]
+    assert not winning_boards(boards, O_CELL)[0]
+
+
+def test_cells_round_trip():
+    """Test that a board survives the conversion to cells and back."""
+    cells = np.array([1, 0, -1, 0, 1, 0, -1, 0, 0], dtype=np.int8)
+    assert (board_to_cells(cells_to_board(cells)) == cells).all()
+
+
+def test_random_games():
+    """Test that every simulated game ends with exactly one result."""
+    stats = BatchGame(RandomAgent(), RandomAgent()).play(10_000)
+    assert sum(stats.values()) == 10_000
+    # X wins about 58% of random games, O about 29%
+    assert stats[Game.Winner.DRAW] < stats[Game.Winner.PLAYER_A] + stats[Game.Winner.PLAYER_B]
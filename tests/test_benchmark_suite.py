@@ -0,0 +1,33 @@
+from benchmarks.suite import Metric, compare, load_results, save_results
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Test that slower latencies and lower throughputs beyond the threshold are reported."""
+    baseline = {
+        "latency": Metric(1.0e-6, "s"),
+        "throughput": Metric(1000.0, "1/s"),
+        "stable": Metric(2.0e-6, "s"),
+    }
+    current = {
+        "latency": Metric(1.3e-6, "s"),
+        "throughput": Metric(700.0, "1/s"),
+        "stable": Metric(2.2e-6, "s"),
+        "new": Metric(1.0, "s"),
+    }
+    assert compare(baseline, current, threshold=0.2) == ["latency", "throughput"]
+    assert compare(baseline, current, threshold=0.5) == []
+
+
+def test_improvements_are_not_regressions():
+    """Test that faster results never fail the comparison."""
+    baseline = {"latency": Metric(1.0e-6, "s"), "throughput": Metric(1000.0, "1/s")}
+    current = {"latency": Metric(0.5e-6, "s"), "throughput": Metric(2000.0, "1/s")}
+    assert compare(baseline, current, threshold=0.0) == []
+
+
+def test_results_round_trip(tmp_path):
+    """Test that saved results load back as the same metrics."""
+    metrics = {"game.play": Metric(1234.5, "1/s")}
+    path = tmp_path / "baseline.json"
+    save_results(metrics, path)
+    assert load_results(path) == metrics
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from tictactoe.bitboard import BitBoard
+from tictactoe.board import Board, Symbol
+from tictactoe.move import MoveType
+
+
+@pytest.fixture
+def board():
+    """Fixture to provide a fresh bitboard instance for each test."""
+    return BitBoard()
+
+
+@pytest.mark.parametrize("move", MoveType.all_moves())
+@pytest.mark.parametrize("symbol", [Symbol.X, Symbol.O])
+def test_play_move(board, move, symbol):
+    """Test that playing any move sets the expected symbol and invalidates the move."""
+    assert board.is_move_valid(move)
+    board.set_move(move, symbol)
+    assert board.get(move) == symbol
+    assert not board.is_move_valid(move)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        MoveType.H_row(), MoveType.M_row(), MoveType.B_row(),
+        MoveType.G_col(), MoveType.M_col(), MoveType.D_col(),
+        MoveType.H_diag(), MoveType.D_diag(),
+    ],
+)
+@pytest.mark.parametrize("symbol", [Symbol.X, Symbol.O])
+def test_lines_win(board, line, symbol):
+    """Test that every winning line is detected with the right winner."""
+    for move in line:
+        board.set_move(move, symbol)
+    assert board.has_winner() == (True, symbol)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_list_board(seed):
+    """Test that random games give the same state on both board engines."""
+    rng = random.Random(seed)
+    board, bitboard = Board(), BitBoard()
+    symbol = Symbol.X
+    moves = list(MoveType.all_moves())
+    rng.shuffle(moves)
+    for move in moves:
+        board.set_move(move, symbol)
+        bitboard.set_move(move, symbol)
+        assert bitboard.get_board() == board.get_board()
+        assert bitboard.has_winner() == board.has_winner()
+        assert bitboard.is_full() == board.is_full()
+        assert bitboard.is_draw() == board.is_draw()
+        if board.has_winner()[0]:
+            break
+        symbol = Symbol.O if symbol == Symbol.X else Symbol.X
+
+
+def test_reset(board):
+    """Test that reset empties the board."""
+    board.set_move(MoveType.MM, Symbol.X)
+    board.reset()
+    assert all(board.is_move_valid(move) for move in MoveType.all_moves())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_zobrist_key_as_list_board(seed):
+    """Test that both engines hash positions identically through pushes, pops and copies."""
+    rng = random.Random(seed)
+    board, bitboard = Board(), BitBoard()
+    for _ in range(50):
+        if board.move_stack and rng.random() < 0.4:
+            assert bitboard.pop() == board.pop()
+        elif board.legal_moves():
+            move = rng.choice(board.legal_moves())
+            symbol = rng.choice([Symbol.X, Symbol.O])
+            board.push(move, symbol)
+            bitboard.push(move, symbol)
+        assert bitboard.zobrist_key == board.zobrist_key
+    assert bitboard.copy().zobrist_key == board.copy().zobrist_key
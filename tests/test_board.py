@@ -1,7 +1,9 @@
+import random
+
 import pytest
 
 from tictactoe.board import Board, Symbol
-from tictactoe.move import MoveType
+from tictactoe.move import WIN_LINE_MOVES, MoveType
 
 
 @pytest.fixture
@@ -58,3 +60,79 @@ def test_diagonals_win(board, moves, symbol):
         board.set_move(move, symbol)
     won, _ = board.has_winner()
     assert won, "Winning condition for diagonals not detected."
+
+
+def scan_winner(board):
+    """Winner found by checking every line of the board from scratch."""
+    cells = board.get_board()
+    lines = [[cells[i][j] for i, j in (move.value for move in line)] for line in WIN_LINE_MOVES]
+    for line in lines:
+        if line[0] != Symbol.EMPTY and line[0] == line[1] == line[2]:
+            return True, line[0]
+    return False, Symbol.EMPTY
+
+
+def test_incremental_winner_matches_full_scan(board):
+    """Test that the line counts agree with a full scan over random moves, overwrites and undos."""
+    rng = random.Random(0)
+    for _ in range(2000):
+        move = rng.choice(MoveType.all_moves())
+        action = rng.random()
+        if action < 0.6:
+            board.set_move(move, rng.choice([Symbol.X, Symbol.O]))
+        elif action < 0.95:
+            board.undo_move(move)
+        else:
+            board.reset()
+        assert board.has_winner() == scan_winner(board)
+
+
+def test_undo_move_restores_position(board):
+    """Test that undoing a winning move removes the win and frees the square."""
+    for move in MoveType.H_row()[:2]:
+        board.set_move(move, Symbol.X)
+    board.set_move(MoveType.HD, Symbol.X)
+    assert board.has_winner() == (True, Symbol.X)
+    board.undo_move(MoveType.HD)
+    assert board.has_winner() == (False, Symbol.EMPTY)
+    assert board.is_move_valid(MoveType.HD)
+    assert board.get(MoveType.HD) == Symbol.EMPTY
+
+
+def test_push_pop_restores_position(board):
+    """Test that popping every pushed move gives back the empty board and its hash."""
+    moves = [MoveType.MM, MoveType.HG, MoveType.BD, MoveType.HD, MoveType.BG]
+    for i, move in enumerate(moves):
+        board.push(move, Symbol.X if i % 2 == 0 else Symbol.O)
+    assert board.has_winner() == (False, Symbol.EMPTY)
+    for move in reversed(moves):
+        assert board.pop() == move
+    assert board.zobrist_key == Board().zobrist_key
+    assert board.legal_moves() == MoveType.all_moves()
+
+
+def test_zobrist_key_identifies_positions(board):
+    """Test that transpositions share a key and different positions do not."""
+    other = Board()
+    board.push(MoveType.MM, Symbol.X)
+    board.push(MoveType.HG, Symbol.O)
+    board.push(MoveType.BD, Symbol.X)
+    other.push(MoveType.BD, Symbol.X)
+    other.push(MoveType.HG, Symbol.O)
+    other.push(MoveType.MM, Symbol.X)
+    assert board.zobrist_key == other.zobrist_key
+    other.set_move(MoveType.HG, Symbol.X)
+    assert board.zobrist_key != other.zobrist_key
+
+
+def test_copy_is_independent(board):
+    """Test that a copy keeps the position but not later moves of the original."""
+    board.push(MoveType.HG, Symbol.X)
+    clone = board.copy()
+    board.push(MoveType.HM, Symbol.X)
+    board.push(MoveType.HD, Symbol.X)
+    assert board.has_winner() == (True, Symbol.X)
+    assert clone.has_winner() == (False, Symbol.EMPTY)
+    assert clone.get(MoveType.HM) == Symbol.EMPTY
+    assert clone.pop() == MoveType.HG
+    assert clone.zobrist_key == Board().zobrist_key
@@ -0,0 +1,135 @@
+from concurrent.futures import Future
+
+import pytest
+
+from stable_baselines3 import PPO
+from stable_baselines3.common.callbacks import BaseCallback
+from stable_baselines3.common.logger import configure
+from tensorboard.backend.event_processing.event_accumulator import EventAccumulator
+
+from tictactoe.agent import AgentType
+from tictactoe.league import AgentSpec
+from tictactoe.tabular_policy import TabularPolicy
+from tictactoe.training.callbacks import EvaluationCallback
+from tictactoe.training.evaluation import (
+    PERFECT_REFERENCE,
+    EvaluationResult,
+    ParallelEvaluator,
+    default_references,
+    evaluate_policy,
+)
+from tictactoe.training.masked_policy import MaskedActorCriticPolicy
+from tictactoe.training.opponent_pool import OpponentPool
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+REFERENCES = [AgentSpec("Random", AgentType.RANDOM), AgentSpec(PERFECT_REFERENCE, AgentType.MINIMAX)]
+
+
+def make_model(tmp_path):
+    env = TicTacToeVecEnv(8, opponent_pool=OpponentPool(models_dir=str(tmp_path)))
+    env.seed(0)
+    model = PPO(MaskedActorCriticPolicy, env, n_steps=16, batch_size=64, seed=0)
+    model.set_logger(configure(str(tmp_path / "log"), ["csv"]))
+    return model
+
+
+def test_evaluate_policy_counts_every_game():
+    """Test that a perfect policy never loses and all games are counted, half of them as O."""
+    policy = TabularPolicy.load("models/tabular_tictactoe.npy")
+    perfect = evaluate_policy(policy, REFERENCES[1], num_games=101, seed=0, deterministic=True)
+    assert perfect.games == 101 and perfect.losses == 0
+    assert perfect.draw_rate == 1.0
+    random = evaluate_policy(policy, REFERENCES[0], num_games=200, seed=0, deterministic=False)
+    assert random.losses == 0 and random.win_rate > 0.8
+
+
+def test_default_references():
+    """Test that the references include random, perfect and MCTS play plus the models present."""
+    names = [reference.name for reference in default_references()]
+    assert names[:3] == ["Random", PERFECT_REFERENCE, "MCTS"]
+    assert "RL HARD" in names
+    hard = default_references()[names.index("RL HARD")].build()
+    assert hard.backend.value == ".npz" and hard.model is not None
+    tabular = default_references()[names.index("RL TABULAR")].build()
+    assert tabular.backend.value == ".npy" and tabular.model is not None
+
+
+def test_callback_logs_background_evaluations(tmp_path):
+    """Test that each learn call is evaluated in the background and logged in order."""
+    model = make_model(tmp_path)
+    evaluator = ParallelEvaluator(REFERENCES, num_games=100, num_workers=1)
+    callback = EvaluationCallback(evaluator)
+    try:
+        model.learn(128, callback=callback)
+        model.learn(128, callback=callback, reset_num_timesteps=False)
+        callback.wait()
+    finally:
+        evaluator.close()
+    assert [timesteps for timesteps, _ in callback.history] == [128, 256]
+    for _, results in callback.history:
+        assert set(results) == {"Random", PERFECT_REFERENCE}
+        assert all(result.games == 100 for result in results.values())
+    assert results[PERFECT_REFERENCE].wins == 0
+    log = (tmp_path / "log" / "progress.csv").read_text()
+    assert "eval/Minimax/draw_rate" in log and "eval/Random/win_rate" in log
+    assert not callback.target_reached
+
+
+class ManualEvaluator:
+    """Evaluator whose evaluations finish when `finish` is called."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, policy):
+        future = Future()
+        self.futures.append(future)
+        return {"Random": future}
+
+    def finish(self):
+        for future in self.futures:
+            if not future.done():
+                future.set_result(EvaluationResult(wins=1, draws=2, losses=3))
+
+
+class FinishEvaluationsOnTrainingEnd(BaseCallback):
+    def __init__(self, evaluator: ManualEvaluator):
+        super().__init__()
+        self.evaluator = evaluator
+
+    def _on_training_end(self):
+        self.evaluator.finish()
+
+    def _on_step(self) -> bool:
+        return True
+
+
+def test_evaluation_finished_during_the_last_update_reaches_tensorboard(tmp_path):
+    """Test that results collected at the end of a learn call are written before its logger is replaced."""
+    env = TicTacToeVecEnv(8, opponent_pool=OpponentPool(models_dir=str(tmp_path)))
+    model = PPO(MaskedActorCriticPolicy, env, n_steps=16, batch_size=64, seed=0, tensorboard_log=str(tmp_path))
+    evaluator = ManualEvaluator()
+    # The first evaluation finishes after the last rollout of the second learn call
+    callbacks = [FinishEvaluationsOnTrainingEnd(evaluator), EvaluationCallback(evaluator)]
+    model.learn(128, callback=callbacks)
+    model.learn(128, callback=callbacks, reset_num_timesteps=False)
+
+    draw_rates = []
+    for run in tmp_path.glob("PPO_*"):
+        events = EventAccumulator(str(run))
+        events.Reload()
+        if "eval/Random/draw_rate" in events.Tags()["scalars"]:
+            draw_rates += [event.value for event in events.Scalars("eval/Random/draw_rate")]
+    assert draw_rates == [pytest.approx(2 / 6)]
+
+
+@pytest.mark.parametrize("draw_rate, stops", [(1.0, True), (0.5, False)])
+def test_target_draw_rate_stops_training(tmp_path, draw_rate, stops):
+    """Test that reaching the draw rate against perfect play stops the learn call in progress."""
+    model = make_model(tmp_path)
+    callback = EvaluationCallback(ParallelEvaluator(REFERENCES), target_draw_rate=0.99)
+    callback.init_callback(model)
+    draws = int(draw_rate * 100)
+    callback._log(0, {PERFECT_REFERENCE: EvaluationResult(wins=0, draws=draws, losses=100 - draws)})
+    assert callback.target_reached == stops
+    assert callback.on_step() == (not stops)
@@ -0,0 +1,69 @@
+import pytest
+
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.board import Board, Symbol
+from tictactoe import game_record
+from tictactoe.game import Game
+from tictactoe.game_record import GameRecorder, encode_record, opening_stats, read_records
+from tictactoe.solver import play, winner
+
+
+def test_round_trip(tmp_path):
+    """Test that moves, symbols, result and latencies are read back as written."""
+    path = tmp_path / "games.bin"
+    with GameRecorder(path) as recorder:
+        recorder.record([4, 0, 8, 2, 1, 7, 5], Symbol.X, Game.Winner.PLAYER_B, [1e-5] * 7)
+        recorder.record([0, 3, 1, 4, 2], Symbol.O, Game.Winner.PLAYER_A, [2e-3] * 5)
+    first, second = read_records(path)
+    assert first.moves == (4, 0, 8, 2, 1, 7, 5)
+    assert (first.player_a_symbol, first.winner) == (Symbol.X, Game.Winner.PLAYER_B)
+    assert first.latencies[0] == pytest.approx(1e-5, rel=0.05)
+    assert second.moves == (0, 3, 1, 4, 2)
+    assert (second.player_a_symbol, second.winner) == (Symbol.O, Game.Winner.PLAYER_A)
+    assert second.latencies[0] == pytest.approx(2e-3, rel=0.05)
+
+
+def test_record_size():
+    """Test that a full game takes 15 bytes."""
+    assert len(encode_record(list(range(9)), Symbol.X, Game.Winner.DRAW, [0.0] * 9)) == 15
+
+
+def test_recorded_games_replay(tmp_path, monkeypatch):
+    """Test that every recorded game replays to its recorded result, across read chunks."""
+    monkeypatch.setattr(game_record, "_READ_CHUNK_SIZE", 7)
+    path = tmp_path / "games.bin"
+    results = []
+    with GameRecorder(path, buffer_size=256) as recorder:
+        game = Game(Board(), RandomAgent(), RandomAgent(), recorder=recorder)
+        for _ in range(1000):
+            results.append(game.play())
+            game.board.reset()
+            game.player_manager.reset()
+
+    records = list(read_records(path))
+    assert [record.winner for record in records] == results
+    for record in records:
+        cells, cell = (0,) * 9, 1
+        for square in record.moves:
+            cells, cell = play(cells, square, cell), -cell
+        x_player = Game.Winner.PLAYER_A if record.player_a_symbol == Symbol.X else Game.Winner.PLAYER_B
+        expected = 0 if record.winner == Game.Winner.DRAW else 1 if record.winner == x_player else -1
+        assert winner(cells) == expected
+    assert sum(sum(counter.values()) for counter in opening_stats(records).values()) == len(records)
+
+
+def test_appends_to_existing_log(tmp_path):
+    """Test that a second recorder appends to the log instead of overwriting it."""
+    path = tmp_path / "games.bin"
+    for _ in range(2):
+        with GameRecorder(path) as recorder:
+            recorder.record([4], Symbol.X, Game.Winner.DRAW, [0.0])
+    assert len(list(read_records(path))) == 2
+
+
+def test_rejects_other_files(tmp_path):
+    """Test that a file without the log header is refused."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a game log")
+    with pytest.raises(ValueError):
+        list(read_records(path))
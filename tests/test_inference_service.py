@@ -0,0 +1,108 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.reinforcement_agent import (
+    InferenceBackend,
+    ModelDifficulty,
+    ReinforcementAgent,
+)
+from tictactoe.board import Board, Symbol
+from tictactoe.inference_service import InferenceService
+from tictactoe.solver import iter_positions, side_to_move, terminal_value
+
+
+def playable_positions():
+    """Every non-terminal position, seen from the side to move (1 = own pieces)."""
+    positions = [cells for cells in iter_positions() if terminal_value(cells) is None]
+    return np.array([np.multiply(cells, side_to_move(cells)) for cells in positions], dtype=np.int8)
+
+
+@pytest.fixture
+def agent():
+    """Fixture to provide the deterministic agent serving the requests."""
+    return ReinforcementAgent(ModelDifficulty.EASY, backend=InferenceBackend.NUMPY, deterministic=True)
+
+
+def test_concurrent_requests_are_batched(agent):
+    """Test that requests from many threads share forward passes and get their own answer."""
+    boards = playable_positions()[:200]
+    expected = agent.predict_squares(boards, boards == 0)
+    results = {}
+    with InferenceService(agent, max_batch_size=32, max_wait=0.05) as service:
+        def worker(i):
+            results[i] = service.predict(boards[i:i + 1], boards[i:i + 1] == 0)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(boards))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert [int(results[i][0]) for i in range(len(boards))] == expected.tolist()
+    assert sum(size * count for size, count in service.batch_sizes.items()) == len(boards)
+    assert max(service.batch_sizes) <= 32
+    assert sum(service.batch_sizes.values()) < len(boards)
+    assert len(service.queue_latency) == len(boards)
+
+
+def test_partial_batch_flushed_at_deadline(agent):
+    """Test that a lone request is answered once the deadline passes."""
+    boards = playable_positions()[:3]
+    with InferenceService(agent, max_batch_size=64, max_wait=0.001) as service:
+        squares = service.predict(boards, boards == 0)
+    assert len(squares) == 3
+    assert service.batch_sizes == {3: 1}
+    assert service.to_dict()["batches"] == 1
+
+
+def test_predict_async(agent):
+    """Test that asyncio tasks can await the service concurrently."""
+    boards = playable_positions()[:10]
+    expected = agent.predict_squares(boards, boards == 0)
+    with InferenceService(agent, max_wait=0.05) as service:
+        async def main():
+            return await asyncio.gather(*(service.predict_async(boards[i:i + 1], boards[i:i + 1] == 0)
+                                          for i in range(len(boards))))
+
+        results = asyncio.run(main())
+    assert [int(squares[0]) for squares in results] == expected.tolist()
+
+
+def test_agent_uses_service_transparently(agent):
+    """Test that a ReinforcementAgent built with a service plays through it."""
+    with InferenceService(agent) as service:
+        client = ReinforcementAgent(ModelDifficulty.EASY, backend=InferenceBackend.NUMPY, inference_service=service)
+        client.symbol = Symbol.X
+        move = client.choose_move(Board())
+    assert Board().is_move_valid(move)
+    assert service.batch_sizes == {1: 1}
+
+
+def test_service_agent_runs_its_own_model(agent):
+    """Test that a service cannot serve an agent already using a service, nor loop back through itself."""
+    with InferenceService(agent) as service:
+        client = ReinforcementAgent(ModelDifficulty.EASY, backend=InferenceBackend.NUMPY, inference_service=service)
+        with pytest.raises(ValueError):
+            InferenceService(client)
+        # An agent attached to the service it serves keeps running its own model
+        agent.inference_service = service
+        boards = playable_positions()[:4]
+        assert agent.model is not None
+        assert np.array_equal(service.predict(boards, boards == 0), agent.predict_squares(boards, boards == 0))
+
+
+def test_errors_reach_the_caller():
+    """Test that a failing forward pass is raised in every waiting caller."""
+    class BrokenAgent:
+        def predict_squares(self, observations, mask):
+            raise RuntimeError("broken model")
+
+    boards = playable_positions()[:2]
+    with InferenceService(BrokenAgent()) as service:
+        with pytest.raises(RuntimeError, match="broken model"):
+            service.predict(boards, boards == 0)
+    with pytest.raises(RuntimeError):
+        service.submit(boards, boards == 0)
@@ -0,0 +1,86 @@
+import copy
+import json
+
+import pytest
+
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.board import Board, Symbol
+from tictactoe.game import Game
+from tictactoe.instrumentation import Instrumentation, LatencyHistogram
+from tictactoe.move import MoveType
+
+
+def test_histogram_percentiles():
+    """Test that percentiles are computed over the recorded samples."""
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.add(i / 1000)
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(0.0505)
+    assert summary["p99"] == pytest.approx(0.09901)
+
+
+def test_game_metrics(tmp_path):
+    """Test that an instrumented game counts moves, board calls and games."""
+    instrumentation = Instrumentation()
+    game = Game(Board(), RandomAgent(), RandomAgent(), instrumentation=instrumentation)
+    for _ in range(20):
+        game.play()
+        game.board.reset()
+        game.player_manager.reset()
+
+    moves = instrumentation.operations["Board.set_move"]
+    assert instrumentation.games == 20
+    assert instrumentation.games_per_sec > 0
+    assert sum(len(hist) for hist in instrumentation.decision_latencies.values()) == moves
+    assert instrumentation.operations["Board.has_winner"] == moves
+    # Resets between games happen outside of play, uncounted
+    assert "Board.reset" not in instrumentation.operations
+
+    path = tmp_path / "metrics.json"
+    instrumentation.save_json(path)
+    assert json.loads(path.read_text())["games"] == 20
+    assert "Games/sec" in instrumentation.report()
+
+
+def test_counting_is_limited_to_the_game():
+    """Test that methods are only counted while the game is played, on its own board and agents."""
+    board, other = Board(), Board()
+    agent = RandomAgent()
+    instrumentation = Instrumentation()
+    game = Game(board, agent, RandomAgent(), instrumentation=instrumentation)
+    assert "set_move" not in vars(board)
+    game.play()
+    assert "set_move" not in vars(board)
+    assert "get_valid_moves" not in vars(agent)
+
+    # A copy made after the game counts nothing, nor does a board outside of the game
+    counted = dict(instrumentation.operations)
+    copy.copy(agent).get_valid_moves(other)
+    other.set_move(MoveType.MM, Symbol.X)
+    assert instrumentation.operations == counted
+
+
+def test_same_named_players_are_kept_apart():
+    """Test that two agents with the same name get their own latencies and call counts."""
+    instrumentation = Instrumentation()
+    game = Game(Board(), RandomAgent(), RandomAgent(), instrumentation=instrumentation)
+    for _ in range(10):
+        game.play()
+        game.board.reset()
+        game.player_manager.reset()
+
+    assert sorted(instrumentation.decision_latencies) == ["Player A (Random Agent)", "Player B (Random Agent)"]
+    moves = instrumentation.operations["Board.set_move"]
+    assert sum(len(hist) for hist in instrumentation.decision_latencies.values()) == moves
+    assert instrumentation.operations["Player A (Random Agent).get_valid_moves"] > 0
+    assert instrumentation.operations["Player B (Random Agent).get_valid_moves"] > 0
+
+
+def test_plain_game_does_not_time_moves(monkeypatch):
+    """Test that a game without recorder or instrumentation never reads the clock."""
+    calls = []
+    monkeypatch.setattr("tictactoe.game.time.perf_counter", lambda: calls.append(1) or 0.0)
+    Game(Board(), RandomAgent(), RandomAgent()).play()
+    assert not calls
@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from tictactoe.agent import AgentType
+from tictactoe.league import AgentSpec, League, compute_elo, discover_agents
+
+RANDOM = AgentSpec("Random", AgentType.RANDOM)
+MINIMAX = AgentSpec("Minimax", AgentType.MINIMAX)
+
+
+def test_elo_orders_agents():
+    """Test that the agent scoring more gets the higher rating."""
+    ratings = compute_elo({("A", "B"): (80, 10, 10), ("B", "A"): (10, 10, 80)})
+    assert ratings["A"] > ratings["B"]
+    assert abs(ratings["A"] + ratings["B"] - 3000) < 1e-6
+
+
+def test_elo_of_a_perfect_score_converges():
+    """Test that a 100% score gets a finite gap, fitted by the half virtual draw and not the iteration budget."""
+    results = {("A", "B"): (100, 0, 0), ("B", "A"): (0, 0, 100)}
+    ratings = compute_elo(results)
+    assert compute_elo(results, max_iterations=100_000) == pytest.approx(ratings, abs=1e-6)
+    score = (100 + 0.25) / 100.5
+    assert ratings["A"] - ratings["B"] == pytest.approx(400 * math.log10(score / (1 - score)))
+
+
+def test_discover_agents_includes_mcts(tmp_path):
+    """Test that the MCTS agent plays in the league even without any model."""
+    assert discover_agents(str(tmp_path)) == [RANDOM, MINIMAX, AgentSpec("MCTS", AgentType.MCTS)]
+
+
+def test_discover_agents_includes_the_tabular_policy():
+    """Test that the shipped tabular policy plays in the league with the TABULAR backend."""
+    specs = {spec.name: spec for spec in discover_agents()}
+    assert specs["RL TABULAR"].build().backend.value == ".npy"
+
+
+def test_results_are_cached(tmp_path):
+    """Test that only pairings involving a new agent are played again."""
+    cache_path = str(tmp_path / "league.json")
+    league = League([RANDOM, MINIMAX], games_per_pairing=50, cache_path=cache_path)
+    results = league.run()
+    assert league.games_played == 100
+    assert results[("Minimax", "Random")][2] == 0
+
+    league = League([RANDOM, MINIMAX], games_per_pairing=50, cache_path=cache_path)
+    assert league.run() == results
+    assert league.games_played == 0
+
+    other_random = AgentSpec("Random 2", AgentType.RANDOM)
+    league = League([RANDOM, MINIMAX, other_random], games_per_pairing=50, cache_path=cache_path)
+    league.run()
+    assert league.games_played == 4 * 50
+    assert "Elo ratings" in league.report()
@@ -0,0 +1,65 @@
+import numpy as np
+import torch
+
+from stable_baselines3 import PPO
+
+from tictactoe.numpy_policy import NumpyPolicy
+from tictactoe.training.masked_policy import MaskedActorCriticPolicy
+from tictactoe.training.opponent_pool import OpponentPool
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+
+def make_model(tmp_path):
+    env = TicTacToeVecEnv(8, opponent_pool=OpponentPool(models_dir=str(tmp_path)))
+    env.seed(0)
+    return PPO(MaskedActorCriticPolicy, env, n_steps=16, batch_size=64, seed=0)
+
+
+def test_predict_never_plays_occupied_squares(tmp_path):
+    """Test that sampled and deterministic actions are always empty squares."""
+    model = make_model(tmp_path)
+    boards = np.random.default_rng(0).choice([-1, 0, 1], size=(500, 9)).astype(np.int8)
+    boards[:, 0] = 0  # At least one legal move per board
+    for deterministic in (True, False):
+        actions, _ = model.predict(boards, deterministic=deterministic)
+        assert (boards[np.arange(len(boards)), actions] == 0).all()
+
+
+def test_training_plays_no_illegal_action(tmp_path):
+    """Test that rollouts collected with the masked policy never need the env fallback."""
+    model = make_model(tmp_path)
+    model.learn(256)
+    assert model.env.unwrapped.illegal_actions == 0
+
+
+def test_numpy_export_matches_masked_predict(tmp_path):
+    """Test that the exported weights with the same mask choose the same actions."""
+    model = make_model(tmp_path)
+    boards = np.random.default_rng(1).choice([-1, 0, 1], size=(200, 9)).astype(np.int8)
+    boards[:, 8] = 0
+    with torch.no_grad():
+        expected, _ = model.predict(boards, deterministic=True)
+    actions, _ = NumpyPolicy.from_sb3_policy(model.policy).predict(
+        boards, deterministic=True, action_masks=boards == 0
+    )
+    assert np.array_equal(actions, expected)
+
+
+def test_pushed_opponent_plays_like_in_process_opponent(tmp_path):
+    """Test that the NumpyPolicy pushed to subprocess workers chooses the moves of the PPO opponent."""
+    model = make_model(tmp_path)
+    envs = []
+    for opponent in (model, NumpyPolicy.from_sb3_policy(model.policy)):
+        env = TicTacToeVecEnv(200, opponent_pool=OpponentPool(models_dir=str(tmp_path)))
+        env.set_opponent(opponent)
+        # Same random replacements of the agent's illegal actions in both envs
+        env.seed(0)
+        env.reset()
+        envs.append(env)
+    rng = np.random.default_rng(2)
+    for _ in range(4):
+        actions = rng.integers(9, size=200)
+        with torch.no_grad():
+            expected, _, _, _ = envs[0].step(actions)
+        obs, _, _, _ = envs[1].step(actions)
+        assert np.array_equal(obs, expected)
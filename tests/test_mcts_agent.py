@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from tictactoe.agents_collection.mcts_agent import MCTSAgent
+from tictactoe.agents_collection.minimax_agent import MinimaxAgent
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ModelDifficulty, ReinforcementAgent
+from tictactoe.board import Board, Symbol
+from tictactoe.game import Game
+from tictactoe.move import MoveType
+
+
+@pytest.fixture
+def agent():
+    """Fixture to provide a seeded MCTS agent playing X."""
+    agent = MCTSAgent(iterations=500)
+    agent.seed(0)
+    agent.symbol = Symbol.X
+    return agent
+
+
+def test_takes_winning_move(agent):
+    """Test that an immediate win is found."""
+    board = Board()
+    for move, symbol in ((MoveType.HG, Symbol.X), (MoveType.MG, Symbol.O), (MoveType.HM, Symbol.X),
+                         (MoveType.MM, Symbol.O)):
+        board.set_move(move, symbol)
+    assert agent.choose_move(board) == MoveType.HD
+
+
+def test_blocks_opponent_win(agent):
+    """Test that an immediate threat of the opponent is blocked."""
+    board = Board()
+    for move, symbol in ((MoveType.MM, Symbol.X), (MoveType.HG, Symbol.O), (MoveType.BD, Symbol.X),
+                         (MoveType.HM, Symbol.O)):
+        board.set_move(move, symbol)
+    assert agent.choose_move(board) == MoveType.HD
+
+
+def test_tree_is_reused_then_reset(agent):
+    """Test that the subtree of the next position is kept between moves and dropped by reset."""
+    board = Board()
+    move = agent.choose_move(board)
+    board.set_move(move, Symbol.X)
+    reply = next(m for m in board.legal_moves())
+    board.set_move(reply, Symbol.O)
+    kept = next(child for child in agent.root.children if child.square == reply.square)
+    visits = kept.visits
+    assert visits > 0
+    agent.choose_move(board)
+    # The search continued from the kept node instead of a new root
+    assert kept.visits == visits + agent.iterations
+    assert agent.root in kept.children
+    agent.reset()
+    assert agent.root is None
+
+
+def test_time_budget(agent):
+    """Test that a time budget bounds the search and reports iterations/sec."""
+    agent.time_limit = 0.02
+    agent.choose_move(Board())
+    assert agent.total_iterations > 0
+    assert agent.total_search_time < 0.5
+    assert agent.iterations_per_sec > 0
+
+
+def test_never_loses_against_minimax():
+    """Test that the search draws perfect play from both sides."""
+    agent = MCTSAgent(iterations=1000)
+    agent.seed(0)
+    game = Game(Board(), agent, MinimaxAgent(), rng=random.Random(0))
+    for _ in range(10):
+        assert game.play() == Game.Winner.DRAW
+        game.board.reset()
+        game.player_manager.reset()
+
+
+def test_beats_random_agent():
+    """Test that the search wins most games against random moves."""
+    agent, opponent = MCTSAgent(iterations=300), RandomAgent()
+    agent.seed(0)
+    game = Game(Board(), agent, opponent, rng=random.Random(0))
+    results = []
+    for _ in range(20):
+        results.append(game.play())
+        game.board.reset()
+        game.player_manager.reset()
+    assert results.count(Game.Winner.PLAYER_B) == 0
+    assert results.count(Game.Winner.PLAYER_A) >= 15
+
+
+class UniformPrior:
+    """Prior agent giving the same probability to every legal move."""
+
+    def action_probabilities(self, observations, mask):
+        return mask / mask.sum(axis=1, keepdims=True)
+
+
+def test_prior_agent_uses_puct():
+    """Test that a search with a prior still plays perfect-play draws."""
+    agent = MCTSAgent(iterations=1000, prior_agent=UniformPrior())
+    agent.seed(0)
+    game = Game(Board(), agent, MinimaxAgent(), rng=random.Random(0))
+    for _ in range(4):
+        assert game.play() == Game.Winner.DRAW
+        game.board.reset()
+        game.player_manager.reset()
+
+
+def losses_against_minimax(agent, num_games: int, symbol: Symbol) -> int:
+    # With this rng, player A keeps X
+    players = (agent, MinimaxAgent()) if symbol == Symbol.X else (MinimaxAgent(), agent)
+    game = Game(Board(), *players, rng=random.Random(0))
+    assert agent.symbol == symbol
+    minimax_win = Game.Winner.PLAYER_B if symbol == Symbol.X else Game.Winner.PLAYER_A
+    losses = 0
+    for _ in range(num_games):
+        losses += game.play() == minimax_win
+        game.board.reset()
+        game.player_manager.reset()
+    return losses
+
+
+@pytest.mark.parametrize("symbol", [Symbol.X, Symbol.O])
+def test_model_prior_loses_no_more_than_uct(symbol):
+    """Test that the tempered prior of a shipped PPO model does not weaken the search against perfect play."""
+    prior_agent = ReinforcementAgent(ModelDifficulty.HARD, backend=InferenceBackend.NUMPY)
+    with_prior = MCTSAgent(iterations=200, prior_agent=prior_agent)
+    with_prior.seed(0)
+    plain = MCTSAgent(iterations=200)
+    plain.seed(0)
+    assert losses_against_minimax(with_prior, 30, symbol) <= losses_against_minimax(plain, 30, symbol)
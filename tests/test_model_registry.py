@@ -0,0 +1,29 @@
+from tictactoe.agents_collection.reinforcement_agent import ModelDifficulty, ReinforcementAgent
+from tictactoe.model_registry import ModelRegistry
+
+
+def test_agent_does_not_load_on_init():
+    """Test that creating an agent does not load its model."""
+    model_registry = ModelRegistry()
+    ReinforcementAgent(ModelDifficulty.EASY, model_registry=model_registry)
+    assert model_registry.loads == 0
+    assert not model_registry.is_loaded("models/ppo_tictactoe_easy.zip")
+
+
+def test_missing_model(tmp_path):
+    """Test that a missing model file gives no model instead of raising."""
+    model_registry = ModelRegistry()
+    agent = ReinforcementAgent(model_path=str(tmp_path / "missing.zip"), model_registry=model_registry)
+    assert agent.model is None
+    assert model_registry.loads == 0
+
+
+def test_model_is_shared():
+    """Test that two agents with the same difficulty share one model instance."""
+    model_registry = ModelRegistry()
+    calls = []
+    model_registry._load = lambda path: calls.append(path) or object()
+    first = ReinforcementAgent(ModelDifficulty.HARD, model_registry=model_registry)
+    second = ReinforcementAgent(ModelDifficulty.HARD, model_registry=model_registry)
+    assert first.model is second.model
+    assert calls == ["models/ppo_tictactoe_hard.zip"]
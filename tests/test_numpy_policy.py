@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from tictactoe.numpy_policy import NumpyPolicy
+from tictactoe.solver import iter_positions, terminal_value
+
+
+@pytest.fixture
+def policy():
+    """Fixture to provide a small random policy."""
+    rng = np.random.default_rng(0)
+    weights = [rng.normal(size=(9, 16)), rng.normal(size=(16, 9))]
+    biases = [rng.normal(size=16), rng.normal(size=9)]
+    return NumpyPolicy(weights, biases, "ReLU")
+
+
+def test_save_load(policy, tmp_path):
+    """Test that a saved policy gives the same logits once loaded."""
+    path = tmp_path / "policy.npz"
+    policy.save(path)
+    observations = np.eye(9, dtype=np.int8)
+    assert np.allclose(NumpyPolicy.load(path).logits(observations), policy.logits(observations))
+
+
+def test_masked_actions_are_legal(policy):
+    """Test that masked predictions only pick allowed actions."""
+    observations = np.array([cells for cells in iter_positions() if terminal_value(cells) is None])
+    masks = observations == 0
+    for deterministic in (True, False):
+        actions, _ = policy.predict(observations, deterministic=deterministic, action_masks=masks)
+        assert masks[np.arange(len(actions)), actions].all()
+
+
+def test_numpy_backend_does_not_import_torch():
+    """Test that playing with the NumPy backend never imports torch."""
+    code = (
+        "import sys\n"
+        "from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ReinforcementAgent\n"
+        "from tictactoe.board import Board, Symbol\n"
+        "agent = ReinforcementAgent(backend=InferenceBackend.NUMPY)\n"
+        "agent.symbol = Symbol.X\n"
+        "agent.choose_move(Board())\n"
+        "assert agent.model is not None\n"
+        "assert 'torch' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_same_actions_as_sb3():
+    """Test that exported weights reproduce the deterministic PPO actions."""
+    stable_baselines3 = pytest.importorskip("stable_baselines3")
+    model = stable_baselines3.PPO.load("models/ppo_tictactoe_hard.zip")
+    policy = NumpyPolicy.from_sb3_policy(model.policy)
+    observations = np.array([cells for cells in iter_positions() if terminal_value(cells) is None])
+    expected, _ = model.predict(observations, deterministic=True)
+    actions, _ = policy.predict(observations, deterministic=True)
+    assert (actions == expected).all()
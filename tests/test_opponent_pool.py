@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from tictactoe.training.opponent_pool import OpponentPool
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    """Fixture to provide an empty models directory."""
+    return tmp_path
+
+
+def add_checkpoint(models_dir, batch_num):
+    path = models_dir / f"ppo_tictactoe_batch_{batch_num}.zip"
+    path.write_bytes(b"")
+    return str(path)
+
+
+def make_pool(models_dir, **kwargs):
+    return OpponentPool(
+        models_dir=str(models_dir), refresh_interval=0.0, loader=lambda path: path, **kwargs
+    )
+
+
+def test_no_checkpoint(models_dir):
+    """Test that an empty models directory yields no opponent."""
+    pool = make_pool(models_dir)
+    assert pool.latest() is None
+    assert pool.loads == 0
+
+
+def test_latest_is_loaded_once(models_dir):
+    """Test that repeated requests for the latest checkpoint only load it once."""
+    add_checkpoint(models_dir, 2)
+    latest = add_checkpoint(models_dir, 10)
+    pool = make_pool(models_dir)
+    for _ in range(100):
+        assert pool.latest() == latest
+    assert pool.loads == 1
+    assert pool.hits == 99
+    assert pool.scans == 1
+
+
+def test_new_checkpoint_is_picked_up(models_dir):
+    """Test that a checkpoint saved after the first scan becomes the latest one."""
+    add_checkpoint(models_dir, 1)
+    pool = make_pool(models_dir)
+    pool.latest()
+    newest = add_checkpoint(models_dir, 2)
+    # Make sure the directory mtime differs even on coarse-grained filesystems
+    stat = os.stat(models_dir)
+    os.utime(models_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert pool.latest() == newest
+    assert pool.scans == 2
+
+
+def test_lru_eviction(models_dir):
+    """Test that the pool keeps at most max_size policies in memory."""
+    paths = [add_checkpoint(models_dir, i) for i in range(1, 4)]
+    pool = make_pool(models_dir, max_size=2)
+    for path in paths:
+        pool.get(path)
+    assert pool.stats()["cached"] == 2
+    assert pool.evictions == 1
+    pool.get(paths[0])
+    assert pool.loads == 4
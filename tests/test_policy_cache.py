@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.reinforcement_agent import (
+    InferenceBackend,
+    ModelDifficulty,
+    ReinforcementAgent,
+)
+from tictactoe.board import Board, Symbol
+from tictactoe.policy_cache import PolicyCache
+from tictactoe.solver import iter_positions, terminal_value
+from tictactoe.symmetry import apply, from_transformed_square, to_transformed_square
+
+
+def first_empty_square(observations, mask):
+    return mask.argmax(axis=1)
+
+
+def test_lookup_counts_hits_and_misses():
+    """Test that a position is only predicted the first time it is seen."""
+    cache = PolicyCache()
+    observations = np.zeros((3, 9), dtype=np.int8)
+    observations[1, 0] = 1
+    squares = cache.lookup(observations, first_empty_square)
+    assert squares.tolist() == [0, 1, 0]
+    assert (cache.hits, cache.misses) == (0, 3)
+    cache.lookup(observations, first_empty_square)
+    assert cache.hits == 3
+    assert len(cache) == 2
+
+
+def test_precompute_covers_every_position():
+    """Test that precomputing stores all 4520 non-terminal positions."""
+    cache = PolicyCache()
+    cache.precompute(first_empty_square)
+    assert len(cache) == 4520
+
+
+def test_cache_requires_deterministic_policy():
+    """Test that caching a sampling policy is rejected."""
+    with pytest.raises(ValueError):
+        ReinforcementAgent(cache=True)
+
+
+def test_load_model_invalidates_cache():
+    """Test that loading another model drops the cached decisions."""
+    agent = ReinforcementAgent(
+        ModelDifficulty.HARD, backend=InferenceBackend.NUMPY, deterministic=True, cache=True
+    )
+    agent.symbol = Symbol.X
+    agent.choose_move(Board())
+    assert len(agent.policy_cache) == 1
+    agent.load_model(f"models/{ModelDifficulty.EASY.value}.npz")
+    assert len(agent.policy_cache) == 0
+
+
+def test_symmetric_positions_share_one_entry():
+    """Test that the rotations of a position are predicted once and get the rotated square."""
+    cache = PolicyCache(symmetric=True)
+    board = np.array([1, 0, 0, 0, -1, 0, 0, 0, 0], dtype=np.int8)
+    rotations = np.array([apply(board, transform) for transform in range(4)], dtype=np.int8)
+    cache.lookup(rotations[:1], first_empty_square)
+    squares = cache.lookup(rotations, first_empty_square)
+    assert (cache.hits, cache.misses) == (4, 1)
+    assert len(cache) == 1
+    # The same square of the board, seen through each rotation
+    canonical_square = from_transformed_square(int(squares[0]), 0)
+    for transform, square in enumerate(squares.tolist()):
+        assert rotations[transform, square] == 0
+        assert square == to_transformed_square(canonical_square, transform)
+
+
+def test_symmetric_precompute_keeps_one_position_per_class():
+    """Test that precomputing stores the 627 non-terminal positions up to symmetry."""
+    cache = PolicyCache(symmetric=True)
+    cache.precompute(first_empty_square)
+    assert len(cache) == 627
+
+
+def test_symmetric_cache_plays_legal_moves():
+    """Test that an agent with a symmetric cache only plays empty squares, from the canonical decisions."""
+    agent = ReinforcementAgent(ModelDifficulty.HARD, backend=InferenceBackend.NUMPY, deterministic=True,
+                               precompute_cache=True, symmetric_cache=True)
+    observations = np.array(
+        [cells for cells in iter_positions() if terminal_value(cells) is None], dtype=np.int8
+    )
+    squares = agent.predict_squares(observations, observations == 0)
+    assert (observations[np.arange(len(observations)), squares] == 0).all()
+    assert len(agent.policy_cache) == 627 and agent.policy_cache.misses == 0
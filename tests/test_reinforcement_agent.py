@@ -0,0 +1,59 @@
+import numpy as np
+
+from tictactoe.agents_collection.reinforcement_agent import (
+    TABULAR_MODEL_PATH,
+    InferenceBackend,
+    ModelDifficulty,
+    ReinforcementAgent,
+)
+from tictactoe.solver import iter_positions, side_to_move, terminal_value
+from tictactoe.tabular_policy import TabularPolicy
+
+
+def playable_positions():
+    """Every non-terminal position, seen from the side to move (1 = own pieces)."""
+    positions = [cells for cells in iter_positions() if terminal_value(cells) is None]
+    return np.array([np.multiply(cells, side_to_move(cells)) for cells in positions], dtype=np.int8)
+
+
+def test_masked_sb3_agent_never_falls_back():
+    """Test that masking the PPO logits always gives a legal move, in one pass."""
+    boards = playable_positions()
+    mask = boards == 0
+    for deterministic in (True, False):
+        agent = ReinforcementAgent(ModelDifficulty.EASY, deterministic=deterministic)
+        agent.seed(0)
+        squares = agent.choose_moves(boards, mask)
+        assert mask[np.arange(len(squares)), squares].all()
+        assert agent.fallback_moves == 0
+
+
+def test_unmasked_agent_counts_fallbacks():
+    """Test that every illegal prediction of an unmasked agent is counted and replaced."""
+    boards = playable_positions()
+    mask = boards == 0
+    agent = ReinforcementAgent(ModelDifficulty.EASY, deterministic=True, mask_illegal=False)
+    predicted = agent.predict_squares(boards, mask)
+    squares = agent.choose_moves(boards, mask)
+    assert mask[np.arange(len(squares)), squares].all()
+    assert agent.fallback_moves == int((~mask[np.arange(len(predicted)), predicted]).sum())
+
+
+def test_tabular_backend_defaults_to_the_tabular_policy():
+    """Test that the TABULAR backend loads the shipped table without a model_path, not the difficulty models."""
+    agent = ReinforcementAgent(backend=InferenceBackend.TABULAR)
+    assert agent.model_path == TABULAR_MODEL_PATH
+    assert isinstance(agent.model, TabularPolicy)
+
+
+def test_masking_keeps_legal_predictions():
+    """Test that masking only changes the moves that were illegal."""
+    boards = playable_positions()
+    mask = boards == 0
+    for backend in InferenceBackend:
+        masked = ReinforcementAgent(ModelDifficulty.EASY, backend=backend, deterministic=True)
+        unmasked = ReinforcementAgent(ModelDifficulty.EASY, backend=backend, deterministic=True, mask_illegal=False)
+        assert masked.model is not None
+        predicted = unmasked.predict_squares(boards, mask)
+        legal = mask[np.arange(len(predicted)), predicted]
+        assert (masked.predict_squares(boards, mask)[legal] == predicted[legal]).all()
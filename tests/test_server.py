@@ -0,0 +1,110 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.mcts_agent import MCTSAgent
+from tictactoe.agents_collection.minimax_agent import MinimaxAgent
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ReinforcementAgent
+from tictactoe.client import GameClient, run_loadgen
+from tictactoe.move import MoveType
+from tictactoe.server import GameServer
+
+
+def make_server():
+    return GameServer(
+        {"RANDOM": RandomAgent(), "MINIMAX": MinimaxAgent(), "MCTS": MCTSAgent(iterations=50)},
+        max_workers=4,
+        seed=0,
+    )
+
+
+def run_with_server(test):
+    """Run `test(server, port)` against a server listening on a free local port."""
+    async def main():
+        server = make_server()
+        port = await server.start(port=0)
+        try:
+            return await test(server, port)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_client_playing_first_and_second():
+    """Test that the agent replies to each move, and opens the match when the client plays O."""
+    async def test(server, port):
+        client = await GameClient.connect(port=port)
+        reply = await client.new_match("MINIMAX", "X")
+        assert reply == {"type": "state", "board": ".........", "symbol": "X"}
+        reply = await client.move(MoveType.MM)
+        assert reply["board"].count("X") == 1 and reply["board"].count("O") == 1
+
+        reply = await client.new_match("MINIMAX", "O")
+        assert reply["symbol"] == "O"
+        assert reply["board"].count("X") == 1 and reply["board"].count("O") == 0
+        await client.close()
+
+    run_with_server(test)
+
+
+def test_errors_keep_the_match_going():
+    """Test that invalid requests are answered with an error without ending the match."""
+    async def test(server, port):
+        client = await GameClient.connect(port=port)
+        assert (await client.new_match("UNKNOWN"))["type"] == "error"
+        assert (await client.move(MoveType.MM))["type"] == "error"
+        await client.new_match("RANDOM", "X")
+        await client.move(MoveType.MM)
+        reply = await client.move(MoveType.MM)
+        assert reply == {"type": "error", "message": "Invalid move: MM"}
+        assert (await client.request({"type": "move", "move": "ZZ"}))["type"] == "error"
+        assert (await client.request({"type": "resign"}))["type"] == "error"
+        assert server.active_matches == 1
+        await client.close()
+
+    run_with_server(test)
+
+
+@pytest.mark.parametrize("agent", ["RANDOM", "MINIMAX", "MCTS"])
+def test_concurrent_matches(agent):
+    """Test that many concurrent scripted matches all finish, without a win against minimax."""
+    async def test(server, port):
+        stats = await run_loadgen(agent, matches=60, concurrency=20, port=port, seed=0)
+        await asyncio.sleep(0)  # Let the server see the closed connections
+        return server, stats
+
+    server, stats = run_with_server(test)
+    assert stats.matches == 60 and stats.errors == 0
+    assert server.matches_played == 60 and server.active_matches == 0
+    assert len(stats.round_trip) >= 60 * 2
+    assert stats.matches_per_sec > 0
+    if agent == "MINIMAX":
+        assert stats.results["win"] == 0
+
+
+def test_each_match_gets_its_own_agent():
+    """Test that matches play against copies sharing no search state with the configured agent."""
+    server = make_server()
+    prototype = server.agents["MCTS"]
+    first, second = server._new_agent("MCTS"), server._new_agent("MCTS")
+    assert first is not prototype and first is not second
+    assert first.rng is not second.rng
+    assert first.root is None
+    server.executor.shutdown()
+
+
+def test_matches_do_not_share_a_policy_cache():
+    """Test that each copy of a cached agent fills its own cache, starting from the precomputed one."""
+    agent = ReinforcementAgent(backend=InferenceBackend.TABULAR, deterministic=True, precompute_cache=True)
+    assert agent.model is not None
+    server = GameServer({"RL": agent}, max_workers=1, seed=0)
+    first, second = server._new_agent("RL"), server._new_agent("RL")
+    assert first.policy_cache is not agent.policy_cache and first.policy_cache is not second.policy_cache
+    assert len(first.policy_cache) == len(agent.policy_cache) > 0
+    assert first.model is agent.model
+    first.predict_squares(np.zeros((1, 9), dtype=np.int8), np.ones((1, 9), dtype=bool))
+    assert first.policy_cache.hits == 1 and agent.policy_cache.hits == 0
+    server.executor.shutdown()
@@ -0,0 +1,70 @@
+import pytest
+
+from tictactoe.cells import EMPTY_CELL
+from tictactoe.solver import (
+    NO_MOVE,
+    Solver,
+    best_squares,
+    iter_positions,
+    load_table,
+    play,
+    save_table,
+    side_to_move,
+    terminal_value,
+)
+from tictactoe.symmetry import canonicalize
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Fixture to solve the game once for the whole module."""
+    return Solver().solve()
+
+
+def test_position_counts(table):
+    """Test that there are 5478 legal positions and 765 up to symmetry."""
+    assert sum(1 for _ in iter_positions()) == 5478
+    assert len(table) == 765
+
+
+def test_empty_board_is_draw(table):
+    """Test that perfect play from the empty board is a draw."""
+    assert best_squares(table, [(EMPTY_CELL,) * 9]) != [NO_MOVE]
+    canonical, _ = canonicalize((EMPTY_CELL,) * 9)
+    assert Solver().best_move(canonical)[0] == 0
+
+
+def test_symmetric_positions_share_key():
+    """Test that all rotations of a corner opening have the same canonical form."""
+    corners = [tuple(1 if i == square else 0 for i in range(9)) for square in (0, 2, 6, 8)]
+    assert len({canonicalize(cells)[0] for cells in corners}) == 1
+
+
+def test_never_loses(table):
+    """Test that the solved moves never lose against any sequence of replies."""
+
+    def explore(cells, solver_cell):
+        value = terminal_value(cells)
+        if value is not None:
+            # The side to move lost if the value is negative
+            loser = side_to_move(cells)
+            assert not (value < 0 and loser == solver_cell)
+            return
+        if side_to_move(cells) == solver_cell:
+            square, = best_squares(table, [cells])
+            assert cells[square] == EMPTY_CELL
+            explore(play(cells, square, solver_cell), solver_cell)
+        else:
+            for square in range(9):
+                if cells[square] == EMPTY_CELL:
+                    explore(play(cells, square, -solver_cell), solver_cell)
+
+    explore((EMPTY_CELL,) * 9, 1)
+    explore((EMPTY_CELL,) * 9, -1)
+
+
+def test_save_load(table, tmp_path):
+    """Test that a saved table is read back identically."""
+    path = tmp_path / "table.bin"
+    save_table(table, path)
+    assert load_table(path) == table
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from tictactoe.training.subproc_vec_env import SubprocTicTacToeVecEnv
+
+
+@pytest.fixture
+def env():
+    """Fixture to provide 5 environments sharded over 2 worker processes."""
+    env = SubprocTicTacToeVecEnv(5, 2)
+    yield env
+    env.close()
+
+
+def test_environments_are_split_over_workers(env):
+    """Test that every environment is assigned to exactly one worker."""
+    assert env.env_counts == [3, 2]
+    env.seed(0)
+    assert env.reset().shape == (5, 9)
+
+
+def test_step_concatenates_worker_results(env):
+    """Test that a step returns one observation, reward, done flag and info per environment."""
+    env.seed(0)
+    env.reset()
+    obs, rewards, dones, infos = env.step(np.full(5, 4))
+    assert obs.shape == (5, 9)
+    assert rewards.shape == dones.shape == (5,)
+    assert len(infos) == 5
+    # The agent's move and the opponent's reply are on every board
+    assert (obs[:, 4] == 1).all()
+    assert ((obs == -1).sum(axis=1) == 1).all()
+
+
+def test_seeded_resets_are_reproducible(env):
+    """Test that the same seed replays the same random opponent moves."""
+    trajectories = []
+    for _ in range(2):
+        env.seed(123)
+        env.reset()
+        trajectories.append(env.step(np.full(5, 0))[0])
+    assert np.array_equal(*trajectories)
+
+
+def test_env_method_returns_action_masks(env):
+    """Test that env_method("action_masks") returns one mask per environment, as the in-process env."""
+    env.seed(0)
+    env.reset()
+    obs, _, _, _ = env.step(np.full(5, 4))
+    masks = env.env_method("action_masks")
+    assert len(masks) == 5
+    assert np.array_equal(np.stack(masks), obs == 0)
+    assert np.array_equal(env.env_method("action_masks", indices=[1, 3])[1], obs[3] == 0)
@@ -0,0 +1,48 @@
+import pytest
+
+from tictactoe.move import MoveType
+from tictactoe.symmetry import (
+    TRANSFORMS,
+    apply,
+    canonicalize,
+    from_transformed_square,
+    inverse_transform_move,
+    to_transformed_square,
+    transform_move,
+)
+
+POSITION = (1, 0, -1, 0, 1, 0, 0, 0, -1)
+
+
+@pytest.mark.parametrize("transform", range(len(TRANSFORMS)))
+def test_images_share_canonical_form(transform):
+    """Test that every image of a position has the same canonical form."""
+    canonical, _ = canonicalize(POSITION)
+    assert canonicalize(apply(POSITION, transform))[0] == canonical
+
+
+def test_canonical_transform():
+    """Test that the returned transform maps the position to its canonical form."""
+    canonical, transform = canonicalize(POSITION)
+    assert apply(POSITION, transform) == canonical
+
+
+def test_transforms_form_a_group():
+    """Test that composing two symmetries gives another symmetry."""
+    for first in TRANSFORMS:
+        for second in TRANSFORMS:
+            assert tuple(first[i] for i in second) in TRANSFORMS
+
+
+@pytest.mark.parametrize("transform", range(len(TRANSFORMS)))
+@pytest.mark.parametrize("move", MoveType.all_moves())
+def test_move_round_trip(move, transform):
+    """Test that a move mapped forward then back is unchanged, and follows its cell."""
+    transformed = transform_move(move, transform)
+    assert inverse_transform_move(transformed, transform) == move
+    assert to_transformed_square(move.square, transform) == transformed.square
+    assert from_transformed_square(transformed.square, transform) == move.square
+
+    cells = [0] * 9
+    cells[move.square] = 1
+    assert apply(cells, transform)[transformed.square] == 1
@@ -0,0 +1,125 @@
+import pickle
+import random
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.minimax_agent import MinimaxAgent
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.bitboard import BitBoard
+from tictactoe.board import Board, Symbol
+from tictactoe.cells import EMPTY_CELL
+from tictactoe.game import Game
+from tictactoe.move import MOVES_BY_SQUARE
+from tictactoe.solver import (
+    Solver,
+    cells_of,
+    iter_positions,
+    play,
+    position_key,
+    side_to_move,
+    terminal_value,
+)
+from tictactoe.symmetry import canonicalize
+from tictactoe.tablebase import NUM_RECORDS, UNREACHABLE, Tablebase, build_tablebase
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    """Fixture to build the tablebase once for the whole module."""
+    path = str(tmp_path_factory.mktemp("tablebase") / "tablebase.bin")
+    build_tablebase(path)
+    return Tablebase(path)
+
+
+def test_values_match_solver(tablebase):
+    """Test that every reachable position has the alpha-beta solver's value, and only those are reachable."""
+    solver = Solver()
+    positions = list(iter_positions())
+    for cells in positions:
+        canonical, _ = canonicalize(cells)
+        assert tablebase.value(position_key(cells)) == solver.best_move(canonical)[0]
+    assert int((tablebase.records["depth"] != UNREACHABLE).sum()) == len(positions)
+    assert len(tablebase.records) == NUM_RECORDS
+
+
+def test_best_moves_and_depth(tablebase):
+    """Test that best moves keep the value and bring the end one ply closer."""
+    for cells in iter_positions():
+        value, best_moves, depth = tablebase.record(position_key(cells))
+        if terminal_value(cells) is not None:
+            assert best_moves == 0 and depth == 0
+            continue
+        assert best_moves
+        for square in tablebase.best_squares(position_key(cells)):
+            assert cells[square] == EMPTY_CELL
+            child = play(cells, square, side_to_move(cells))
+            assert tablebase.value(position_key(child)) == -value
+        # The best move of the solver's tie-break (quick wins, slow losses) reaches the end in `depth` plies
+        square = tablebase.best_squares(position_key(cells))[0]
+        child = play(cells, square, side_to_move(cells))
+        assert tablebase.depth(position_key(child)) == depth - 1
+
+
+def test_board_position_index():
+    """Test that Board and BitBoard keep the base-3 rank of the position used by the tablebase."""
+    rng = random.Random(0)
+    board, bitboard = Board(), BitBoard()
+    for _ in range(200):
+        move = rng.choice(MOVES_BY_SQUARE)
+        symbol = rng.choice(list(Symbol))
+        board.push(move, symbol)
+        bitboard.push(move, symbol)
+        assert board.position_index == bitboard.position_index == position_key(cells_of(board))
+        if rng.random() < 0.3:
+            board.pop()
+            bitboard.pop()
+            assert board.position_index == bitboard.position_index == position_key(cells_of(board))
+    assert board.copy().position_index == board.position_index
+    board.reset()
+    assert board.position_index == 0
+
+
+def test_lookup_is_vectorized(tablebase):
+    """Test that a batch lookup gives the records of each board."""
+    positions = list(iter_positions())[:100]
+    records = tablebase.lookup(np.array(positions, dtype=np.int8))
+    assert [tuple(record) for record in records.tolist()] == [
+        tablebase.record(position_key(cells)) for cells in positions
+    ]
+
+
+def _best_squares_of_empty_board(tablebase):
+    return tablebase.best_squares(0)
+
+
+def test_shared_across_processes(tablebase):
+    """Test that a pickled tablebase maps the file again instead of copying the records."""
+    assert len(pickle.dumps(tablebase)) < 200
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_best_squares_of_empty_board, [tablebase] * 2))
+    assert results == [tablebase.best_squares(0)] * 2
+
+
+def test_invalid_file(tmp_path):
+    """Test that a file of another format is rejected."""
+    path = tmp_path / "table.bin"
+    path.write_bytes(b"TTTM" + bytes(100))
+    with pytest.raises(ValueError):
+        Tablebase(str(path))
+
+
+def test_minimax_agent_with_tablebase(tablebase):
+    """Test that the tablebase-backed minimax agent never loses and plays legal batched moves."""
+    agent = MinimaxAgent(tablebase_path=tablebase.path)
+    game = Game(Board(), agent, RandomAgent(), rng=random.Random(0))
+    for _ in range(50):
+        assert game.play() != Game.Winner.PLAYER_B
+        game.board.reset()
+        game.player_manager.reset()
+
+    boards = np.array([cells for cells in iter_positions() if terminal_value(cells) is None], dtype=np.int8)
+    squares = agent.choose_moves(boards, boards == 0)
+    assert (boards[np.arange(len(boards)), squares] == EMPTY_CELL).all()
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ReinforcementAgent
+from tictactoe.board import Board, Symbol
+from tictactoe.model_registry import ModelRegistry
+from tictactoe.solver import iter_positions, play, position_key, side_to_move, terminal_value
+from tictactoe.tablebase import Tablebase, build_tablebase
+from tictactoe.tabular_policy import CHILDREN, IS_TERMINAL, TabularPolicy, absolute_indices
+from tictactoe.training.tabular_trainer import TabularTrainer
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    """Fixture to build the tablebase once for the whole module."""
+    path = str(tmp_path_factory.mktemp("tablebase") / "tablebase.bin")
+    build_tablebase(path)
+    return Tablebase(path)
+
+
+@pytest.fixture(scope="module")
+def trainer(tablebase):
+    """Fixture to train a tabular policy once for the whole module."""
+    trainer = TabularTrainer(num_games=1024, seed=0)
+    trainer.evaluations = trainer.train(1_000_000, tablebase, eval_every=50_000, eval_games=2_000)
+    return trainer
+
+
+def test_position_tables():
+    """Test the precomputed moves and game ends of every reachable position against the solver rules."""
+    for cells in iter_positions():
+        key = position_key(cells)
+        assert IS_TERMINAL[key] == (terminal_value(cells) is not None)
+        for square in range(9):
+            if IS_TERMINAL[key] or cells[square] != 0:
+                assert CHILDREN[key, square] == -1
+            else:
+                assert CHILDREN[key, square] == position_key(play(cells, square, side_to_move(cells)))
+
+
+def test_converges_to_perfect_play(trainer):
+    """Test that self-play reaches the tablebase's best move everywhere, never losing to perfect play."""
+    final = trainer.evaluations[-1]
+    assert final.accuracy == 1.0
+    assert final.perfect_results[2] == 0
+    assert final.random_results[2] == 0
+    assert final.random_results[0] > 0.8
+    assert trainer.games_played < 1_000_000
+
+
+def test_both_observation_encodings():
+    """Test that boards encoded with X = 1 or from the side to move reach the same rank."""
+    cells = (1, -1, 1, 0, 0, 0, 0, 0, 0)  # O to move
+    own_pieces = tuple(-cell for cell in cells)
+    assert absolute_indices(np.array([cells, own_pieces])).tolist() == [position_key(cells)] * 2
+
+
+def test_reinforcement_agent_loads_tabular_policy(trainer, tmp_path):
+    """Test that the exported values are a ReinforcementAgent model, playing legal moves."""
+    path = str(tmp_path / "tabular.npy")
+    TabularPolicy(trainer.values).save(path)
+    agent = ReinforcementAgent(model_path=path, backend=InferenceBackend.TABULAR, model_registry=ModelRegistry())
+    agent.seed(0)
+    agent.symbol = Symbol.X
+    assert isinstance(agent.model, TabularPolicy)
+
+    board = Board()
+    assert board.is_move_valid(agent.choose_move(board))
+    boards = np.array([cells for cells in iter_positions() if terminal_value(cells) is None], dtype=np.int8)
+    mask = boards == 0
+    squares = agent.choose_moves(boards, mask)
+    assert mask[np.arange(len(squares)), squares].all()
+    assert agent.fallback_moves == 0
+
+    probabilities = agent.action_probabilities(boards, mask)
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+    assert (probabilities[~mask] == 0).all()
+
+
+def test_invalid_values_shape():
+    """Test that a file of the wrong size is rejected."""
+    with pytest.raises(ValueError):
+        TabularPolicy(np.zeros(9))
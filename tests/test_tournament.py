@@ -0,0 +1,36 @@
+import pytest
+
+from tictactoe.agents_collection.minimax_agent import MinimaxAgent
+from tictactoe.agents_collection.random_agent import RandomAgent
+from tictactoe.game import Game
+from tictactoe.player import HumanPlayer
+from tictactoe.tournament import run_tournament
+
+
+def test_results_do_not_depend_on_workers():
+    """Test that a master seed gives the same results with 1 or 2 workers."""
+    results = [
+        run_tournament(RandomAgent(), RandomAgent(), 500, num_workers, seed=7, chunk_size=50)[0]
+        for num_workers in (1, 2)
+    ]
+    assert results[0] == results[1]
+    assert sum(results[0].values()) == 500
+
+
+def test_seed_changes_results():
+    """Test that different master seeds give different games."""
+    first, _ = run_tournament(RandomAgent(), RandomAgent(), 500, seed=1)
+    second, _ = run_tournament(RandomAgent(), RandomAgent(), 500, seed=2)
+    assert first != second
+
+
+def test_minimax_never_loses():
+    """Test that the minimax agent never loses a tournament game."""
+    stats, _ = run_tournament(MinimaxAgent(), RandomAgent(), 300, seed=3)
+    assert stats[Game.Winner.PLAYER_B] == 0
+
+
+def test_humans_are_rejected():
+    """Test that tournaments refuse human players."""
+    with pytest.raises(ValueError):
+        run_tournament(HumanPlayer("Player A"), RandomAgent(), 10)
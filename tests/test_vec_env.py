@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from tictactoe.training.opponent_pool import OpponentPool
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+
+class FirstEmptySquare:
+    """Opponent always playing the first empty square."""
+
+    def predict(self, observation, deterministic=True):
+        return (np.asarray(observation) == 0).argmax(axis=1), None
+
+
+@pytest.fixture
+def env(tmp_path):
+    """Fixture to provide a vectorized env without checkpoints to play against."""
+    env = TicTacToeVecEnv(2, opponent_pool=OpponentPool(models_dir=str(tmp_path)))
+    env.set_opponent(FirstEmptySquare())
+    env.reset()
+    return env
+
+
+def test_agent_win_resets_board(env):
+    """Test that a winning move is rewarded, ends the episode and resets the board."""
+    # Agent plays the middle column, the opponent fills the top row from the left
+    for action in (4, 1):
+        obs, rewards, dones, _ = env.step(np.array([action, action]))
+        assert not dones.any()
+    obs, rewards, dones, infos = env.step(np.array([7, 7]))
+    assert dones.all()
+    assert (rewards == 10).all()
+    assert (obs == 0).all()
+    assert infos[0]["terminal_observation"].tolist() == [-1, 1, -1, 0, 1, 0, 0, 1, 0]
+
+
+def test_opponent_win(env):
+    """Test that the opponent completing a line ends the episode with a loss."""
+    for action in (8, 7):
+        env.step(np.array([action, action]))
+    obs, rewards, dones, _ = env.step(np.array([5, 5]))
+    assert dones.all()
+    assert (rewards == -10).all()
+
+
+def test_illegal_action_is_replaced(env):
+    """Test that playing an occupied square plays a random empty one instead."""
+    env.step(np.array([4, 4]))
+    obs, _, _, _ = env.step(np.array([4, 4]))
+    assert ((obs == 1).sum(axis=1) == 2).all()
+    assert ((obs == -1).sum(axis=1) == 2).all()
+    assert env.illegal_actions == 2
+
+
+def test_action_masks_match_empty_squares(env):
+    """Test that the legal action mask of each environment is its empty squares."""
+    obs, _, _, _ = env.step(np.array([4, 0]))
+    assert np.array_equal(env.action_masks(), obs == 0)
+    assert not env.action_masks()[0, 4]
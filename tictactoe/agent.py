@@ -2,14 +2,17 @@ from abc import abstractmethod
 from enum import Enum
 import logging
 
+import numpy as np
+
+from tictactoe.cells import cells_to_board
 from tictactoe.player import Player, PlayerType, Symbol
-from tictactoe.move import MoveType
 
 
 class AgentType(Enum):
     RANDOM = 0
     MINIMAX = 1
     REINFORCEMENT = 2
+    MCTS = 3
 
 
 class Agent(Player):
@@ -18,11 +21,8 @@ class Agent(Player):
         self.agent_type = agent_type
 
     def get_valid_moves(self, board):
-        valid_moves = [
-            move
-            for move in MoveType.all_moves()
-            if board.is_full() is False and board.is_move_valid(move)
-        ]
+        # Shared tuple of the board's empty squares, nothing is allocated
+        valid_moves = board.legal_moves()
 
         if not valid_moves:
             logging.error("No valid moves available for the random player.")
@@ -33,3 +33,18 @@ class Agent(Player):
     @abstractmethod
     def choose_move(self, board):
         pass
+
+    def choose_moves(self, boards, mask):
+        """
+        Choose a move on each board of a batch. Agents override this with a
+        vectorized version, the default calls choose_move board by board.
+        Args:
+            boards (np.ndarray): (N, 9) boards (X = 1, O = -1, empty = 0)
+            mask (np.ndarray): (N, 9) bool, True for legal squares
+        Returns:
+            np.ndarray: (N,) square index (row * 3 + col) played on each board
+        """
+        return np.array(
+            [self.choose_move(cells_to_board(cells)).square for cells in boards],
+            dtype=np.intp,
+        )
@@ -0,0 +1,250 @@
+import math
+import random
+import time
+
+from typing import List, Optional
+
+import numpy as np
+
+from tictactoe.agent import Agent, AgentType
+from tictactoe.bitboard import FULL_MASK, IS_WINNING_MASK
+from tictactoe.board import Symbol
+from tictactoe.cells import O_CELL, X_CELL
+from tictactoe.move import MOVES_BY_EMPTY_MASK, MOVES_BY_SQUARE, MoveType
+
+# Squares of every set of empty squares (a 9-bit mask), for the rollouts
+SQUARES_BY_EMPTY_MASK = tuple(tuple(move.square for move in moves) for moves in MOVES_BY_EMPTY_MASK)
+
+DRAW = 0
+
+# Check the clock once every this many iterations when searching with a time budget
+_CLOCK_INTERVAL = 16
+
+
+class Node:
+    """
+    Position of the search tree, reached by `player` playing `square`.
+    `value` sums the results for `player`: 1 per win, -1 per loss.
+    """
+    __slots__ = (
+        "x_mask", "o_mask", "player", "square", "parent", "children", "visits", "value", "prior", "result",
+    )
+
+    def __init__(
+        self, x_mask: int, o_mask: int, player: int, square: int = None, parent=None, prior: float = 1.0
+    ):
+        self.x_mask = x_mask
+        self.o_mask = o_mask
+        self.player = player
+        self.square = square
+        self.parent = parent
+        self.children: Optional[List["Node"]] = None  # None until expanded
+        self.visits = 0
+        self.value = 0.0
+        self.prior = prior
+        # Winner cell (or DRAW) if the game is over in this position, None otherwise
+        mask = x_mask if player == X_CELL else o_mask
+        if IS_WINNING_MASK[mask]:
+            self.result = player
+        elif x_mask | o_mask == FULL_MASK:
+            self.result = DRAW
+        else:
+            self.result = None
+
+
+class MCTSAgent(Agent):
+    """
+    Monte Carlo Tree Search with UCT selection and random rollouts on bitmasks.
+
+    Each move runs `iterations` searches, or searches for `time_limit`
+    seconds when it is set. The subtree of the position reached is kept for
+    the next move of the game and dropped by `reset`. With a `prior_agent`
+    (a ReinforcementAgent), children are weighted by the PPO policy, mixed
+    with a uniform prior (`prior_weight`), and selected with PUCT instead of UCT.
+    """
+
+    def __init__(
+        self,
+        iterations: int = 1000,
+        time_limit: float = None,
+        exploration: float = math.sqrt(2),
+        prior_agent=None,
+        prior_weight: float = 0.75,
+    ):
+        """
+        Args:
+            iterations (int): Searches per move, when there is no time limit
+            time_limit (float): Search time per move in seconds, overrides iterations
+            exploration (float): Exploration constant of UCT / PUCT
+            prior_agent (ReinforcementAgent): Optional policy used as a prior over the moves
+            prior_weight (float): Share of the policy in the prior, the rest is uniform over the moves
+        """
+        super().__init__(AgentType.MCTS)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.prior_agent = prior_agent
+        self.prior_weight = prior_weight
+        self.rng = random.Random()
+        self.root: Optional[Node] = None
+        self.total_iterations = 0
+        self.total_search_time = 0.0
+
+    @property
+    def iterations_per_sec(self) -> float:
+        """Search speed over every move so far, to size budgets for a latency target."""
+        return self.total_iterations / self.total_search_time if self.total_search_time > 0 else 0.0
+
+    def seed(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def reset(self):
+        self.root = None
+
+    def choose_move(self, board) -> MoveType:
+        """
+        Search from the current position and play the most visited move.
+        """
+        x_mask = o_mask = 0
+        for move in MOVES_BY_SQUARE:
+            symbol = board.get(move)
+            if symbol == Symbol.X:
+                x_mask |= move.bit
+            elif symbol == Symbol.O:
+                o_mask |= move.bit
+        if x_mask | o_mask == FULL_MASK:
+            raise ValueError("No valid moves left, but choose_move() was still called.")
+
+        root = self._find_root(x_mask, o_mask)
+        start_time = time.perf_counter()
+        iterations = self._search(root, start_time)
+        self.total_iterations += iterations
+        self.total_search_time += time.perf_counter() - start_time
+
+        best = max(root.children, key=lambda child: child.visits)
+        # Keep the chosen subtree for the next move of the game
+        best.parent = None
+        self.root = best
+        return MOVES_BY_SQUARE[best.square]
+
+    def _find_root(self, x_mask: int, o_mask: int) -> Node:
+        """The node of the current position in the kept tree, or a new root."""
+        if self.root is not None and self.root.children is not None:
+            for child in self.root.children:
+                if child.x_mask == x_mask and child.o_mask == o_mask:
+                    child.parent = None
+                    return child
+        # The opponent has just played: the node's player is the opponent
+        opponent = O_CELL if self.symbol == Symbol.X else X_CELL
+        return Node(x_mask, o_mask, opponent)
+
+    def _search(self, root: Node, start_time: float) -> int:
+        iterations = 0
+        while True:
+            if self.time_limit is not None:
+                if iterations % _CLOCK_INTERVAL == 0 and time.perf_counter() - start_time >= self.time_limit:
+                    break
+            elif iterations >= self.iterations:
+                break
+
+            node = root
+            # Selection
+            while node.children is not None and node.result is None:
+                node = self._select_child(node)
+            # Expansion
+            if node.result is None:
+                self._expand(node)
+                node = self._select_child(node)
+            # Simulation
+            result = node.result if node.result is not None else self._rollout(node)
+            # Backpropagation
+            while node is not None:
+                node.visits += 1
+                if result != DRAW:
+                    node.value += 1.0 if result == node.player else -1.0
+                node = node.parent
+            iterations += 1
+
+        # At least one iteration so that the root has children to choose from
+        if root.children is None:
+            self._expand(root)
+        return iterations
+
+    def _expand(self, node: Node):
+        player = -node.player
+        squares = SQUARES_BY_EMPTY_MASK[~(node.x_mask | node.o_mask) & FULL_MASK]
+        priors = self._priors(node, squares)
+        children = []
+        for square, prior in zip(squares, priors):
+            bit = 1 << square
+            if player == X_CELL:
+                children.append(Node(node.x_mask | bit, node.o_mask, player, square, node, prior))
+            else:
+                children.append(Node(node.x_mask, node.o_mask | bit, player, square, node, prior))
+        # Unvisited children are tried in random order
+        self.rng.shuffle(children)
+        node.children = children
+
+    def _priors(self, node: Node, squares) -> List[float]:
+        if self.prior_agent is None:
+            return [1.0] * len(squares)
+        # The policy was trained with its own pieces as 1: encode from the side to move
+        to_move = -node.player
+        observation = np.zeros((1, 9), dtype=np.int8)
+        for square in range(9):
+            if node.x_mask >> square & 1:
+                observation[0, square] = X_CELL * to_move
+            elif node.o_mask >> square & 1:
+                observation[0, square] = O_CELL * to_move
+        probabilities = self.prior_agent.action_probabilities(observation, observation == 0)
+        uniform = 1.0 / len(squares)
+        if probabilities is None:
+            return [uniform] * len(squares)
+        # The shipped models were only trained as the first player: their policy is tempered with
+        # a uniform share, so that a confident wrong prior cannot starve the best move of visits
+        weight = self.prior_weight
+        return [weight * float(probabilities[0, square]) + (1 - weight) * uniform for square in squares]
+
+    def _select_child(self, node: Node) -> Node:
+        best, best_score = None, -math.inf
+        if self.prior_agent is None:
+            # UCT, unvisited children first
+            log_visits = math.log(node.visits) if node.visits else 0.0
+            for child in node.children:
+                if child.visits == 0:
+                    return child
+                score = child.value / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+                if score > best_score:
+                    best, best_score = child, score
+        else:
+            # PUCT: the prior replaces the unvisited-first rule
+            sqrt_visits = math.sqrt(node.visits + 1)
+            for child in node.children:
+                mean = child.value / child.visits if child.visits else 0.0
+                score = mean + self.exploration * child.prior * sqrt_visits / (1 + child.visits)
+                if score > best_score:
+                    best, best_score = child, score
+        return best
+
+    def _rollout(self, node: Node) -> int:
+        """Play random moves until the end of the game, return the winner cell or DRAW."""
+        x_mask, o_mask, player = node.x_mask, node.o_mask, node.player
+        rng = self.rng
+        while True:
+            empty = ~(x_mask | o_mask) & FULL_MASK
+            if not empty:
+                return DRAW
+            squares = SQUARES_BY_EMPTY_MASK[empty]
+            bit = 1 << squares[int(rng.random() * len(squares))]
+            player = -player
+            if player == X_CELL:
+                x_mask |= bit
+                if IS_WINNING_MASK[x_mask]:
+                    return X_CELL
+            else:
+                o_mask |= bit
+                if IS_WINNING_MASK[o_mask]:
+                    return O_CELL
+
+    def __str__(self):
+        return "MCTS Agent"
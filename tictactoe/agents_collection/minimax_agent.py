@@ -0,0 +1,88 @@
+import logging
+import os
+
+import numpy as np
+
+from tictactoe.agent import Agent, AgentType
+from tictactoe.move import MOVES_BY_SQUARE, MoveType
+from tictactoe.solver import NO_MOVE, Solver, best_squares, cells_of, load_table, save_table
+from tictactoe.tablebase import Tablebase, build_tablebase
+
+TABLE_PATH = "models/minimax_table.bin"
+
+# Lowest square of every best-moves mask of the tablebase, NO_MOVE for an empty mask
+FIRST_SQUARE = np.array(
+    [(mask & -mask).bit_length() - 1 if mask else NO_MOVE for mask in range(1 << 9)], dtype=np.intp
+)
+
+
+class MinimaxAgent(Agent):
+    """
+    Perfect player backed by a solved table of every canonical position.
+
+    The table is loaded from `table_path` on the first move, or solved and
+    written there if the file does not exist yet. After that, each move is
+    a canonicalization and a dictionary lookup.
+
+    With a `tablebase_path`, moves are read from the memory-mapped tablebase
+    instead (built there if the file does not exist yet): one record read at
+    the board's position_index, and processes share the file's pages.
+    """
+
+    def __init__(self, table_path: str = TABLE_PATH, tablebase_path: str = None):
+        super().__init__(AgentType.MINIMAX)
+        self.table_path = table_path
+        self.table = None
+        self.tablebase_path = tablebase_path
+        self.tablebase = None
+
+    def load_table(self):
+        if self.table is not None:
+            return self.table
+
+        if os.path.exists(self.table_path):
+            try:
+                self.table = load_table(self.table_path)
+                return self.table
+            except (OSError, ValueError) as e:
+                logging.warning(f"Failed to load minimax table from {self.table_path}: {e}")
+
+        self.table = Solver().solve()
+        try:
+            save_table(self.table, self.table_path)
+        except OSError as e:
+            logging.warning(f"Failed to save minimax table to {self.table_path}: {e}")
+        return self.table
+
+    def load_tablebase(self) -> Tablebase:
+        if self.tablebase is None:
+            if not os.path.exists(self.tablebase_path):
+                build_tablebase(self.tablebase_path)
+            self.tablebase = Tablebase(self.tablebase_path)
+        return self.tablebase
+
+    def choose_move(self, board) -> MoveType:
+        """
+        Return a best move of the current position.
+        """
+        if self.tablebase_path is not None:
+            _, best_moves, _ = self.load_tablebase().record(board.position_index)
+            if not best_moves:
+                raise ValueError("No valid moves left, but choose_move() was still called.")
+            return MOVES_BY_SQUARE[FIRST_SQUARE[best_moves]]
+        square, = best_squares(self.load_table(), [cells_of(board)])
+        if square == NO_MOVE:
+            raise ValueError("No valid moves left, but choose_move() was still called.")
+        return MOVES_BY_SQUARE[square]
+
+    def choose_moves(self, boards, mask):
+        """
+        Return a best square for each board of the batch.
+        """
+        if self.tablebase_path is not None:
+            return FIRST_SQUARE[self.load_tablebase().lookup(boards)["best_moves"]]
+        positions = [tuple(cells) for cells in boards.tolist()]
+        return np.array(best_squares(self.load_table(), positions), dtype=np.intp)
+
+    def __str__(self):
+        return "Minimax Agent"
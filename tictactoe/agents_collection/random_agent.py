@@ -1,6 +1,9 @@
 import random
 
+import numpy as np
+
 from tictactoe.agent import Agent, AgentType
+from tictactoe.cells import random_legal_squares
 from tictactoe.move import MoveType
 
 SEED = 42
@@ -8,13 +11,23 @@ SEED = 42
 class RandomAgent(Agent):
     def __init__(self):
         super().__init__(AgentType.RANDOM)
-        random.seed(SEED)
+        self.seed(SEED)
+
+    def seed(self, seed: int):
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
 
     def choose_move(self, board) -> MoveType:
         """
         Return a random move from the list of valid moves.
         """
-        return random.choice(self.get_valid_moves(board))
+        return self.rng.choice(self.get_valid_moves(board))
+
+    def choose_moves(self, boards, mask):
+        """
+        Return a random legal square for each board of the batch.
+        """
+        return random_legal_squares(mask, self.np_rng)
     
     def __str__(self):
         return "Random Agent"
@@ -1,14 +1,14 @@
-import logging
-import os
 import numpy as np
 
 from enum import Enum
 
 from tictactoe.agent import Agent, AgentType
 from tictactoe.board import Symbol
+from tictactoe.cells import SQUARE_MOVES, random_legal_squares
+from tictactoe.model_registry import ModelRegistry, registry
 from tictactoe.move import MoveType
-
-from stable_baselines3 import PPO
+from tictactoe.numpy_policy import select_actions
+from tictactoe.policy_cache import PolicyCache
 
 class ModelDifficulty(Enum):
     EASY = "ppo_tictactoe_easy"
@@ -16,13 +16,96 @@ class ModelDifficulty(Enum):
     HARD = "ppo_tictactoe_hard"
 
 
+# Values exported by train_tabular.py, the model of the TABULAR backend when no model_path is given
+TABULAR_MODEL_PATH = "models/tabular_tictactoe.npy"
+
+
+class InferenceBackend(Enum):
+    """Model file extension used by each inference backend."""
+    SB3 = ".zip"
+    NUMPY = ".npz"  # Weights exported with export_policy.py, no torch needed
+    TABULAR = ".npy"  # Position values learned by train_tabular.py, no torch needed
+
+
 class ReinforcementAgent(Agent):
-    def __init__(self, model_difficulty: ModelDifficulty = ModelDifficulty.HARD):
+    def __init__(
+        self,
+        model_difficulty: ModelDifficulty = ModelDifficulty.HARD,
+        model_path: str = None,
+        model_registry: ModelRegistry = registry,
+        backend: InferenceBackend = InferenceBackend.SB3,
+        deterministic: bool = False,
+        mask_illegal: bool = True,
+        cache: bool = False,
+        precompute_cache: bool = False,
+        symmetric_cache: bool = False,
+        inference_service=None,
+    ):
+        """
+        Args:
+            model_difficulty (ModelDifficulty): Model used when no model_path is given
+            model_path (str): Path to a model file, overrides model_difficulty (TABULAR_MODEL_PATH
+                by default with the TABULAR backend)
+            model_registry (ModelRegistry): Registry the model is loaded from
+            backend (InferenceBackend): SB3 (PPO zip), NUMPY (exported .npz weights) or TABULAR (.npy values)
+            deterministic (bool): Play the most likely action instead of sampling
+            mask_illegal (bool): Mask the logits of occupied squares, so the chosen action is always legal
+            cache (bool): Memoize the model decision of each position (deterministic only)
+            precompute_cache (bool): Fill the cache with every reachable position when the model is loaded
+            symmetric_cache (bool): Share one cache entry between the 8 symmetric images of a position
+                (see PolicyCache), for models trained with symmetry augmentation
+            inference_service (InferenceService): Batch the predictions with those of other concurrent games,
+                made by the service's own agent and model
+        """
         super().__init__(AgentType.REINFORCEMENT)
-        
-        self.model = None
+
+        cache = cache or precompute_cache or symmetric_cache
+        if cache and not deterministic:
+            raise ValueError("Caching decisions requires a deterministic policy.")
+
+        self.rng = np.random.default_rng()
         self.model_difficulty = model_difficulty
-        self.load_model(f"models/{model_difficulty.value}.zip")
+        self.model_registry = model_registry
+        self.backend = backend
+        self.deterministic = deterministic
+        self.mask_illegal = mask_illegal
+        # Moves where the model picked an occupied square and a random one was played instead
+        self.fallback_moves = 0
+        self.policy_cache = PolicyCache(symmetric_cache) if cache else None
+        self.precompute_cache = precompute_cache
+        self.inference_service = inference_service
+        if model_path is None:
+            # The tabular policy is a single table, not one model per difficulty
+            if backend == InferenceBackend.TABULAR:
+                model_path = TABULAR_MODEL_PATH
+            else:
+                model_path = f"models/{model_difficulty.value}{backend.value}"
+        self.load_model(model_path)
+
+    @property
+    def model(self):
+        """
+        The PPO model, fetched from the model registry the first time it is needed.
+        None if the model file could not be loaded.
+        """
+        if self._uses_service:
+            return self.inference_service.agent.model
+        if not self._model_loaded:
+            self._model = self.model_registry.get(self.model_path)
+            self._model_loaded = True
+            if self._model is not None and self.precompute_cache:
+                self.policy_cache.precompute(self._predict_model)
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._model_loaded = True
+
+    @property
+    def _uses_service(self) -> bool:
+        # The service's own agent runs its model itself, going through the service would loop
+        return self.inference_service is not None and self.inference_service.agent is not self
 
     def encode_board(self, board):
         """
@@ -34,7 +117,7 @@ class ReinforcementAgent(Agent):
         """
         encoded_board = np.array(
             [
-                1 if cell == Symbol.X else -1 if cell else 0
+                1 if cell == Symbol.X else -1 if cell == Symbol.O else 0
                 for row in board
                 for cell in row
             ]
@@ -52,40 +135,150 @@ class ReinforcementAgent(Agent):
         if self.model is None:
             # Fall back to random move if model is not loaded
             valid_moves = self.get_valid_moves(board)
-            return np.random.choice(valid_moves)
+            return self.rng.choice(valid_moves)
 
         observation = self.encode_board(board.get_board())
-        action, _ = self.model.predict(observation)
-
-        row, col = divmod(action, 3)
-        move = MoveType((row, col))
+        square, = self.predict_squares(observation, observation == 0)
+        move = SQUARE_MOVES[square]
 
         if board.is_move_valid(move):
             return move
 
         # If predicted move is invalid, choose randomly from valid moves
+        self.fallback_moves += 1
         valid_moves = self.get_valid_moves(board)
         if valid_moves:
-            return np.random.choice(valid_moves)
+            return self.rng.choice(valid_moves)
         else:
             raise ValueError("No valid moves left, but choose_move() was still called.")
     
+    def predict_squares(self, observations, mask):
+        """
+        Run the model on a batch of encoded boards, through the policy cache if enabled.
+        Args:
+            observations (np.ndarray): (N, 9) encoded boards
+            mask (np.ndarray): (N, 9) bool, True for legal squares
+        Returns:
+            np.ndarray: (N,) predicted squares, possibly illegal unless mask_illegal is set
+        """
+        if self._uses_service:
+            return self.inference_service.predict(observations, mask)
+        if self.policy_cache is not None and self.model is not None:
+            return self.policy_cache.lookup(observations, self._predict_model)
+        return self._predict_model(observations, mask)
+
+    def _predict_model(self, observations, mask):
+        if self.backend != InferenceBackend.SB3:
+            actions, _ = self.model.predict(
+                observations,
+                deterministic=self.deterministic,
+                action_masks=mask if self.mask_illegal else None,
+                rng=self.rng,
+            )
+        elif self.mask_illegal:
+            actions = select_actions(self._sb3_logits(observations), mask, self.deterministic, self.rng)
+        else:
+            actions, _ = self.model.predict(observations, deterministic=self.deterministic)
+        return np.asarray(actions, dtype=np.intp)
+
+    def action_probabilities(self, observations, mask):
+        """
+        Policy distribution over the legal squares of each board (e.g. as a search prior).
+        Args:
+            observations (np.ndarray): (N, 9) encoded boards
+            mask (np.ndarray): (N, 9) bool, True for legal squares
+        Returns:
+            np.ndarray: (N, 9) probabilities, 0 on illegal squares; None if the model is not loaded
+        """
+        if self.model is None:
+            return None
+        if self.backend != InferenceBackend.SB3:
+            logits = self.model.logits(observations)
+        else:
+            logits = self._sb3_logits(observations)
+        logits = np.where(mask, logits, -np.inf)
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def _sb3_logits(self, observations):
+        """Action logits of the PPO policy for a batch of encoded boards, in one forward pass."""
+        import torch
+
+        policy = self.model.policy
+        obs_tensor, _ = policy.obs_to_tensor(np.asarray(observations))
+        with torch.no_grad():
+            distribution = policy.get_distribution(obs_tensor)
+        return distribution.distribution.logits.cpu().numpy()
+
+    def choose_moves(self, boards, mask):
+        """
+        Choose a move on each board of a batch with a single forward pass.
+        Args:
+            boards (np.ndarray): (N, 9) boards (X = 1, O = -1, empty = 0)
+            mask (np.ndarray): (N, 9) bool, True for legal squares
+        Returns:
+            np.ndarray: (N,) square index played on each board
+        """
+        if self.model is None:
+            return random_legal_squares(mask, self.rng)
+
+        squares = self.predict_squares(boards, mask)
+
+        # As in choose_move, illegal predictions are replaced by random valid moves
+        illegal = ~mask[np.arange(len(squares)), squares]
+        if illegal.any():
+            self.fallback_moves += int(illegal.sum())
+            squares[illegal] = random_legal_squares(mask[illegal], self.rng)
+        return squares
+
+    def seed(self, seed: int):
+        self.rng = np.random.default_rng(seed)
+        if (
+            self.backend == InferenceBackend.SB3
+            and not self.deterministic
+            and not self.mask_illegal
+            and self.model is not None
+        ):
+            # stable_baselines3 samples actions with the global torch generator. The
+            # model is loaded first since building its network also draws from it.
+            import torch
+
+            torch.manual_seed(seed)
+
+    def __getstate__(self):
+        # Loaded models are not sent to other processes, they reload them lazily
+        state = self.__dict__.copy()
+        state["_model"] = None
+        state["_model_loaded"] = False
+        # The service's worker thread stays in this process: other processes use their own model
+        state["inference_service"] = None
+        return state
+
+    def __copy__(self):
+        # Copies share the loaded model, but not the cached decisions: each copy fills its own cache
+        agent = self.__class__.__new__(self.__class__)
+        agent.__dict__.update(self.__dict__)
+        if self.policy_cache is not None:
+            agent.policy_cache = self.policy_cache.copy()
+        return agent
+
     def load_model(self, path):
         """
-        Load a trained PPO model from a file.
+        Use a trained PPO model from a file.
+        The file is only read when the agent first needs to predict, and is
+        shared with every other agent using the same path. Cached decisions
+        of the previous model are dropped.
         Args:
             path (str): Path to the model file
         """
-        if not os.path.exists(path):
-            logging.warning(f"Model file not found: {path}. Agent will play randomly.")
-            self.model = None  # Use a fallback random policy
-            return
-        
-        try:
-            self.model = PPO.load(path)
-        except Exception as e:
-            logging.error(f"Failed to load PPO model from {path}: {e}")
-            self.model = None  # Ensure the agent doesn't attempt to use an invalid model
+        self.model_path = path
+        self._model = None
+        self._model_loaded = False
+        if self.policy_cache is not None:
+            self.policy_cache.clear()
     
     def __str__(self):
+        if self.backend == InferenceBackend.TABULAR:
+            return "Reinforcement Agent (TABULAR)"
         return f"Reinforcement Agent ({self.model_difficulty.name})"
\ No newline at end of file
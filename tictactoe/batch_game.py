@@ -0,0 +1,65 @@
+from typing import Dict
+
+import numpy as np
+
+from tictactoe.cells import EMPTY_CELL, SYMBOL_CELLS, winning_boards
+from tictactoe.game import Game
+from tictactoe.player import Player
+from tictactoe.player_manager import PlayerManager
+
+
+class BatchGame:
+    """
+    Play many games at once, the boards of all games being a single (N, 9) int8 array.
+
+    Both players must implement `choose_moves(boards, mask)`, returning the
+    square index (row * 3 + col) played on each of the given boards. As in
+    `Game`, symbols are assigned once by a PlayerManager (playerA gets X if
+    shuffle_symbols is False) and X always starts.
+    """
+
+    def __init__(self, playerA: Player, playerB: Player, shuffle_symbols: bool = True):
+        self.playerA = playerA
+        self.playerB = playerB
+        self.player_manager = PlayerManager(playerA, playerB, shuffle_symbols=shuffle_symbols)
+
+    def play(self, num_games: int) -> Dict[Game.Winner, int]:
+        """
+        Play `num_games` games between the two players.
+        Returns:
+            Dict[Game.Winner, int]: Number of games for each result
+        """
+        boards = np.zeros((num_games, 9), dtype=np.int8)
+        winners = np.full(num_games, EMPTY_CELL, dtype=np.int8)
+        live = np.arange(num_games)
+
+        for _ in range(9):
+            if live.size == 0:
+                break
+            player = self.player_manager.current_player
+            cell = SYMBOL_CELLS[player.symbol]
+
+            live_boards = boards[live]
+            mask = live_boards == EMPTY_CELL
+            squares = np.asarray(player.choose_moves(live_boards, mask), dtype=np.intp)
+            if not mask[np.arange(live.size), squares].all():
+                raise ValueError(f"{player} played an illegal move.")
+
+            live_boards[np.arange(live.size), squares] = cell
+            boards[live] = live_boards
+
+            won = winning_boards(live_boards, cell)
+            winners[live[won]] = cell
+            live = live[~won]
+            self.player_manager.switch_player()
+
+        self.player_manager.reset()
+
+        a_cell = SYMBOL_CELLS[self.playerA.symbol]
+        num_a_wins = int(np.count_nonzero(winners == a_cell))
+        num_b_wins = int(np.count_nonzero(winners == -a_cell))
+        return {
+            Game.Winner.DRAW: num_games - num_a_wins - num_b_wins,
+            Game.Winner.PLAYER_A: num_a_wins,
+            Game.Winner.PLAYER_B: num_b_wins,
+        }
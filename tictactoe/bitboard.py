@@ -0,0 +1,134 @@
+from typing import List, Tuple
+
+from tictactoe.board import BoardType, Symbol
+from tictactoe.move import MOVES_BY_EMPTY_MASK, POSITION_WEIGHTS, MoveType
+from tictactoe.zobrist import EMPTY_KEY, O_KEYS, X_KEYS
+
+# Square index of a move is row * 3 + col, bit i of a mask is square i
+SQUARE_BITS = {move: 1 << (move.row * 3 + move.col) for move in MoveType}
+FULL_MASK = 0b111_111_111
+
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),  # Diagonals
+)
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in WIN_LINES)
+
+# For every possible 9-bit mask, whether it contains one of the 8 lines
+IS_WINNING_MASK = tuple(
+    any(mask & line == line for line in WIN_MASKS) for mask in range(FULL_MASK + 1)
+)
+
+# Base-3 rank contribution of every X mask (digit 1) and O mask (digit 2)
+X_POSITION_INDEX = tuple(sum(POSITION_WEIGHTS[i] for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1))
+O_POSITION_INDEX = tuple(2 * index for index in X_POSITION_INDEX)
+
+
+class BitBoard:
+    """
+    Board engine storing one 9-bit integer mask per player.
+
+    It exposes the same API as `tictactoe.board.Board` and can be used
+    wherever a Board is expected.
+    """
+
+    def __init__(self):
+        self.x_mask = 0
+        self.o_mask = 0
+        # Same Zobrist hash as Board for the same position
+        self.zobrist_key = EMPTY_KEY
+        self.move_stack: List[Tuple[MoveType, Symbol]] = []
+
+    def __str__(self) -> str:
+        row_sep = "-------"
+        board_string = f"{row_sep}\n"
+        for row in self.get_board():
+            board_string += "|".join([""] + [str(cell) for cell in row] + [""]) + "\n"
+            board_string += f"{row_sep}\n"
+        return board_string
+
+    def get_board(self) -> BoardType:
+        return [[self.get(MoveType((row, col))) for col in range(3)] for row in range(3)]
+
+    def get(self, move: MoveType) -> Symbol:
+        bit = SQUARE_BITS[move]
+        if self.x_mask & bit:
+            return Symbol.X
+        if self.o_mask & bit:
+            return Symbol.O
+        return Symbol.EMPTY
+
+    def set_move(self, move: MoveType, symbol: Symbol):
+        bit = SQUARE_BITS[move]
+        square = move.square
+        if self.x_mask & bit:
+            self.zobrist_key ^= X_KEYS[square]
+        elif self.o_mask & bit:
+            self.zobrist_key ^= O_KEYS[square]
+        self.x_mask &= ~bit
+        self.o_mask &= ~bit
+        if symbol == Symbol.X:
+            self.x_mask |= bit
+            self.zobrist_key ^= X_KEYS[square]
+        elif symbol == Symbol.O:
+            self.o_mask |= bit
+            self.zobrist_key ^= O_KEYS[square]
+
+    def undo_move(self, move: MoveType):
+        self.set_move(move, Symbol.EMPTY)
+
+    def push(self, move: MoveType, symbol: Symbol):
+        self.move_stack.append((move, self.get(move)))
+        self.set_move(move, symbol)
+
+    def pop(self) -> MoveType:
+        move, previous = self.move_stack.pop()
+        self.set_move(move, previous)
+        return move
+
+    @property
+    def position_index(self) -> int:
+        """Same dense base-3 rank as Board.position_index, from two table lookups."""
+        return X_POSITION_INDEX[self.x_mask] + O_POSITION_INDEX[self.o_mask]
+
+    def copy(self) -> "BitBoard":
+        clone = self.__class__.__new__(self.__class__)
+        clone.x_mask = self.x_mask
+        clone.o_mask = self.o_mask
+        clone.zobrist_key = self.zobrist_key
+        clone.move_stack = self.move_stack[:]
+        return clone
+
+    def reset(self):
+        self.x_mask = 0
+        self.o_mask = 0
+        self.zobrist_key = EMPTY_KEY
+        self.move_stack = []
+
+    def has_winner(self) -> Tuple[bool, Symbol]:
+        """
+        Returns:
+        - bool: True if there is a winner, False otherwise
+        - Symbol: the winner if there is one, Symbol.EMPTY otherwise
+        """
+        if IS_WINNING_MASK[self.x_mask]:
+            return True, Symbol.X
+        if IS_WINNING_MASK[self.o_mask]:
+            return True, Symbol.O
+        return False, Symbol.EMPTY
+
+    def is_full(self) -> bool:
+        return self.x_mask | self.o_mask == FULL_MASK
+
+    def is_draw(self) -> bool:
+        win, _ = self.has_winner()
+        return not win and self.is_full()
+
+    def is_move_valid(self, move: MoveType) -> bool:
+        bit = SQUARE_BITS.get(move)
+        return bit is not None and not (self.x_mask | self.o_mask) & bit
+
+    def legal_moves(self) -> Tuple[MoveType, ...]:
+        """Moves whose square is still empty, in square order."""
+        return MOVES_BY_EMPTY_MASK[~(self.x_mask | self.o_mask) & FULL_MASK]
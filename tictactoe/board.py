@@ -1,7 +1,8 @@
 from enum import Enum
 from typing import List, Tuple
 
-from tictactoe.move import MoveType
+from tictactoe.move import FULL_SQUARE_MASK, LINES_THROUGH_SQUARE, MOVES_BY_EMPTY_MASK, POSITION_WEIGHTS, MoveType
+from tictactoe.zobrist import EMPTY_KEY, O_KEYS, X_KEYS
 
 
 class Symbol(Enum):
@@ -16,10 +17,28 @@ class Symbol(Enum):
 BoardType = List[List[Symbol]]
 Coordinates = Tuple[int, int]
 
+# Digit of each symbol in the base-3 rank of a position
+POSITION_DIGITS = {Symbol.X: 1, Symbol.O: 2, Symbol.EMPTY: 0}
+
+# Lines of WIN_LINE_MOVES in the order has_winner reports them: row i, column i, then diagonals
+_WIN_CHECK_ORDER = (0, 3, 1, 4, 2, 5, 6, 7)
+
 
 class Board:
     def __init__(self):
         self.board: BoardType = [[Symbol.EMPTY for _ in range(3)] for _ in range(3)]
+        # Bit `move.bit` is set while the square of `move` is empty, kept up to date by set_move
+        self.empty_mask = FULL_SQUARE_MASK
+        # Symbols of each player on each line of WIN_LINE_MOVES, and number of lines holding 3
+        self.x_line_counts = [0] * 8
+        self.o_line_counts = [0] * 8
+        self.complete_lines = 0
+        # Zobrist hash of the position, updated by set_move
+        self.zobrist_key = EMPTY_KEY
+        # Dense base-3 rank of the position, from 0 to 3 ** 9 - 1 (index of the tablebase records)
+        self.position_index = 0
+        # (move, symbol it replaced) of each push, undone by pop
+        self.move_stack: List[Tuple[MoveType, Symbol]] = []
 
     def __str__(self) -> str:
         row_sep = "-------"
@@ -36,10 +55,90 @@ class Board:
         return self.board[move.row][move.col]
 
     def set_move(self, move: MoveType, symbol: Symbol):
-        self.board[move.row][move.col] = symbol
+        row = self.board[move.row]
+        previous = row[move.col]
+        if previous == symbol:
+            return
+        row[move.col] = symbol
+        self.position_index += (POSITION_DIGITS[symbol] - POSITION_DIGITS[previous]) * POSITION_WEIGHTS[move.square]
+        # Only the lines through this square can change
+        if previous != Symbol.EMPTY:
+            self._uncount_lines(move, previous)
+        if symbol == Symbol.EMPTY:
+            self.empty_mask |= move.bit
+            return
+        self.empty_mask &= ~move.bit
+        if symbol == Symbol.X:
+            counts = self.x_line_counts
+            self.zobrist_key ^= X_KEYS[move.square]
+        else:
+            counts = self.o_line_counts
+            self.zobrist_key ^= O_KEYS[move.square]
+        for line in LINES_THROUGH_SQUARE[move.square]:
+            counts[line] += 1
+            if counts[line] == 3:
+                self.complete_lines += 1
+
+    def undo_move(self, move: MoveType):
+        """
+        Take back a move, e.g. after exploring it in a search.
+        """
+        self.set_move(move, Symbol.EMPTY)
+
+    def push(self, move: MoveType, symbol: Symbol):
+        """
+        Play a move that `pop` can take back (search agents: make / unmake).
+        """
+        self.move_stack.append((move, self.board[move.row][move.col]))
+        self.set_move(move, symbol)
+
+    def pop(self) -> MoveType:
+        """
+        Take back the last pushed move, restoring the square and the hash.
+        Returns:
+            MoveType: The move taken back
+        """
+        move, previous = self.move_stack.pop()
+        self.set_move(move, previous)
+        return move
+
+    def copy(self) -> "Board":
+        """
+        Independent copy of the board (position, counts, hash and move stack),
+        cheaper than copy.deepcopy: only the small lists are duplicated.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.board = [row[:] for row in self.board]
+        clone.empty_mask = self.empty_mask
+        clone.x_line_counts = self.x_line_counts[:]
+        clone.o_line_counts = self.o_line_counts[:]
+        clone.complete_lines = self.complete_lines
+        clone.zobrist_key = self.zobrist_key
+        clone.position_index = self.position_index
+        clone.move_stack = self.move_stack[:]
+        return clone
+
+    def _uncount_lines(self, move: MoveType, symbol: Symbol):
+        if symbol == Symbol.X:
+            counts = self.x_line_counts
+            self.zobrist_key ^= X_KEYS[move.square]
+        else:
+            counts = self.o_line_counts
+            self.zobrist_key ^= O_KEYS[move.square]
+        for line in LINES_THROUGH_SQUARE[move.square]:
+            if counts[line] == 3:
+                self.complete_lines -= 1
+            counts[line] -= 1
 
     def reset(self):
         self.board = [[Symbol.EMPTY for _ in range(3)] for _ in range(3)]
+        self.empty_mask = FULL_SQUARE_MASK
+        self.x_line_counts = [0] * 8
+        self.o_line_counts = [0] * 8
+        self.complete_lines = 0
+        self.zobrist_key = EMPTY_KEY
+        self.position_index = 0
+        self.move_stack = []
 
     def has_winner(self) -> Tuple[bool, Symbol]:
         """
@@ -51,30 +150,21 @@ class Board:
         [ ,O, ]    [ ,X, ]
         [ , ,O]    [X, , ])
 
+        The line counts maintained by set_move answer in O(1) while no line is
+        complete, i.e. after every move but the winning one.
+
         Returns:
         - bool: True if there is a winner, False otherwise
         - Player: the winner if there is one, None otherwise
         """
-        # Check rows and columns
-        for i in range(3):
-            if (
-                self.board[i][0] == self.board[i][1] == self.board[i][2]
-                and self.board[i][0] != Symbol.EMPTY
-            ):
-                return True, self.board[i][0]
-            if (
-                self.board[0][i] == self.board[1][i] == self.board[2][i]
-                and self.board[0][i] != Symbol.EMPTY
-            ):
-                return True, self.board[0][i]
-
-        # Check diagonals
-        if self.board[1][1] != Symbol.EMPTY and (
-            (self.board[0][0] == self.board[1][1] == self.board[2][2])
-            or (self.board[0][2] == self.board[1][1] == self.board[2][0])
-        ):
-            return True, self.board[1][1]
-
+        if not self.complete_lines:
+            return False, Symbol.EMPTY
+
+        for line in _WIN_CHECK_ORDER:
+            if self.x_line_counts[line] == 3:
+                return True, Symbol.X
+            if self.o_line_counts[line] == 3:
+                return True, Symbol.O
         return False, Symbol.EMPTY
 
     def is_full(self) -> bool:
@@ -83,7 +173,7 @@ class Board:
         Returns:
         - bool: True if the board is full, False otherwise
         """
-        return all(cell != Symbol.EMPTY for row in self.board for cell in row)
+        return self.empty_mask == 0
 
     def is_draw(self) -> bool:
         """
@@ -104,4 +194,11 @@ class Board:
         Returns:
         - bool: True if the move is valid, False otherwise
         """
-        return move in MoveType.all_moves() and self.get(move) == Symbol.EMPTY
+        return isinstance(move, MoveType) and self.empty_mask & move.bit != 0
+
+    def legal_moves(self) -> Tuple[MoveType, ...]:
+        """
+        Moves whose square is still empty, in square order.
+        The tuple is precomputed for each set of empty squares: nothing is built per call.
+        """
+        return MOVES_BY_EMPTY_MASK[self.empty_mask]
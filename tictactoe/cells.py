@@ -0,0 +1,69 @@
+import numpy as np
+
+from tictactoe.board import Board, Symbol
+from tictactoe.move import MOVES_BY_SQUARE
+
+# Cell values of the batched boards, a board is a row of 9 cells (square = row * 3 + col)
+X_CELL = 1
+O_CELL = -1
+EMPTY_CELL = 0
+
+SYMBOL_CELLS = {Symbol.X: X_CELL, Symbol.O: O_CELL, Symbol.EMPTY: EMPTY_CELL}
+
+WIN_LINES = np.array(
+    [
+        [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+        [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+        [0, 4, 8], [2, 4, 6],  # Diagonals
+    ],
+    dtype=np.intp,
+)
+
+SQUARE_MOVES = MOVES_BY_SQUARE
+
+
+def board_to_cells(board) -> np.ndarray:
+    """
+    Encode a Board as a row of 9 cells (X = 1, O = -1, empty = 0).
+    """
+    return np.array(
+        [SYMBOL_CELLS[cell] for row in board.get_board() for cell in row], dtype=np.int8
+    )
+
+
+def cells_to_board(cells: np.ndarray) -> Board:
+    """
+    Build a Board from a row of 9 cells.
+    """
+    board = Board()
+    for square, cell in enumerate(cells):
+        if cell == X_CELL:
+            board.set_move(SQUARE_MOVES[square], Symbol.X)
+        elif cell == O_CELL:
+            board.set_move(SQUARE_MOVES[square], Symbol.O)
+    return board
+
+
+def random_legal_squares(mask: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw one legal square uniformly at random on each board.
+    Args:
+        mask (np.ndarray): (N, 9) bool, True for legal squares
+        rng (np.random.Generator): random generator
+    Returns:
+        np.ndarray: (N,) square indices
+    """
+    keys = rng.random(mask.shape)
+    keys[~mask] = -1.0
+    return keys.argmax(axis=1)
+
+
+def winning_boards(boards: np.ndarray, cell: int) -> np.ndarray:
+    """
+    Args:
+        boards (np.ndarray): (N, 9) boards
+        cell (int): cell value of the player to check
+    Returns:
+        np.ndarray: (N,) bool, True where the player has a complete line
+    """
+    return (boards[:, WIN_LINES] == cell).all(axis=2).any(axis=1)
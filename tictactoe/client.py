@@ -0,0 +1,161 @@
+import asyncio
+import json
+import random
+import time
+
+from collections import Counter
+from typing import Optional
+
+from tictactoe.instrumentation import LatencyHistogram
+from tictactoe.move import MOVES_BY_SQUARE, MoveType
+from tictactoe.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class GameClient:
+    """
+    Connection to a GameServer, one request / one reply (see the protocol in tictactoe.server).
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> "GameClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, message: dict) -> dict:
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection.")
+        return json.loads(line)
+
+    async def new_match(self, agent: str, symbol: Optional[str] = None) -> dict:
+        message = {"type": "new", "agent": agent}
+        if symbol is not None:
+            message["symbol"] = symbol
+        return await self.request(message)
+
+    async def move(self, move: MoveType) -> dict:
+        return await self.request({"type": "move", "move": move.name})
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def format_board(cells: str) -> str:
+    """Server board string printed like Board.__str__."""
+    row_sep = "-------"
+    board_string = f"{row_sep}\n"
+    for row in range(3):
+        board_string += "|".join([""] + list(cells[row * 3:row * 3 + 3]) + [""]) + "\n"
+        board_string += f"{row_sep}\n"
+    return board_string
+
+
+def random_move(cells: str, rng: random.Random) -> MoveType:
+    return rng.choice([MOVES_BY_SQUARE[square] for square, cell in enumerate(cells) if cell == "."])
+
+
+class LoadgenStats:
+    """Results of run_loadgen: match results, matches/sec and move round-trip latencies."""
+
+    def __init__(self):
+        self.results: Counter = Counter()
+        self.errors = 0
+        self.round_trip = LatencyHistogram()
+        self.elapsed = 0.0
+
+    @property
+    def matches(self) -> int:
+        return sum(self.results.values())
+
+    @property
+    def matches_per_sec(self) -> float:
+        return self.matches / self.elapsed if self.elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        summary = self.round_trip.summary()
+        return "\n".join([
+            f"Matches: {self.matches} in {self.elapsed:.2f}s ({self.matches_per_sec:,.0f} matches/sec), "
+            f"{self.errors} errors",
+            "Client results: " + ", ".join(f"{result} {count}" for result, count in sorted(self.results.items())),
+            f"Move round trip: p50 {summary['p50'] * 1e3:.2f}ms, p95 {summary['p95'] * 1e3:.2f}ms, "
+            f"p99 {summary['p99'] * 1e3:.2f}ms ({summary['count']} moves)",
+        ])
+
+
+async def play_scripted_match(client: GameClient, agent: str, rng: random.Random, stats: LoadgenStats):
+    """Play one match with random moves, timing each move until the server's reply."""
+    reply = await client.new_match(agent)
+    while reply["type"] == "state":
+        move = random_move(reply["board"], rng)
+        start_time = time.perf_counter()
+        reply = await client.move(move)
+        stats.round_trip.add(time.perf_counter() - start_time)
+    if reply["type"] == "end":
+        stats.results[reply["result"]] += 1
+    else:
+        stats.errors += 1
+
+
+async def run_loadgen(
+    agent: str,
+    matches: int,
+    concurrency: int,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    seed: int = None,
+) -> LoadgenStats:
+    """
+    Play `matches` scripted matches against `agent` over `concurrency` connections at once.
+    """
+    stats = LoadgenStats()
+    rng = random.Random(seed)
+    remaining = iter(range(matches))
+
+    async def connection():
+        client = await GameClient.connect(host, port)
+        try:
+            for _ in remaining:
+                await play_scripted_match(client, agent, rng, stats)
+        finally:
+            await client.close()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(min(concurrency, matches))))
+    stats.elapsed = time.perf_counter() - start_time
+    return stats
+
+
+async def play_interactive(
+    agent: str, symbol: Optional[str] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+):
+    """Play one match from the terminal against an agent of the server."""
+    loop = asyncio.get_running_loop()
+    client = await GameClient.connect(host, port)
+    try:
+        reply = await client.new_match(agent, symbol)
+        if reply["type"] == "error":
+            print(reply["message"])
+            return
+        while reply["type"] != "end":
+            if reply["type"] == "error":
+                print(reply["message"])
+            else:
+                print(format_board(reply["board"]))
+                print(f"Your turn (symbol: {reply['symbol']}):")
+            player_input = await loop.run_in_executor(None, input, "Choose your move (e.g. HG, MM, BD): ")
+            move = MoveType.from_str(player_input)
+            if move is None:
+                print("Invalid move. Please try again.")
+                continue
+            reply = await client.move(move)
+        print(format_board(reply["board"]))
+        print({"win": "You won!", "loss": "You lost!", "draw": "It's a draw!"}[reply["result"]])
+    finally:
+        await client.close()
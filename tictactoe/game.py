@@ -0,0 +1,123 @@
+import time
+
+from enum import Enum
+
+from tictactoe.board import Board
+from tictactoe.instrumentation import (
+    AGENT_OPERATIONS,
+    BOARD_OPERATIONS,
+    PLAYER_MANAGER_OPERATIONS,
+    Instrumentation,
+    count_calls,
+    uncount_calls,
+)
+from tictactoe.player import Player, PlayerType
+from tictactoe.player_manager import PlayerManager
+
+class Game:
+    class Winner(Enum):
+        DRAW = "draw"
+        PLAYER_A = "playerA"
+        PLAYER_B = "playerB"
+
+    def __init__(
+        self,
+        board: Board,
+        playerA: Player,
+        playerB: Player,
+        rng=None,
+        recorder=None,
+        instrumentation: Instrumentation = None,
+    ):
+        """
+        Args:
+            recorder (GameRecorder): Optional log receiving the moves, symbols, result and
+                decision latencies of every game played
+            instrumentation (Instrumentation): Optional metrics of the games played (decision
+                latencies, board / player manager / agent call counts, games/sec)
+        """
+        self.board = board
+        self.recorder = recorder
+        self.instrumentation = instrumentation
+        self.playerA = playerA
+        self.playerB = playerB
+        self.player_manager = PlayerManager(playerA, playerB, rng)
+
+        # Players are told apart by slot, two agents of the same kind have the same name
+        self.player_labels = {id(playerA): f"Player A ({playerA})", id(playerB): f"Player B ({playerB})"}
+        self._counted_calls = []
+        if instrumentation is not None:
+            self._counted_calls = [
+                (board, BOARD_OPERATIONS, "Board."),
+                (self.player_manager, PLAYER_MANAGER_OPERATIONS, "PlayerManager."),
+            ]
+            for player in (playerA, playerB):
+                if player.player_type == PlayerType.AGENT:
+                    self._counted_calls.append((player, AGENT_OPERATIONS, f"{self.player_labels[id(player)]}."))
+        
+        if playerA.player_type == PlayerType.HUMAN or playerB.player_type == PlayerType.HUMAN:
+            self.show_board = True
+        else:
+            self.show_board = False
+
+    def play(self) -> Winner:
+        """
+        Play a game between two players.
+        Returns:
+            EndGame: The result of the game from the perspective of the first player.
+        """
+        if self.instrumentation is None:
+            return self._play()
+        # Calls are only counted during the game: the board and agents (possibly shared, or
+        # copied later) get their plain methods back afterwards
+        for obj, method_names, prefix in self._counted_calls:
+            count_calls(obj, method_names, self.instrumentation.operations, prefix)
+        try:
+            return self._play()
+        finally:
+            for obj, method_names, _ in self._counted_calls:
+                uncount_calls(obj, method_names)
+
+    def _play(self) -> Winner:
+        # Moves and decision latencies are only tracked for a recorder or an instrumentation
+        tracked = self.recorder is not None or self.instrumentation is not None
+        moves, latencies = ([], []) if tracked else (None, None)
+        game_start_time = time.perf_counter() if tracked else 0.0
+
+        # Running a game until a win or all moves played
+        while True:
+            player = self.player_manager.current_player
+            print(f"{player} turn (symbol: {player.symbol}):") if self.show_board else None
+            
+            if tracked:
+                start_time = time.perf_counter()
+                move = player.choose_move(self.board)
+                latencies.append(time.perf_counter() - start_time)
+                if self.instrumentation is not None:
+                    self.instrumentation.record_decision(self.player_labels[id(player)], latencies[-1])
+                moves.append(move.square)
+            else:
+                move = player.choose_move(self.board)
+            self.board.set_move(move, player.symbol)
+            
+            print(self.board) if self.show_board else None
+
+            is_won, winner_symbol = self.board.has_winner()
+            if is_won:
+                winner = self.player_manager.get_player_from_symbol(winner_symbol)
+                print(f"{winner} won!") if self.show_board else None
+                result = Game.Winner.PLAYER_A if winner == self.playerA else Game.Winner.PLAYER_B
+                return self._end(result, moves, latencies, game_start_time)
+
+            if self.board.is_full():
+                print("It's a draw!") if self.show_board else None
+                return self._end(Game.Winner.DRAW, moves, latencies, game_start_time)
+            self.player_manager.switch_player()
+
+    def _end(self, result: Winner, moves, latencies, game_start_time: float) -> Winner:
+        if self.instrumentation is not None:
+            self.instrumentation.record_game(time.perf_counter() - game_start_time)
+        if self.recorder is not None:
+            self.recorder.record(moves, self.playerA.symbol, result, latencies)
+        return result
+
@@ -0,0 +1,178 @@
+import math
+import struct
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
+
+from tictactoe.board import Symbol
+from tictactoe.game import Game
+
+LOG_MAGIC = b"TTTG"
+LOG_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+
+_RESULT_CODES = {Game.Winner.DRAW: 0, Game.Winner.PLAYER_A: 1, Game.Winner.PLAYER_B: 2}
+_RESULTS = {code: winner for winner, code in _RESULT_CODES.items()}
+
+# Latencies are stored in one byte on a log scale: 8 steps per doubling
+# (about 9% precision) from 1 microsecond to about an hour
+_LATENCY_STEPS_PER_OCTAVE = 8
+_MAX_LATENCY_CODE = 255
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _encode_latency(seconds: float) -> int:
+    code = round(_LATENCY_STEPS_PER_OCTAVE * math.log2(1.0 + seconds * 1e6))
+    return min(code, _MAX_LATENCY_CODE)
+
+
+def _decode_latency(code: int) -> float:
+    return (2.0 ** (code / _LATENCY_STEPS_PER_OCTAVE) - 1.0) / 1e6
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """
+    One recorded game.
+    Attributes:
+        moves (Tuple[int, ...]): Squares played (row * 3 + col), X first
+        player_a_symbol (Symbol): Symbol assigned to player A by the PlayerManager
+        winner (Game.Winner): Result of the game
+        latencies (Tuple[float, ...]): Decision time of each move, in seconds (about 9% precision)
+    """
+    moves: Tuple[int, ...]
+    player_a_symbol: Symbol
+    winner: Game.Winner
+    latencies: Tuple[float, ...]
+
+    @property
+    def size(self) -> int:
+        """Bytes taken by the record in a log."""
+        return _record_size(len(self.moves))
+
+
+def _record_size(num_moves: int) -> int:
+    # Flags byte, two moves per byte, one byte per latency
+    return 1 + (num_moves + 1) // 2 + num_moves
+
+
+def encode_record(
+    moves: Sequence[int], player_a_symbol: Symbol, winner: Game.Winner, latencies: Sequence[float]
+) -> bytes:
+    """
+    Pack a game in at most 15 bytes:
+    - flags: result (bits 0-1), player A plays X (bit 2), number of moves (bits 4-7)
+    - the squares, two 4-bit squares per byte
+    - the decision latency of each move, one log-scale byte each
+    """
+    num_moves = len(moves)
+    if num_moves > 9 or len(latencies) != num_moves:
+        raise ValueError(f"Invalid game record: {num_moves} moves, {len(latencies)} latencies")
+    flags = _RESULT_CODES[winner] | (player_a_symbol == Symbol.X) << 2 | num_moves << 4
+    packed = bytearray([flags])
+    for i in range(0, num_moves, 2):
+        packed.append(moves[i] | (moves[i + 1] << 4 if i + 1 < num_moves else 0))
+    packed.extend(_encode_latency(latency) for latency in latencies)
+    return bytes(packed)
+
+
+def _decode_record(data, offset: int) -> GameRecord:
+    flags = data[offset]
+    num_moves = flags >> 4
+    moves = []
+    for byte in data[offset + 1:offset + 1 + (num_moves + 1) // 2]:
+        moves.append(byte & 0x0F)
+        moves.append(byte >> 4)
+    latency_offset = offset + 1 + (num_moves + 1) // 2
+    latencies = data[latency_offset:latency_offset + num_moves]
+    return GameRecord(
+        moves=tuple(moves[:num_moves]),
+        player_a_symbol=Symbol.X if flags & 0b100 else Symbol.O,
+        winner=_RESULTS[flags & 0b11],
+        latencies=tuple(_decode_latency(code) for code in latencies),
+    )
+
+
+class GameRecorder:
+    """
+    Append-only binary log of played games, given to `Game(recorder=...)`.
+
+    Records are accumulated in memory and written in batches of
+    `buffer_size` bytes; call `close` (or use the recorder as a context
+    manager) to write the last batch. Games are appended to an existing log.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.games = 0
+        self._buffer = bytearray()
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+
+    def record(
+        self, moves: Sequence[int], player_a_symbol: Symbol, winner: Game.Winner, latencies: Sequence[float]
+    ):
+        self._buffer += encode_record(moves, player_a_symbol, winner, latencies)
+        self.games += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    """
+    Stream the games of a log, reading it chunk by chunk.
+    A truncated last record (interrupted write) is ignored.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header) != (LOG_MAGIC, LOG_VERSION):
+            raise ValueError(f"{path} is not a version {LOG_VERSION} game log.")
+
+        pending = b""
+        while True:
+            chunk = f.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            # A record may straddle two chunks: its start is kept for the next one
+            data = pending + chunk
+            offset = 0
+            while offset < len(data):
+                size = _record_size(data[offset] >> 4)
+                if offset + size > len(data):
+                    break
+                yield _decode_record(data, offset)
+                offset += size
+            pending = data[offset:]
+
+
+def opening_stats(records: Iterable[GameRecord]) -> Dict[Tuple[Symbol, int], Counter]:
+    """
+    Results by symbol of player A and opening square, e.g. to find the
+    openings a player loses with.
+    """
+    stats: Dict[Tuple[Symbol, int], Counter] = {}
+    for record in records:
+        if record.moves:
+            stats.setdefault((record.player_a_symbol, record.moves[0]), Counter())[record.winner] += 1
+    return stats
@@ -0,0 +1,181 @@
+import asyncio
+import queue
+import threading
+import time
+
+from collections import Counter
+from concurrent.futures import Future
+from typing import List, NamedTuple
+
+import numpy as np
+
+from tictactoe.instrumentation import LatencyHistogram
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT = 0.002  # Seconds a request may wait for others to join its batch
+
+
+class _Request(NamedTuple):
+    observations: np.ndarray
+    mask: np.ndarray
+    future: Future
+    submit_time: float
+
+
+class InferenceService:
+    """
+    Micro-batching in front of one ReinforcementAgent's model, for many games
+    played concurrently in threads or asyncio tasks.
+
+    Requests are queued and a worker thread runs them as one batched forward
+    pass once `max_batch_size` boards are waiting, or `max_wait` seconds after
+    the oldest one was queued. Agents built with `inference_service=service`
+    go through it transparently; `predict` (threads) and `predict_async`
+    (asyncio) can also be called directly.
+    """
+
+    def __init__(self, agent, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT):
+        """
+        Args:
+            agent (ReinforcementAgent): Agent whose model answers every request
+            max_batch_size (int): Boards of a batch that flushes it without waiting
+            max_wait (float): Deadline in seconds after which a partial batch is flushed
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if getattr(agent, "inference_service", None) is not None:
+            raise ValueError("The agent of an inference service must run its model itself, not through a service.")
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._pending = None  # Request taken from the queue that did not fit in the last batch
+        self._closed = False
+        # Metrics
+        self.batch_sizes: Counter = Counter()
+        self.queue_latency = LatencyHistogram()  # Added by batching: from submit to the forward pass
+        self.inference_latency = LatencyHistogram()  # Forward pass of each batch
+        self.max_queue_depth = 0
+        self._thread = threading.Thread(target=self._run, name="inference-service", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a batch right now."""
+        return self._queue.qsize()
+
+    def submit(self, observations: np.ndarray, mask: np.ndarray) -> Future:
+        """
+        Queue a batch of encoded boards.
+        Returns:
+            Future: Resolves to the (N,) squares chosen by the model
+        """
+        if self._closed:
+            raise RuntimeError("The inference service is closed.")
+        future = Future()
+        self._queue.put(_Request(np.asarray(observations), np.asarray(mask), future, time.perf_counter()))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    def predict(self, observations: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Blocking `submit`, for games played in threads."""
+        return self.submit(observations, mask).result()
+
+    async def predict_async(self, observations: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """`submit` awaited from an asyncio task, without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(observations, mask))
+
+    def close(self):
+        """Flush the queued requests and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+            if self._closed and self._pending is None and self._queue.empty():
+                return
+
+    def _collect(self) -> List[_Request]:
+        """Block for a first request, then gather more until the batch is full or its deadline passes."""
+        first = self._pending if self._pending is not None else self._queue.get()
+        self._pending = None
+        if first is None:
+            return []
+        batch, size = [first], len(first.observations)
+        deadline = first.submit_time + self.max_wait
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                break
+            if size + len(request.observations) > self.max_batch_size:
+                self._pending = request
+                break
+            batch.append(request)
+            size += len(request.observations)
+        return batch
+
+    def _flush(self, batch: List[_Request]):
+        start_time = time.perf_counter()
+        for request in batch:
+            self.queue_latency.add(start_time - request.submit_time)
+        try:
+            if len(batch) == 1:
+                squares = self.agent.predict_squares(batch[0].observations, batch[0].mask)
+            else:
+                squares = self.agent.predict_squares(
+                    np.concatenate([request.observations for request in batch]),
+                    np.concatenate([request.mask for request in batch]),
+                )
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        self.inference_latency.add(time.perf_counter() - start_time)
+        self.batch_sizes[len(squares)] += 1
+
+        offset = 0
+        for request in batch:
+            count = len(request.observations)
+            request.future.set_result(squares[offset:offset + count])
+            offset += count
+
+    def to_dict(self) -> dict:
+        batches = sum(self.batch_sizes.values())
+        boards = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            "batches": batches,
+            "mean_batch_size": boards / batches if batches else 0.0,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_latency": self.queue_latency.summary(),
+            "inference_latency": self.inference_latency.summary(),
+        }
+
+    def report(self) -> str:
+        metrics = self.to_dict()
+        queue_latency, inference_latency = metrics["queue_latency"], metrics["inference_latency"]
+        return "\n".join([
+            "Inference service:",
+            f"Batches: {metrics['batches']}, mean size {metrics['mean_batch_size']:.1f}, "
+            f"max queue depth {metrics['max_queue_depth']}",
+            f"Added latency: p50 {queue_latency['p50'] * 1e6:.1f}us, p95 {queue_latency['p95'] * 1e6:.1f}us, "
+            f"p99 {queue_latency['p99'] * 1e6:.1f}us",
+            f"Forward pass: p50 {inference_latency['p50'] * 1e6:.1f}us, p95 {inference_latency['p95'] * 1e6:.1f}us",
+        ])
@@ -0,0 +1,125 @@
+import json
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterable
+
+import numpy as np
+
+# Methods counted by `count_calls` while an instrumented Game is playing
+BOARD_OPERATIONS = ("get", "set_move", "has_winner", "is_full", "is_move_valid")
+PLAYER_MANAGER_OPERATIONS = ("switch_player", "get_player_from_symbol")
+AGENT_OPERATIONS = ("get_valid_moves",)
+
+
+class LatencyHistogram:
+    """Latency samples of one kind of call, summarized by percentiles."""
+
+    def __init__(self):
+        self.samples = array("d")
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """q-th percentile in seconds, 0 when there is no sample."""
+        if not self.samples:
+            return 0.0
+        return float(np.percentile(np.frombuffer(self.samples, dtype=np.float64), q))
+
+    def summary(self) -> Dict[str, float]:
+        count = len(self.samples)
+        return {
+            "count": count,
+            "mean": sum(self.samples) / count if count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+def count_calls(obj, method_names: Iterable[str], counter: Counter, prefix: str = ""):
+    """
+    Count the calls of some methods of one object, in `counter[prefix + name]`.
+    The wrappers are set on the instance only, so other objects of the class
+    (and the object itself once `uncount_calls` is called) run at full speed.
+    They call the methods bound to `obj`: remove them before copying it.
+    """
+    # Counting twice would wrap the wrappers
+    uncount_calls(obj, method_names)
+    for name in method_names:
+        method = getattr(obj, name)
+        key = prefix + name
+
+        def counted(*args, _method=method, _key=key, **kwargs):
+            counter[_key] += 1
+            return _method(*args, **kwargs)
+
+        setattr(obj, name, counted)
+
+
+def uncount_calls(obj, method_names: Iterable[str]):
+    for name in method_names:
+        obj.__dict__.pop(name, None)
+
+
+class Instrumentation:
+    """
+    Opt-in metrics of the games played by a Game (`Game(instrumentation=...)`):
+    decision latency of each player, Board and PlayerManager call counts, and
+    games/sec. Without an Instrumentation, a Game runs no extra code but the
+    `is None` checks.
+    """
+
+    def __init__(self):
+        self.decision_latencies: Dict[str, LatencyHistogram] = {}
+        self.operations: Counter = Counter()
+        self.games = 0
+        self.game_time = 0.0
+
+    def record_decision(self, name: str, seconds: float):
+        """Latency of one move of the player `name` (its slot in the game, see Game.player_labels)."""
+        if name not in self.decision_latencies:
+            self.decision_latencies[name] = LatencyHistogram()
+        self.decision_latencies[name].add(seconds)
+
+    def record_game(self, seconds: float):
+        self.games += 1
+        self.game_time += seconds
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.game_time if self.game_time > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "game_time": self.game_time,
+            "games_per_sec": self.games_per_sec,
+            "decision_latency": {name: hist.summary() for name, hist in self.decision_latencies.items()},
+            "operations": dict(sorted(self.operations.items())),
+        }
+
+    def save_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self) -> str:
+        lines = [
+            "Instrumentation:",
+            f"Games/sec: {self.games_per_sec:,.0f} ({self.games} games in {self.game_time:.2f}s)",
+        ]
+        for name, hist in self.decision_latencies.items():
+            summary = hist.summary()
+            lines.append(
+                f"{name} decision latency: p50 {summary['p50'] * 1e6:.1f}us, "
+                f"p95 {summary['p95'] * 1e6:.1f}us, p99 {summary['p99'] * 1e6:.1f}us ({summary['count']} moves)"
+            )
+        if self.operations:
+            per_game = max(self.games, 1)
+            calls = (f"{name} {count / per_game:.1f}" for name, count in sorted(self.operations.items()))
+            lines.append("Calls per game: " + ", ".join(calls))
+        return "\n".join(lines)
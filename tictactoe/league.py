@@ -0,0 +1,287 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import permutations
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe.agent import Agent, AgentType
+from tictactoe.batch_game import BatchGame
+from tictactoe.game import Game
+
+MODELS_DIR = "models"
+CACHE_PATH = "league_results.json"
+
+INITIAL_ELO = 1500.0
+
+# (wins of the X player, draws, wins of the O player)
+PairingResult = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """
+    Picklable description of a league agent, built in the worker that plays it.
+    """
+    name: str
+    agent_type: AgentType
+    model_path: Optional[str] = None
+
+    def build(self) -> Agent:
+        if self.agent_type == AgentType.RANDOM:
+            from tictactoe.agents_collection.random_agent import RandomAgent
+
+            return RandomAgent()
+        if self.agent_type == AgentType.MINIMAX:
+            from tictactoe.agents_collection.minimax_agent import MinimaxAgent
+
+            return MinimaxAgent()
+        if self.agent_type == AgentType.MCTS:
+            from tictactoe.agents_collection.mcts_agent import MCTSAgent
+
+            return MCTSAgent()
+        if self.agent_type == AgentType.REINFORCEMENT:
+            from tictactoe.agents_collection.reinforcement_agent import InferenceBackend, ReinforcementAgent
+
+            # The backend follows the model file: PPO zip, exported .npz weights or tabular .npy values
+            backend = next(
+                (backend for backend in InferenceBackend if self.model_path.endswith(backend.value)),
+                InferenceBackend.SB3,
+            )
+            return ReinforcementAgent(model_path=self.model_path, backend=backend)
+        raise ValueError(f"Unsupported agent type in league: {self.agent_type}")
+
+
+def _natural_key(filename: str):
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", filename)]
+
+
+def discover_agents(models_dir: str = MODELS_DIR) -> List[AgentSpec]:
+    """
+    Every agent of the league: the random, minimax and MCTS agents, the three
+    ModelDifficulty models and the tabular policy, then every other PPO zip of
+    `models_dir` (ppo_tictactoe_batch_N checkpoints, final model, ...).
+    """
+    from tictactoe.agents_collection.reinforcement_agent import TABULAR_MODEL_PATH, ModelDifficulty
+
+    agents = [
+        AgentSpec("Random", AgentType.RANDOM),
+        AgentSpec("Minimax", AgentType.MINIMAX),
+        AgentSpec("MCTS", AgentType.MCTS),
+    ]
+    known = set()
+    for difficulty in ModelDifficulty:
+        path = os.path.join(models_dir, f"{difficulty.value}.zip")
+        if os.path.exists(path):
+            agents.append(AgentSpec(f"RL {difficulty.name}", AgentType.REINFORCEMENT, path))
+            known.add(path)
+    tabular_path = os.path.join(models_dir, os.path.basename(TABULAR_MODEL_PATH))
+    if os.path.exists(tabular_path):
+        agents.append(AgentSpec("RL TABULAR", AgentType.REINFORCEMENT, tabular_path))
+
+    if os.path.isdir(models_dir):
+        for filename in sorted(os.listdir(models_dir), key=_natural_key):
+            path = os.path.join(models_dir, filename)
+            if filename.endswith(".zip") and path not in known:
+                agents.append(AgentSpec(filename[:-len(".zip")], AgentType.REINFORCEMENT, path))
+    return agents
+
+
+_file_hashes: Dict[str, str] = {}
+
+
+def fingerprint(spec: AgentSpec) -> str:
+    """
+    Identity of an agent for the result cache: its name, plus the hash of its
+    model file so that a retrained model is played again.
+    """
+    if spec.model_path is None:
+        return spec.name
+    if spec.model_path not in _file_hashes:
+        with open(spec.model_path, "rb") as f:
+            _file_hashes[spec.model_path] = hashlib.sha256(f.read()).hexdigest()[:16]
+    return f"{spec.name}@{_file_hashes[spec.model_path]}"
+
+
+def _play_pairing(task: Tuple[AgentSpec, AgentSpec, int, int]) -> PairingResult:
+    x_spec, o_spec, num_games, seed = task
+    x_player, o_player = x_spec.build(), o_spec.build()
+    x_player.seed(seed)
+    o_player.seed(seed + 1)
+    stats = BatchGame(x_player, o_player, shuffle_symbols=False).play(num_games)
+    return stats[Game.Winner.PLAYER_A], stats[Game.Winner.DRAW], stats[Game.Winner.PLAYER_B]
+
+
+def compute_elo(
+    results: Dict[Tuple[str, str], PairingResult],
+    virtual_draws: float = 0.5,
+    tolerance: float = 1e-6,
+    max_iterations: int = 10_000,
+) -> Dict[str, float]:
+    """
+    Elo ratings fitted to the results of every pairing, draws counting as
+    half a win: the ratings whose expected scores add up to each agent's
+    observed score (the order of the games does not matter).
+
+    `virtual_draws` are added to every pairing, so that a 100% (or 0%) score
+    still gives a finite rating gap. The fit runs minorization-maximization
+    updates of the Bradley-Terry strengths (10 ** (rating / 400)) until no
+    rating moves by more than `tolerance` Elo points.
+    """
+    if virtual_draws <= 0:
+        raise ValueError("virtual_draws must be positive, a perfect score has no finite rating.")
+    scores: Dict[str, float] = {}
+    pairings = []
+    for (x_name, o_name), (x_wins, draws, o_wins) in results.items():
+        scores.setdefault(x_name, 0.0)
+        scores.setdefault(o_name, 0.0)
+        num_games = x_wins + draws + o_wins
+        if num_games == 0:
+            continue
+        x_score = (x_wins + 0.5 * (draws + virtual_draws)) / (num_games + virtual_draws)
+        scores[x_name] += x_score
+        scores[o_name] += 1.0 - x_score
+        pairings.append((x_name, o_name))
+
+    strengths = dict.fromkeys(scores, 1.0)
+    for _ in range(max_iterations):
+        denominators = dict.fromkeys(strengths, 0.0)
+        for x_name, o_name in pairings:
+            inverse = 1.0 / (strengths[x_name] + strengths[o_name])
+            denominators[x_name] += inverse
+            denominators[o_name] += inverse
+        updated = {
+            name: scores[name] / denominators[name] if denominators[name] else strength
+            for name, strength in strengths.items()
+        }
+        # Strengths are only defined up to a factor: keep their geometric mean at 1
+        scale = math.exp(sum(math.log(strength) for strength in updated.values()) / max(len(updated), 1))
+        updated = {name: strength / scale for name, strength in updated.items()}
+        change = max((abs(math.log10(updated[name] / strengths[name])) * 400 for name in strengths), default=0.0)
+        strengths = updated
+        if change < tolerance:
+            break
+
+    ratings = {name: 400 * math.log10(strength) for name, strength in strengths.items()}
+    # Anchor the mean rating so that ratings are comparable between runs
+    offset = INITIAL_ELO - sum(ratings.values()) / max(len(ratings), 1)
+    return {name: rating + offset for name, rating in ratings.items()}
+
+
+class League:
+    """
+    Round-robin league: every agent plays every other one, once with each
+    symbol assignment. Pairing results are cached in a JSON file keyed by the
+    agents' fingerprints, so only games involving new or changed agents are
+    played when the league is run again.
+    """
+
+    def __init__(
+        self,
+        agents: List[AgentSpec],
+        games_per_pairing: int = 1000,
+        seed: int = 0,
+        cache_path: Optional[str] = CACHE_PATH,
+    ):
+        self.agents = agents
+        self.games_per_pairing = games_per_pairing
+        self.seed = seed
+        self.cache_path = cache_path
+        self.cache: Dict[str, PairingResult] = self._load_cache()
+        self.results: Dict[Tuple[str, str], PairingResult] = {}
+        self.games_played = 0
+
+    def _load_cache(self) -> Dict[str, PairingResult]:
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return {key: tuple(value) for key, value in json.load(f).items()}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable league cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        with open(self.cache_path, "w") as f:
+            json.dump(self.cache, f, indent=1, sort_keys=True)
+
+    def _cache_key(self, x_spec: AgentSpec, o_spec: AgentSpec) -> str:
+        return f"{fingerprint(x_spec)}|{fingerprint(o_spec)}|{self.games_per_pairing}|{self.seed}"
+
+    def run(self, num_workers: int = 1) -> Dict[Tuple[str, str], PairingResult]:
+        """
+        Play the missing pairings, in parallel over `num_workers` processes.
+        Returns:
+            Dict[Tuple[str, str], PairingResult]: Results keyed by (X agent, O agent) names
+        """
+        pairings = list(permutations(self.agents, 2))
+        missing = []
+        for x_spec, o_spec in pairings:
+            key = self._cache_key(x_spec, o_spec)
+            if key not in self.cache:
+                seed = random.Random(f"{self.seed}:{key}").getrandbits(32)
+                missing.append((key, (x_spec, o_spec, self.games_per_pairing, seed)))
+
+        tasks = [task for _, task in missing]
+        if num_workers <= 1:
+            played = [_play_pairing(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                played = list(executor.map(_play_pairing, tasks))
+
+        for (key, _), result in zip(missing, played):
+            self.cache[key] = result
+        self.games_played = len(missing) * self.games_per_pairing
+        if missing:
+            self._save_cache()
+
+        self.results = {
+            (x_spec.name, o_spec.name): self.cache[self._cache_key(x_spec, o_spec)]
+            for x_spec, o_spec in pairings
+        }
+        return self.results
+
+    def score_matrix(self) -> Dict[str, Dict[str, float]]:
+        """
+        Score of each agent (row) against each other agent (column) over both
+        symbol assignments: (wins + draws / 2) / games.
+        """
+        matrix = {spec.name: {} for spec in self.agents}
+        for (x_name, o_name), (x_wins, draws, o_wins) in self.results.items():
+            for name, opponent, wins in ((x_name, o_name, x_wins), (o_name, x_name, o_wins)):
+                points, games = matrix[name].get(opponent, (0.0, 0))
+                matrix[name][opponent] = (points + wins + 0.5 * draws, games + x_wins + draws + o_wins)
+        return {
+            name: {opponent: points / games for opponent, (points, games) in row.items() if games}
+            for name, row in matrix.items()
+        }
+
+    def report(self) -> str:
+        ratings = compute_elo(self.results)
+        matrix = self.score_matrix()
+        names = [spec.name for spec in sorted(self.agents, key=lambda spec: -ratings.get(spec.name, 0))]
+        width = max(len(name) for name in names) + 2
+
+        lines = ["Elo ratings:"]
+        for rank, name in enumerate(names, start=1):
+            lines.append(f"{rank:>3}. {name:<{width}}{ratings.get(name, INITIAL_ELO):7.0f}")
+
+        lines.append("")
+        lines.append("Score matrix (row vs column, wins + draws / 2):")
+        short_names = [name[:8] for name in names]
+        lines.append(" " * width + "".join(f"{name:>9}" for name in short_names))
+        for name in names:
+            cells = "".join(
+                f"{matrix[name][opponent]:>9.2f}" if opponent in matrix[name] else f"{'-':>9}"
+                for opponent in names
+            )
+            lines.append(f"{name:<{width}}{cells}")
+        return "\n".join(lines)
@@ -0,0 +1,74 @@
+import logging
+import os
+import threading
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of trained models, keyed by file path.
+
+    stable_baselines3 (and torch) are only imported when the first PPO zip
+    is actually loaded, and every agent asking for the same file shares one
+    loaded model. NumPy weights files (.npz) are loaded as NumpyPolicy and
+    tabular values (.npy) as TabularPolicy, without importing torch at all.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, path: str):
+        """
+        Return the model stored at `path`, loading it on first request.
+        Returns None (and logs why) if the file is missing or cannot be loaded.
+        """
+        if path in self._models:
+            return self._models[path]
+
+        with self._lock:
+            if path not in self._models:
+                self._models[path] = self._load(path)
+            return self._models[path]
+
+    def _load(self, path: str):
+        if not os.path.exists(path):
+            logging.warning(f"Model file not found: {path}. Agent will play randomly.")
+            return None
+
+        try:
+            if path.endswith(".npz"):
+                from tictactoe.numpy_policy import NumpyPolicy
+
+                model = NumpyPolicy.load(path)
+            elif path.endswith(".npy"):
+                from tictactoe.tabular_policy import TabularPolicy
+
+                model = TabularPolicy.load(path)
+            else:
+                from stable_baselines3 import PPO
+
+                model = PPO.load(path)
+        except Exception as e:
+            logging.error(f"Failed to load model from {path}: {e}")
+            return None
+        self.loads += 1
+        return model
+
+    def __getstate__(self):
+        # A registry sent to another process starts empty
+        return {"loads": 0}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.loads = state["loads"]
+
+    def is_loaded(self, path: str) -> bool:
+        return self._models.get(path) is not None
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+
+registry = ModelRegistry()
@@ -12,17 +12,17 @@ class MoveType(Enum):
     BM = (2, 1)
     BD = (2, 2)
 
+    def __init__(self, row: int, col: int):
+        # Plain attributes rather than properties: they are read on every board operation
+        self.row = row
+        self.col = col
+        # Index of the move on a flattened board, and its bit in a 9-bit square mask
+        self.square = row * 3 + col
+        self.bit = 1 << self.square
+
     def __str__(self):
         return f"{self.name}"
 
-    @property
-    def row(self):
-        return self.value[0]
-
-    @property
-    def col(self):
-        return self.value[1]
-
     @classmethod
     def H_row(cls):
         return [cls.HG, cls.HM, cls.HD]
@@ -57,10 +57,41 @@ class MoveType(Enum):
 
     @classmethod
     def all_moves(cls):
-        return list(cls)
+        """Every move, as a shared tuple (not rebuilt on each call)."""
+        return ALL_MOVES
+
+    @classmethod
+    def from_square(cls, square: int):
+        return MOVES_BY_SQUARE[square]
 
     @classmethod
     def from_str(cls, move_str: str):
         if move_str not in cls.__members__:
             return None
         return cls[move_str]
+
+
+ALL_MOVES = tuple(MoveType)
+MOVES_BY_SQUARE = tuple(sorted(MoveType, key=lambda move: move.square))
+
+# The 8 lines of 3 moves: rows, columns, diagonals
+WIN_LINE_MOVES = (
+    tuple(MoveType.H_row()), tuple(MoveType.M_row()), tuple(MoveType.B_row()),
+    tuple(MoveType.G_col()), tuple(MoveType.M_col()), tuple(MoveType.D_col()),
+    tuple(MoveType.H_diag()), tuple(MoveType.D_diag()),
+)
+
+# Indices in WIN_LINE_MOVES of the 2 to 4 lines through each square
+LINES_THROUGH_SQUARE = tuple(
+    tuple(i for i, line in enumerate(WIN_LINE_MOVES) if move in line) for move in MOVES_BY_SQUARE
+)
+
+FULL_SQUARE_MASK = (1 << 9) - 1
+
+# Legal moves of every set of empty squares (a 9-bit mask), in square order
+MOVES_BY_EMPTY_MASK = tuple(
+    tuple(move for move in MOVES_BY_SQUARE if mask & move.bit) for mask in range(FULL_SQUARE_MASK + 1)
+)
+
+# Weight of each square in the base-3 rank of a position (X = 1, O = 2, empty = 0), square 0 first
+POSITION_WEIGHTS = tuple(3 ** (8 - square) for square in range(9))
@@ -0,0 +1,133 @@
+from typing import List
+
+import numpy as np
+
+
+def _relu(x):
+    return np.maximum(x, 0.0, out=x)
+
+
+def _tanh(x):
+    return np.tanh(x, out=x)
+
+
+def _identity(x):
+    return x
+
+
+ACTIVATIONS = {"ReLU": _relu, "Tanh": _tanh, "Identity": _identity}
+
+
+def select_actions(logits: np.ndarray, action_masks=None, deterministic: bool = False, rng=None) -> np.ndarray:
+    """
+    Pick one action per row of logits, never a masked one (unless a whole row is masked).
+    Args:
+        logits (np.ndarray): (N, 9) action logits, modified in place
+        action_masks (np.ndarray): (N, 9) bool, True for allowed actions
+        deterministic (bool): Take the most likely action instead of sampling
+        rng (np.random.Generator): Generator used for sampling
+    Returns:
+        np.ndarray: (N,) actions
+    """
+    if action_masks is not None:
+        logits[~np.asarray(action_masks, dtype=bool).reshape(logits.shape)] = -np.inf
+    if not deterministic:
+        # Gumbel-max trick: argmax(logits + Gumbel noise) samples from softmax(logits)
+        logits += (rng or np.random.default_rng()).gumbel(size=logits.shape).astype(np.float32)
+    return logits.argmax(axis=1)
+
+
+class NumpyPolicy:
+    """
+    Actor network of a PPO MlpPolicy evaluated with NumPy only.
+
+    The weights are exported once from a stable_baselines3 model (see
+    `export_policy`), after which inference needs neither torch nor
+    stable_baselines3. `predict` mirrors `PPO.predict`.
+    """
+
+    def __init__(self, weights: List[np.ndarray], biases: List[np.ndarray], activation: str = "ReLU"):
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation function: {activation}")
+        self.weights = [np.ascontiguousarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activation = activation
+        self._activation_fn = ACTIVATIONS[activation]
+        self.rng = np.random.default_rng()
+
+    @classmethod
+    def from_sb3_policy(cls, policy) -> "NumpyPolicy":
+        """
+        Extract the actor weights of a stable_baselines3 ActorCriticPolicy.
+        """
+        import torch
+
+        layers = [m for m in policy.mlp_extractor.policy_net if isinstance(m, torch.nn.Linear)]
+        layers.append(policy.action_net)
+        # Weights are stored transposed so that a layer is `x @ w + b`
+        weights = [layer.weight.detach().cpu().numpy().T for layer in layers]
+        biases = [layer.bias.detach().cpu().numpy() for layer in layers]
+        return cls(weights, biases, policy.activation_fn.__name__)
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyPolicy":
+        with np.load(path) as data:
+            num_layers = int(data["num_layers"])
+            weights = [data[f"w{i}"] for i in range(num_layers)]
+            biases = [data[f"b{i}"] for i in range(num_layers)]
+            activation = str(data["activation"])
+        return cls(weights, biases, activation)
+
+    def save(self, path: str):
+        arrays = {"num_layers": len(self.weights), "activation": self.activation}
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            arrays[f"w{i}"] = w
+            arrays[f"b{i}"] = b
+        np.savez(path, **arrays)
+
+    def logits(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            observations (np.ndarray): (N, 9) observations
+        Returns:
+            np.ndarray: (N, 9) action logits
+        """
+        x = np.asarray(observations, dtype=np.float32)
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            x = x @ w
+            x += b
+            if i < last:
+                x = self._activation_fn(x)
+        return x
+
+    def predict(
+        self, observation, state=None, episode_start=None, deterministic=False, action_masks=None, rng=None
+    ):
+        """
+        Same contract as `PPO.predict`, with optional legal-action masks.
+        Args:
+            observation (np.ndarray): (9,) or (N, 9) observations
+            deterministic (bool): Take the most likely action instead of sampling
+            action_masks (np.ndarray): (9,) or (N, 9) bool, True for allowed actions
+            rng (np.random.Generator): Generator used for sampling, the policy's own by default
+        Returns:
+            Tuple[np.ndarray, None]: The actions and a None state
+        """
+        observation = np.asarray(observation)
+        single = observation.ndim == 1
+        logits = self.logits(observation.reshape(-1, 9))
+        actions = select_actions(logits, action_masks, deterministic, rng or self.rng)
+        return (actions[0] if single else actions), None
+
+
+def export_policy(model_path: str, output_path: str) -> NumpyPolicy:
+    """
+    Export the actor of a PPO zip file to a NumPy weights file.
+    Requires stable_baselines3.
+    """
+    from stable_baselines3 import PPO
+
+    policy = NumpyPolicy.from_sb3_policy(PPO.load(model_path).policy)
+    policy.save(output_path)
+    return policy
@@ -39,6 +39,10 @@ class Player:
     def reset(self):
         pass
 
+    def seed(self, seed: int):
+        """Reseed the random state of the player, if it has one."""
+        pass
+
 
 class HumanPlayer(Player):
     def __init__(self, name=str):
@@ -14,6 +14,8 @@ class PlayerManager:
         self,
         playerA: Player,
         playerB: Player,
+        rng: random.Random = None,
+        shuffle_symbols: bool = True,
     ):
         self.players = []
         self.current_player_idx = 0
@@ -23,8 +25,9 @@ class PlayerManager:
         
         self.players = [playerA, playerB]
         
-        # Assigning symbols to players randomly
-        random.shuffle(self.players)
+        # Assigning symbols to players randomly, or X to playerA
+        if shuffle_symbols:
+            (rng or random).shuffle(self.players)
         self.players[0].symbol = Symbol.X
         self.players[1].symbol = Symbol.O
 
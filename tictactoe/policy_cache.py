@@ -0,0 +1,113 @@
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+
+from tictactoe.solver import iter_positions, terminal_value
+from tictactoe.symmetry import TRANSFORM_ARRAY, canonical_ranks
+
+
+class PolicyCache:
+    """
+    Memoized deterministic policy: encoded board -> square chosen by the model.
+
+    Keys are the bytes of the int8 encoded board. `precompute` bakes the
+    whole policy in one batched call by enumerating every reachable
+    non-terminal position.
+
+    With `symmetric=True`, the 8 rotations / reflections of a position share
+    one entry, keyed by the rank of its canonical image (symmetry.canonical_ranks):
+    the model plays the canonical image and the square is mapped back, so the
+    cache holds up to 8x fewer positions. This assumes a policy that treats
+    symmetric positions alike (e.g. trained with symmetry augmentation): a
+    model that does not may answer differently than without the cache.
+    """
+
+    def __init__(self, symmetric: bool = False):
+        self.symmetric = symmetric
+        self._squares: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._squares)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, observations: np.ndarray, predict: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Squares for a batch of encoded boards, calling `predict(observations, mask)`
+        only on the boards that are not cached yet.
+        Args:
+            observations (np.ndarray): (N, 9) encoded boards (empty = 0)
+            predict (Callable): Batched model prediction
+        Returns:
+            np.ndarray: (N,) squares
+        """
+        observations = np.asarray(observations, dtype=np.int8)
+        if self.symmetric:
+            keys, observations, transforms = self._canonical(observations)
+        else:
+            keys = [row.tobytes() for row in observations]
+        squares = np.empty(len(keys), dtype=np.intp)
+        missing = []
+        for i, key in enumerate(keys):
+            square = self._squares.get(key)
+            if square is None:
+                missing.append(i)
+            else:
+                squares[i] = square
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            missing_observations = observations[missing]
+            predicted = predict(missing_observations, missing_observations == 0)
+            squares[missing] = predicted
+            for i, square in zip(missing, predicted.tolist()):
+                self._squares[keys[i]] = square
+        if self.symmetric:
+            # Squares of the canonical images, back on the boards as given
+            squares = TRANSFORM_ARRAY[transforms, squares]
+        return squares
+
+    def precompute(self, predict: Callable[[np.ndarray, np.ndarray], np.ndarray]):
+        """
+        Fill the cache with the policy of every reachable non-terminal position.
+        """
+        observations = np.array(
+            [cells for cells in iter_positions() if terminal_value(cells) is None], dtype=np.int8
+        )
+        if self.symmetric:
+            keys, observations, _ = self._canonical(observations)
+            # One prediction per class of symmetric positions
+            _, first = np.unique(keys, return_index=True)
+            keys, observations = [keys[i] for i in first], observations[first]
+        else:
+            keys = [row.tobytes() for row in observations]
+        squares = predict(observations, observations == 0)
+        for key, square in zip(keys, squares.tolist()):
+            self._squares[key] = square
+
+    @staticmethod
+    def _canonical(observations: np.ndarray):
+        """Keys (canonical ranks), canonical images and transforms of a batch of boards."""
+        ranks, transforms = canonical_ranks(observations)
+        images = observations[np.arange(len(observations))[:, None], TRANSFORM_ARRAY[transforms]]
+        return ranks.tolist(), images, transforms
+
+    def copy(self) -> "PolicyCache":
+        """A cache holding the same decisions, with its own entries and counters."""
+        cache = PolicyCache(self.symmetric)
+        cache._squares = self._squares.copy()
+        return cache
+
+    def clear(self):
+        self._squares.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {"size": len(self), "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
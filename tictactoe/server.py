@@ -0,0 +1,238 @@
+import asyncio
+import copy
+import json
+import random
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from tictactoe.agent import Agent
+from tictactoe.agents_collection.reinforcement_agent import ReinforcementAgent
+from tictactoe.board import Board, Symbol
+from tictactoe.inference_service import InferenceService
+from tictactoe.move import MoveType
+from tictactoe.player import Player, PlayerType
+from tictactoe.player_manager import PlayerManager
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Newline-delimited JSON protocol, one match at a time per connection:
+#
+# client -> server
+#     {"type": "new", "agent": "MINIMAX_AGENT", "symbol": "X"}   symbol is optional (random)
+#     {"type": "move", "move": "MM"}
+# server -> client
+#     {"type": "state", "board": "X...O....", "symbol": "X"}      the client's turn
+#     {"type": "end", "board": "XXXOO....", "result": "win"}      win / loss / draw for the client
+#     {"type": "error", "message": "..."}
+# Boards are the 9 cells in square order (row * 3 + col): "X", "O" or ".".
+
+
+def board_to_str(board) -> str:
+    return "".join(str(cell) for row in board.get_board() for cell in row)
+
+
+class RemotePlayer(Player):
+    """
+    Client of the server: its moves arrive from the socket instead of choose_move.
+    """
+
+    def __init__(self, name: str = "Remote player"):
+        super().__init__(PlayerType.HUMAN)
+        self.name = name
+
+    def choose_move(self, board):
+        raise RuntimeError("The moves of a remote player are received by the server.")
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class Match:
+    """
+    One game between a remote player and a private copy of an agent, on the
+    same Board / PlayerManager as a local Game.
+    """
+
+    def __init__(self, agent: Agent, client_symbol: Symbol):
+        self.board = Board()
+        self.client = RemotePlayer()
+        self.agent = agent
+        players = (self.client, agent) if client_symbol == Symbol.X else (agent, self.client)
+        self.player_manager = PlayerManager(*players, shuffle_symbols=False)
+
+    @property
+    def agent_to_move(self) -> bool:
+        return self.player_manager.current_player is self.agent
+
+    def play(self, move: MoveType) -> Optional[str]:
+        """
+        Play the move of the side to move.
+        Returns:
+            str: Result for the client ("win", "loss" or "draw") if the game is over, None otherwise
+        """
+        self.board.set_move(move, self.player_manager.current_player.symbol)
+        is_won, winner_symbol = self.board.has_winner()
+        if is_won:
+            return "win" if winner_symbol == self.client.symbol else "loss"
+        if self.board.is_full():
+            return "draw"
+        self.player_manager.switch_player()
+        return None
+
+
+class GameServer:
+    """
+    Asyncio server hosting concurrent matches between socket clients and the
+    agents of `agents`. Every match plays against its own shallow copy of the
+    agent (own random state and search tree, shared tables and models), and
+    agent moves run in a thread pool so the event loop never waits on a
+    search or a forward pass. With `batch_inference`, the concurrent moves of
+    each ReinforcementAgent share forward passes through an InferenceService.
+    """
+
+    def __init__(
+        self, agents: Dict[str, Agent], max_workers: int = None, seed: int = None, batch_inference: bool = False
+    ):
+        """
+        Args:
+            agents (Dict[str, Agent]): Agents the clients can play, by name
+            max_workers (int): Threads computing the agent moves
+            seed (int): Seed of the random symbol assignment
+            batch_inference (bool): Batch the model predictions of the ReinforcementAgent matches
+        """
+        self.agents = agents
+        self.inference_services: Dict[str, InferenceService] = {}
+        if batch_inference:
+            for name, agent in agents.items():
+                if isinstance(agent, ReinforcementAgent):
+                    self.inference_services[name] = InferenceService(agent)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent-move")
+        self.rng = random.Random(seed)
+        self.active_matches = 0
+        self.matches_played = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+        """
+        Listen on `host`:`port` (0 for any free port).
+        Returns:
+            int: The port listened on
+        """
+        # Load the tables and models once, before the copies of the agents share them
+        loop = asyncio.get_running_loop()
+        for agent in self.agents.values():
+            await loop.run_in_executor(self.executor, self._warm_up, agent)
+        self._server = await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=False)
+        for service in self.inference_services.values():
+            service.close()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        match = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    message_type = message["type"]
+                except (ValueError, KeyError, TypeError):
+                    await self._send(writer, {"type": "error", "message": "Invalid message."})
+                    continue
+
+                if message_type == "new":
+                    if match is not None:
+                        # The match in progress is abandoned
+                        self.active_matches -= 1
+                    match = await self._new_match(writer, message)
+                elif message_type == "move":
+                    if match is None:
+                        await self._send(writer, {"type": "error", "message": "No match in progress."})
+                    elif await self._client_move(writer, match, message.get("move")):
+                        match = None
+                else:
+                    await self._send(writer, {"type": "error", "message": f"Unknown message type: {message_type}"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if match is not None:
+                self.active_matches -= 1
+            writer.close()
+
+    async def _new_match(self, writer, message) -> Optional[Match]:
+        name = message.get("agent")
+        if name not in self.agents:
+            await self._send(writer, {"type": "error", "message": f"Unknown agent: {name}"})
+            return None
+        symbol = message.get("symbol") or self.rng.choice("XO")
+        if symbol not in ("X", "O"):
+            await self._send(writer, {"type": "error", "message": f"Invalid symbol: {symbol}"})
+            return None
+
+        match = Match(self._new_agent(name), Symbol(symbol))
+        self.active_matches += 1
+        if match.agent_to_move:
+            await self._agent_move(match)
+        await self._send_state(writer, match)
+        return match
+
+    async def _client_move(self, writer, match: Match, move_name) -> bool:
+        """Play the client's move and the agent's reply. Returns True when the match is over."""
+        move = MoveType.from_str(move_name) if isinstance(move_name, str) else None
+        if move is None or not match.board.is_move_valid(move):
+            await self._send(writer, {"type": "error", "message": f"Invalid move: {move_name}"})
+            return False
+
+        result = match.play(move)
+        if result is None:
+            result = await self._agent_move(match)
+        if result is not None:
+            self.active_matches -= 1
+            self.matches_played += 1
+            await self._send(writer, {"type": "end", "board": board_to_str(match.board), "result": result})
+            return True
+        await self._send_state(writer, match)
+        return False
+
+    def _new_agent(self, name: str) -> Agent:
+        # Shallow copy per match: models are shared, the state kept between moves is not
+        # (random generator and search tree replaced by seed / reset, policy cache by __copy__)
+        agent = copy.copy(self.agents[name])
+        agent.seed(self.rng.getrandbits(32))
+        agent.reset()
+        if name in self.inference_services:
+            agent.inference_service = self.inference_services[name]
+        return agent
+
+    @staticmethod
+    def _warm_up(agent: Agent):
+        agent.symbol = Symbol.X
+        agent.choose_move(Board())
+        agent.reset()
+
+    async def _agent_move(self, match: Match) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        move = await loop.run_in_executor(self.executor, match.agent.choose_move, match.board)
+        return match.play(move)
+
+    async def _send_state(self, writer: asyncio.StreamWriter, match: Match):
+        message = {"type": "state", "board": board_to_str(match.board), "symbol": str(match.client.symbol)}
+        await self._send(writer, message)
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: dict):
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
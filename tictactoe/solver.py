@@ -0,0 +1,204 @@
+import math
+import struct
+
+from typing import Dict, Iterator, List, Tuple
+
+from tictactoe.cells import EMPTY_CELL, O_CELL, SYMBOL_CELLS, WIN_LINES, X_CELL
+from tictactoe.symmetry import canonicalize, from_transformed_square
+
+# A position is a tuple of 9 cells (square = row * 3 + col): X = 1, O = -1, empty = 0
+Cells = Tuple[int, ...]
+
+NO_MOVE = 255
+
+# Plain tuples: indexing the cells with Python ints is faster than with NumPy ones
+_WIN_LINES = tuple(tuple(line) for line in WIN_LINES.tolist())
+
+# Center first, then corners, then edges: good moves first prunes more
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+TABLE_MAGIC = b"TTTM"
+TABLE_VERSION = 1
+_HEADER = struct.Struct("<4sBH")
+_ENTRY = struct.Struct("<HbB")
+
+
+def cells_of(board) -> Cells:
+    """Encode a Board (or any object with get_board) as a tuple of 9 cells."""
+    return tuple(SYMBOL_CELLS[cell] for row in board.get_board() for cell in row)
+
+
+def position_key(cells: Cells) -> int:
+    """Base-3 rank of a position, from 0 to 3 ** 9 - 1."""
+    key = 0
+    for cell in cells:
+        key = key * 3 + cell % 3
+    return key
+
+
+def winner(cells: Cells) -> int:
+    """Cell value of the player owning a complete line, EMPTY_CELL if none."""
+    for a, b, c in _WIN_LINES:
+        if cells[a] != EMPTY_CELL and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return EMPTY_CELL
+
+
+def side_to_move(cells: Cells) -> int:
+    """X always starts, so X moves whenever both players played as many moves."""
+    return X_CELL if cells.count(X_CELL) == cells.count(O_CELL) else O_CELL
+
+
+def play(cells: Cells, square: int, cell: int) -> Cells:
+    return cells[:square] + (cell,) + cells[square + 1:]
+
+
+def terminal_value(cells: Cells):
+    """
+    Value of a finished position for the side to move, None if the game goes on.
+    A loss is worth -(1 + empty squares) so that quick wins and slow losses are preferred.
+    """
+    if winner(cells) != EMPTY_CELL:
+        return -(1 + cells.count(EMPTY_CELL))
+    if EMPTY_CELL not in cells:
+        return 0
+    return None
+
+
+def iter_positions() -> Iterator[Cells]:
+    """
+    Every position reachable from the empty board (5478 of them), each once.
+    Positions after a win are not expanded.
+    """
+    start = (EMPTY_CELL,) * 9
+    seen = {start}
+    stack = [start]
+    while stack:
+        cells = stack.pop()
+        yield cells
+        if terminal_value(cells) is not None:
+            continue
+        cell = side_to_move(cells)
+        for square in MOVE_ORDER:
+            if cells[square] == EMPTY_CELL:
+                child = play(cells, square, cell)
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+
+
+class Solver:
+    """
+    Alpha-beta solver with a transposition table keyed on canonical positions.
+
+    `solve` fills `table`, mapping the key of every reachable canonical
+    position to its exact value for the side to move and a best move (a
+    square of the canonical position, NO_MOVE when the game is over).
+    """
+
+    def __init__(self):
+        self.table: Dict[int, Tuple[int, int]] = {}
+        self.transpositions: Dict[int, Tuple[int, int]] = {}
+        self.nodes = 0
+
+    def search(self, cells: Cells, alpha: float = -math.inf, beta: float = math.inf) -> int:
+        """Negamax value of a position for the side to move."""
+        self.nodes += 1
+        value = terminal_value(cells)
+        if value is not None:
+            return value
+
+        canonical, _ = canonicalize(cells)
+        key = position_key(canonical)
+        entry = self.transpositions.get(key)
+        if entry is not None:
+            flag, value = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        alpha_orig = alpha
+        cell = side_to_move(canonical)
+        best = -math.inf
+        for square in MOVE_ORDER:
+            if canonical[square] != EMPTY_CELL:
+                continue
+            value = -self.search(play(canonical, square, cell), -beta, -alpha)
+            best = max(best, value)
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.transpositions[key] = (flag, best)
+        return best
+
+    def best_move(self, canonical: Cells) -> Tuple[int, int]:
+        """Exact value and best square of a canonical position."""
+        value = terminal_value(canonical)
+        if value is not None:
+            return value, NO_MOVE
+
+        cell = side_to_move(canonical)
+        best_value, best_square = -math.inf, NO_MOVE
+        for square in MOVE_ORDER:
+            if canonical[square] != EMPTY_CELL:
+                continue
+            value = -self.search(play(canonical, square, cell))
+            if value > best_value:
+                best_value, best_square = value, square
+        return best_value, best_square
+
+    def solve(self) -> Dict[int, Tuple[int, int]]:
+        for cells in iter_positions():
+            canonical, _ = canonicalize(cells)
+            key = position_key(canonical)
+            if key not in self.table:
+                self.table[key] = self.best_move(canonical)
+        return self.table
+
+
+def save_table(table: Dict[int, Tuple[int, int]], path: str):
+    """
+    Write a solved table: a small header, then 4 bytes per canonical position
+    (uint16 key, int8 value, uint8 best square).
+    """
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(table)))
+        for key in sorted(table):
+            value, square = table[key]
+            f.write(_ENTRY.pack(key, value, square))
+
+
+def load_table(path: str) -> Dict[int, Tuple[int, int]]:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError(f"{path} is not a version {TABLE_VERSION} minimax table.")
+    table = {}
+    for key, value, square in _ENTRY.iter_unpack(data[_HEADER.size:_HEADER.size + count * _ENTRY.size]):
+        table[key] = (value, square)
+    return table
+
+
+def best_squares(table: Dict[int, Tuple[int, int]], positions: List[Cells]) -> List[int]:
+    """Best square of each position, in the frame of the position itself."""
+    squares = []
+    for cells in positions:
+        canonical, transform = canonicalize(cells)
+        _, square = table[position_key(canonical)]
+        squares.append(NO_MOVE if square == NO_MOVE else from_transformed_square(square, transform))
+    return squares
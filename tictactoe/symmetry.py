@@ -0,0 +1,80 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from tictactoe.move import MOVES_BY_SQUARE, MoveType
+
+# The 8 symmetries of the board as square permutations over the flattened
+# board (square = row * 3 + col): transformed[i] = cells[TRANSFORMS[t][i]]
+TRANSFORMS = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotation 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotation 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotation 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Horizontal flip
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Vertical flip
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Transpose
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Anti-transpose
+)
+IDENTITY = 0
+
+# INVERSE_TRANSFORMS[t][s] is the square where the original square s lands
+INVERSE_TRANSFORMS = tuple(
+    tuple(perm.index(square) for square in range(9)) for perm in TRANSFORMS
+)
+
+_MOVES = MOVES_BY_SQUARE
+
+# (8, 9) array of TRANSFORMS, and the weight of each square in the base-3 rank of a position
+TRANSFORM_ARRAY = np.array(TRANSFORMS, dtype=np.intp)
+_RANK_WEIGHTS = 3 ** np.arange(8, -1, -1)
+
+
+def apply(cells: Sequence, transform: int) -> tuple:
+    """Image of a flattened board under a transform."""
+    return tuple(cells[i] for i in TRANSFORMS[transform])
+
+
+def canonicalize(cells: Sequence) -> Tuple[tuple, int]:
+    """
+    Canonical form of a position: the smallest of its 8 images, together with
+    the transform producing it.
+    Args:
+        cells (Sequence): 9 comparable cell values
+    Returns:
+        Tuple[tuple, int]: The canonical cells and the transform index
+    """
+    return min((tuple(cells[i] for i in perm), t) for t, perm in enumerate(TRANSFORMS))
+
+
+def to_transformed_square(square: int, transform: int) -> int:
+    """Square of the transformed board holding the original `square`."""
+    return INVERSE_TRANSFORMS[transform][square]
+
+
+def from_transformed_square(square: int, transform: int) -> int:
+    """Square of the original board shown at `square` of the transformed board."""
+    return TRANSFORMS[transform][square]
+
+
+def transform_move(move: MoveType, transform: int) -> MoveType:
+    return _MOVES[INVERSE_TRANSFORMS[transform][move.square]]
+
+
+def inverse_transform_move(move: MoveType, transform: int) -> MoveType:
+    return _MOVES[TRANSFORMS[transform][move.square]]
+
+
+def canonical_ranks(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched canonicalization of an (N, 9) array of cells (X = 1, O = -1,
+    empty = 0). The canonical image is the one of smallest base-3 rank (the
+    position_key of the solver), which differs from `canonicalize`'s choice
+    but is just as unique.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N,) ranks of the canonical images and (N,) transform indices
+    """
+    images = np.asarray(boards)[:, TRANSFORM_ARRAY]
+    ranks = (images % 3) @ _RANK_WEIGHTS
+    transforms = ranks.argmin(axis=1)
+    return ranks[np.arange(len(ranks)), transforms], transforms
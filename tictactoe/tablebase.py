@@ -0,0 +1,151 @@
+import mmap
+import struct
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from tictactoe.cells import EMPTY_CELL
+from tictactoe.solver import (
+    Cells,
+    iter_positions,
+    play,
+    position_key,
+    side_to_move,
+    terminal_value,
+)
+
+TABLEBASE_PATH = "models/tablebase.bin"
+TABLEBASE_MAGIC = b"TTTB"
+TABLEBASE_VERSION = 1
+
+# One record per base-3 rank (position_key) of the 9 cells, reachable or not
+NUM_RECORDS = 3 ** 9
+UNREACHABLE = 255  # Depth of the records of unreachable positions
+
+# Header padded to 16 bytes: magic, version, record size, number of records
+_HEADER = struct.Struct("<4sBBI6x")
+# Value for the side to move (solver scale), mask of the best squares, plies to the end
+_RECORD = struct.Struct("<bHB")
+RECORD_DTYPE = np.dtype([("value", "i1"), ("best_moves", "<u2"), ("depth", "u1")])
+
+# position_key of (N, 9) cell arrays: X = 1 -> 1, O = -1 -> 2, empty -> 0
+_KEY_WEIGHTS = 3 ** np.arange(8, -1, -1)
+
+
+def solve_positions() -> Dict[int, Tuple[int, int, int]]:
+    """
+    (value, best squares mask, depth) of every reachable position, by position_key.
+
+    Values are on the Solver scale (a loss is -(1 + empty squares) when the
+    game ends), so the depth to the end of perfect play follows from them.
+    """
+    values: Dict[int, int] = {}
+
+    def value_of(cells: Cells) -> int:
+        key = position_key(cells)
+        if key not in values:
+            value = terminal_value(cells)
+            if value is None:
+                cell = side_to_move(cells)
+                value = max(
+                    -value_of(play(cells, square, cell)) for square in range(9) if cells[square] == EMPTY_CELL
+                )
+            values[key] = value
+        return values[key]
+
+    records = {}
+    for cells in iter_positions():
+        value = value_of(cells)
+        empty = cells.count(EMPTY_CELL)
+        best_moves = 0
+        if terminal_value(cells) is None:
+            cell = side_to_move(cells)
+            for square in range(9):
+                if cells[square] == EMPTY_CELL and -value_of(play(cells, square, cell)) == value:
+                    best_moves |= 1 << square
+        # Decisive games end with abs(value) - 1 empty squares, draws on a full board
+        depth = empty - (abs(value) - 1) if value != 0 else empty
+        records[position_key(cells)] = (value, best_moves, depth)
+    return records
+
+
+def build_tablebase(path: str = TABLEBASE_PATH) -> int:
+    """
+    Write the tablebase of every reachable position to `path`.
+    Returns:
+        int: Number of reachable positions
+    """
+    records = solve_positions()
+    data = bytearray(_HEADER.size + NUM_RECORDS * _RECORD.size)
+    _HEADER.pack_into(data, 0, TABLEBASE_MAGIC, TABLEBASE_VERSION, _RECORD.size, NUM_RECORDS)
+    for key in range(NUM_RECORDS):
+        value, best_moves, depth = records.get(key, (0, 0, UNREACHABLE))
+        _RECORD.pack_into(data, _HEADER.size + key * _RECORD.size, value, best_moves, depth)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(records)
+
+
+def position_keys(boards: np.ndarray) -> np.ndarray:
+    """position_key of each row of an (N, 9) array of cells (X = 1, O = -1, empty = 0)."""
+    return (np.asarray(boards) % 3) @ _KEY_WEIGHTS
+
+
+class Tablebase:
+    """
+    Read-only view of a tablebase file through mmap.
+
+    Opening it maps the file without reading it, and every process opening
+    the same file shares one copy of its pages in the OS page cache. Records
+    are indexed by position_key (Board.position_index).
+    """
+
+    def __init__(self, path: str = TABLEBASE_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path} is not a tablebase.")
+        magic, version, record_size, count = _HEADER.unpack_from(self._mmap)
+        if (
+            magic != TABLEBASE_MAGIC
+            or version != TABLEBASE_VERSION
+            or record_size != _RECORD.size
+            or count != NUM_RECORDS
+            or len(self._mmap) < _HEADER.size + count * record_size
+        ):
+            raise ValueError(f"{path} is not a version {TABLEBASE_VERSION} tablebase.")
+        self.path = path
+        # Zero-copy structured view of the records, for batched lookups
+        self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=count, offset=_HEADER.size)
+
+    def record(self, index: int) -> Tuple[int, int, int]:
+        """(value, best squares mask, depth) of the position of rank `index`."""
+        return _RECORD.unpack_from(self._mmap, _HEADER.size + index * _RECORD.size)
+
+    def value(self, index: int) -> int:
+        """Value for the side to move: > 0 win, 0 draw, < 0 loss with perfect play."""
+        return self.record(index)[0]
+
+    def best_squares(self, index: int) -> Tuple[int, ...]:
+        _, best_moves, _ = self.record(index)
+        return tuple(square for square in range(9) if best_moves >> square & 1)
+
+    def depth(self, index: int) -> int:
+        """Plies until the end of the game with perfect play (UNREACHABLE if the position is not)."""
+        return self.record(index)[2]
+
+    def lookup(self, boards: np.ndarray) -> np.ndarray:
+        """Records of an (N, 9) array of cells, in one vectorized gather."""
+        return self.records[position_keys(boards)]
+
+    def close(self):
+        self.records = None
+        self._mmap.close()
+
+    def __getstate__(self):
+        # Other processes map the file themselves instead of receiving a copy
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
@@ -0,0 +1,99 @@
+import numpy as np
+
+from tictactoe.cells import EMPTY_CELL, O_CELL, WIN_LINES, X_CELL
+from tictactoe.numpy_policy import select_actions
+from tictactoe.tablebase import NUM_RECORDS, position_keys
+
+# Every base-3 rank (X = 1, O = 2, empty = 0), decoded as a row of 9 cells, reachable or not
+_DIGITS = (np.arange(NUM_RECORDS)[:, None] // 3 ** np.arange(8, -1, -1)) % 3
+POSITION_CELLS = np.select([_DIGITS == 1, _DIGITS == 2], [X_CELL, O_CELL], EMPTY_CELL).astype(np.int8)
+
+# Cell of the side to move in each position: X whenever both players played as many moves
+SIDE_TO_MOVE = np.where(POSITION_CELLS.sum(axis=1) == 0, X_CELL, O_CELL).astype(np.int8)
+
+_LINE_SUMS = POSITION_CELLS[:, WIN_LINES].sum(axis=2)
+_WON = (np.abs(_LINE_SUMS) == 3).any(axis=1)
+IS_TERMINAL = _WON | (POSITION_CELLS != EMPTY_CELL).all(axis=1)
+# Value of a finished game for the side to move: the previous move either won it or filled the board
+TERMINAL_VALUE = np.where(_WON, -1.0, 0.0).astype(np.float32)
+
+# Rank reached by each move of the side to move (-1 on occupied squares and finished games)
+_MOVER_DIGIT = np.where(SIDE_TO_MOVE == X_CELL, 1, 2)
+CHILDREN = np.where(
+    (POSITION_CELLS == EMPTY_CELL) & ~IS_TERMINAL[:, None],
+    np.arange(NUM_RECORDS)[:, None] + _MOVER_DIGIT[:, None] * 3 ** np.arange(8, -1, -1),
+    -1,
+)
+
+# Softmax scale of the move values: a value gap of 0.1 is a e^-2 lower probability
+LOGIT_SCALE = 20.0
+
+
+def move_values(values: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Value of each move for the side to move, -inf on occupied squares.
+    Args:
+        values (np.ndarray): (3 ** 9,) value of every position for its side to move
+        indices (np.ndarray): (N,) position ranks
+    Returns:
+        np.ndarray: (N, 9) values
+    """
+    children = CHILDREN[indices]
+    move_value = -values[children]
+    move_value[children < 0] = -np.inf
+    return move_value
+
+
+def absolute_indices(observations: np.ndarray) -> np.ndarray:
+    """
+    Ranks of observations encoded either with X = 1 (ReinforcementAgent.encode_board)
+    or from the side to move, own pieces = 1 (training environments). The two
+    only differ when O is to move, which the sum of the cells tells apart.
+    """
+    observations = np.asarray(observations).reshape(-1, 9)
+    own_is_one = observations.sum(axis=1, keepdims=True) == -1
+    return position_keys(np.where(own_is_one, -observations, observations))
+
+
+class TabularPolicy:
+    """
+    Policy reading the learned value of every position (one float per base-3
+    rank, see train_tabular.py) instead of evaluating a network. It has the
+    `logits` / `predict` interface of NumpyPolicy, so ReinforcementAgent runs
+    it with `backend=InferenceBackend.TABULAR`.
+    """
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float32)
+        if values.shape != (NUM_RECORDS,):
+            raise ValueError(f"A tabular policy holds {NUM_RECORDS} position values, got shape {values.shape}.")
+        self.values = values
+        self.rng = np.random.default_rng()
+
+    @classmethod
+    def load(cls, path: str) -> "TabularPolicy":
+        return cls(np.load(path))
+
+    def save(self, path: str):
+        np.save(path, self.values)
+
+    def logits(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            observations (np.ndarray): (N, 9) observations
+        Returns:
+            np.ndarray: (N, 9) action logits, very negative on occupied squares
+        """
+        move_value = move_values(self.values, absolute_indices(observations))
+        # Finite logits on occupied squares keep the softmax of action_probabilities defined
+        return np.maximum(move_value * LOGIT_SCALE, -1e8).astype(np.float32)
+
+    def predict(
+        self, observation, state=None, episode_start=None, deterministic=False, action_masks=None, rng=None
+    ):
+        """Same contract as NumpyPolicy.predict."""
+        observation = np.asarray(observation)
+        single = observation.ndim == 1
+        logits = self.logits(observation.reshape(-1, 9))
+        actions = select_actions(logits, action_masks, deterministic, rng or self.rng)
+        return (actions[0] if single else actions), None
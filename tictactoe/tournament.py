@@ -0,0 +1,100 @@
+import os
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from tictactoe.board import Board
+from tictactoe.game import Game
+from tictactoe.player import Player, PlayerType
+
+# Games are played in fixed-size chunks, each with its own seed, so that the
+# results only depend on the master seed and not on how chunks are spread
+# over workers.
+CHUNK_SIZE = 100
+
+Stats = Dict[Game.Winner, int]
+
+# Players of the current worker process, set once by _init_worker
+_players: Tuple[Player, Player] = None
+
+
+def chunk_seed(master_seed: int, chunk_idx: int) -> int:
+    """Seed of a chunk, derived from the master seed independently of other chunks."""
+    return random.Random(f"{master_seed}:{chunk_idx}").getrandbits(32)
+
+
+def _init_worker(playerA: Player, playerB: Player, single_threaded: bool = False):
+    global _players
+    if single_threaded:
+        # One thread per process: the pool already uses the cores, and torch
+        # reads this when it is first imported (models are loaded lazily)
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+    _players = (playerA, playerB)
+
+
+def _play_chunk(chunk: Tuple[int, int, int]) -> Stats:
+    chunk_idx, num_games, master_seed = chunk
+    playerA, playerB = _players
+
+    seed = chunk_seed(master_seed, chunk_idx)
+    playerA.seed(seed)
+    playerB.seed(seed + 1)
+    game = Game(Board(), playerA, playerB, rng=random.Random(seed))
+
+    stats = {winner: 0 for winner in Game.Winner}
+    for _ in range(num_games):
+        stats[game.play()] += 1
+        game.board.reset()
+        game.player_manager.reset()
+    return stats
+
+
+def _chunks(num_games: int, master_seed: int, chunk_size: int) -> List[Tuple[int, int, int]]:
+    return [
+        (chunk_idx, min(chunk_size, num_games - start), master_seed)
+        for chunk_idx, start in enumerate(range(0, num_games, chunk_size))
+    ]
+
+
+def run_tournament(
+    playerA: Player,
+    playerB: Player,
+    num_games: int,
+    num_workers: int = 1,
+    seed: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[Stats, float]:
+    """
+    Play `num_games` games between two agents over a pool of worker processes.
+
+    Each worker receives its own copy of both players once (models are loaded
+    lazily in the worker). Symbols are drawn per chunk of games.
+    Args:
+        playerA (Player): First agent
+        playerB (Player): Second agent
+        num_games (int): Total number of games
+        num_workers (int): Number of processes, 1 plays in the current process
+        seed (int): Master seed, the results are identical for any num_workers
+        chunk_size (int): Games per independently seeded chunk
+    Returns:
+        Tuple[Stats, float]: Number of games per result, and games per second
+    """
+    if PlayerType.HUMAN in (playerA.player_type, playerB.player_type):
+        raise ValueError("Tournaments can only be played between agents.")
+
+    chunks = _chunks(num_games, seed, chunk_size)
+    start_time = time.perf_counter()
+    if num_workers <= 1:
+        _init_worker(playerA, playerB)
+        results = [_play_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=_init_worker, initargs=(playerA, playerB, True)
+        ) as executor:
+            results = list(executor.map(_play_chunk, chunks))
+    elapsed = time.perf_counter() - start_time
+
+    stats = {winner: sum(result[winner] for result in results) for winner in Game.Winner}
+    return stats, num_games / elapsed
@@ -0,0 +1,126 @@
+import time
+
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from stable_baselines3.common.callbacks import BaseCallback
+
+from tictactoe.numpy_policy import NumpyPolicy
+from tictactoe.training.evaluation import PERFECT_REFERENCE, EvaluationResult, ParallelEvaluator
+
+
+class RolloutThroughputCallback(BaseCallback):
+    """
+    Log how many environment steps per second are collected during rollouts
+    (`rollout/steps_per_sec`), excluding the time spent in gradient updates.
+    """
+
+    def __init__(self, verbose: int = 0):
+        super().__init__(verbose)
+        self._start_time = 0.0
+        self._start_timesteps = 0
+        self.steps_per_sec = 0.0
+
+    def _on_rollout_start(self):
+        self._start_time = time.perf_counter()
+        self._start_timesteps = self.num_timesteps
+
+    def _on_rollout_end(self):
+        elapsed = time.perf_counter() - self._start_time
+        if elapsed > 0:
+            self.steps_per_sec = (self.num_timesteps - self._start_timesteps) / elapsed
+            self.logger.record("rollout/steps_per_sec", self.steps_per_sec)
+            if self.verbose > 0:
+                print(f"Rollout: {self.steps_per_sec:,.0f} steps/sec")
+
+    def _on_step(self) -> bool:
+        return True
+
+
+class EvaluationCallback(BaseCallback):
+    """
+    Evaluate the policy against fixed references at the end of each `learn`
+    call (one checkpoint batch of train_rl_model.py), in background worker
+    processes so that training goes on meanwhile.
+
+    Finished evaluations are logged as `eval/<reference>/{win,draw,loss}_rate`
+    with the training logs (TensorBoard). Once the draw rate against perfect
+    play reaches `target_draw_rate`, `target_reached` is set and the current
+    `learn` call is stopped.
+    """
+
+    def __init__(
+        self,
+        evaluator: ParallelEvaluator,
+        target_draw_rate: float = None,
+        perfect_reference: str = PERFECT_REFERENCE,
+        verbose: int = 0,
+    ):
+        """
+        Args:
+            evaluator (ParallelEvaluator): Background evaluations of the policy snapshots
+            target_draw_rate (float): Draw rate against perfect play that stops training, None to never stop
+            perfect_reference (str): Name of the perfect-play reference of the evaluator
+        """
+        super().__init__(verbose)
+        self.evaluator = evaluator
+        self.target_draw_rate = target_draw_rate
+        self.perfect_reference = perfect_reference
+        self.target_reached = False
+        # (timesteps, {reference: EvaluationResult}) of every finished evaluation
+        self.history: List[Tuple[int, Dict[str, EvaluationResult]]] = []
+        self._pending: List[Tuple[int, Dict[str, Future]]] = []
+
+    def _on_training_end(self):
+        if self._collect():
+            # The next learn call sets up a new logger, the results recorded here would be lost
+            self.logger.dump(self.num_timesteps)
+        # The weights are copied as a NumPy policy, the workers never see the live torch model
+        policy = NumpyPolicy.from_sb3_policy(self.model.policy)
+        self._pending.append((self.num_timesteps, self.evaluator.submit(policy)))
+
+    def _on_rollout_end(self):
+        self._collect()
+
+    def _on_step(self) -> bool:
+        return not self.target_reached
+
+    def wait(self):
+        """Block until every submitted evaluation is logged."""
+        self._collect(block=True)
+        self.logger.dump(self.num_timesteps)
+
+    def _collect(self, block: bool = False) -> int:
+        """Log the finished evaluations, in submission order. Returns how many were logged."""
+        collected = 0
+        while self._pending:
+            timesteps, futures = self._pending[0]
+            if not block and not all(future.done() for future in futures.values()):
+                break
+            self._pending.pop(0)
+            results = {name: future.result() for name, future in futures.items()}
+            self.history.append((timesteps, results))
+            self._log(timesteps, results)
+            collected += 1
+        return collected
+
+    def _log(self, timesteps: int, results: Dict[str, EvaluationResult]):
+        self.logger.record("eval/timesteps", timesteps)
+        for name, result in results.items():
+            key = name.replace(" ", "_")
+            self.logger.record(f"eval/{key}/win_rate", result.win_rate)
+            self.logger.record(f"eval/{key}/draw_rate", result.draw_rate)
+            self.logger.record(f"eval/{key}/loss_rate", result.loss_rate)
+        if self.verbose > 0:
+            print(f"Evaluation at {timesteps} timesteps:")
+            for name, result in results.items():
+                print(
+                    f"  vs {name}: {result.win_rate:.1%} won, {result.draw_rate:.1%} draw, "
+                    f"{result.loss_rate:.1%} lost ({result.games} games)"
+                )
+
+        perfect = results.get(self.perfect_reference)
+        if self.target_draw_rate is not None and perfect is not None and perfect.draw_rate >= self.target_draw_rate:
+            self.target_reached = True
+            if self.verbose > 0:
+                print(f"Target draw rate against perfect play reached: {perfect.draw_rate:.1%}")
@@ -0,0 +1,79 @@
+import gymnasium as gym
+import numpy as np
+
+from gymnasium import spaces
+
+from tictactoe.training.opponent_pool import OpponentPool, default_pool
+
+AGENT_CELL = 1
+OPPONENT_CELL = -1
+
+WIN_REWARD = 10
+LOSS_REWARD = -10
+DRAW_REWARD = 0
+
+
+class TicTacToeEnv(gym.Env):
+    def __init__(self, opponent_pool: OpponentPool = None):
+        super(TicTacToeEnv, self).__init__()
+        self.opponent_pool = opponent_pool if opponent_pool is not None else default_pool()
+        self.observation_space = spaces.Box(low=-1, high=1, shape=(9,), dtype=np.int8)
+        self.action_space = spaces.Discrete(9)
+        # Actions on occupied squares, replaced by a random valid move (always 0 with masking)
+        self.illegal_actions = 0
+        self.reset()
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.board = np.zeros(9, dtype=np.int8)
+        self.done = False  # Explicitly track if game is done
+        return self.board, {"action_mask": self.action_masks()}  # Return initial state
+
+    def action_masks(self):
+        """Legal actions of the current board: True for empty squares."""
+        return self.board == 0
+
+    def get_opponent_model(self):
+        """Return the most recent checkpoint, loaded once and kept in the opponent pool."""
+        return self.opponent_pool.latest()
+
+    def step(self, action):
+        if self.board[action] != 0:  # If action is invalid, force a valid choice
+            self.illegal_actions += 1
+            empty_spots = np.where(self.board == 0)[0]
+            if empty_spots.size > 0:
+                action = np.random.choice(empty_spots)  # Pick a random valid move
+            else:
+                return self.board, -10, True, False, {}  # No moves left, shouldn't happen
+
+        self.board[action] = AGENT_CELL  # Agent plays '1'
+
+        if self.check_win(AGENT_CELL):
+            return self.board, WIN_REWARD, True, False, {}
+
+        if np.all(self.board != 0):
+            return self.board, DRAW_REWARD, True, False, {}  # Draw
+
+        # Opponent move
+        opponent = self.get_opponent_model()
+        opponent_action = None
+        if opponent:
+            opponent_action, _ = opponent.predict(self.board, deterministic=True)
+        if opponent_action is None or self.board[opponent_action] != 0:
+            # No opponent yet, or it picked an occupied square: play randomly
+            empty_spots = np.where(self.board == 0)[0]
+            opponent_action = np.random.choice(empty_spots)
+
+        self.board[opponent_action] = OPPONENT_CELL
+        if self.check_win(OPPONENT_CELL):
+            return self.board, LOSS_REWARD, True, False, {}
+
+        return self.board, 0, False, False, {"action_mask": self.action_masks()}
+
+    def check_win(self, player):
+        win_states = [
+            (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+            (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+            (0, 4, 8), (2, 4, 6)  # Diagonals
+        ]
+        return any(all(self.board[i] == player for i in state) for state in win_states)
@@ -0,0 +1,130 @@
+import multiprocessing as mp
+import os
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List
+
+from tictactoe.agent import AgentType
+from tictactoe.agents_collection.reinforcement_agent import (
+    TABULAR_MODEL_PATH,
+    InferenceBackend,
+    ModelDifficulty,
+    ReinforcementAgent,
+)
+from tictactoe.batch_game import BatchGame
+from tictactoe.game import Game
+from tictactoe.league import MODELS_DIR, AgentSpec
+
+PERFECT_REFERENCE = "Minimax"
+
+
+@dataclass(frozen=True)
+class EvaluationResult:
+    """Games of the evaluated policy against one reference, half as X and half as O."""
+    wins: int
+    draws: int
+    losses: int
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        return self.draws / self.games if self.games else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        return self.losses / self.games if self.games else 0.0
+
+
+def default_references(models_dir: str = MODELS_DIR) -> List[AgentSpec]:
+    """
+    Fixed opponents of the evaluations: random, perfect (minimax) and MCTS
+    play, the ModelDifficulty models present, as NumPy weights when exported so
+    that workers do not import torch, and the tabular policy.
+    """
+    references = [
+        AgentSpec("Random", AgentType.RANDOM),
+        AgentSpec(PERFECT_REFERENCE, AgentType.MINIMAX),
+        AgentSpec("MCTS", AgentType.MCTS),
+    ]
+    for difficulty in ModelDifficulty:
+        for backend in (InferenceBackend.NUMPY, InferenceBackend.SB3):
+            path = os.path.join(models_dir, f"{difficulty.value}{backend.value}")
+            if os.path.exists(path):
+                references.append(AgentSpec(f"RL {difficulty.name}", AgentType.REINFORCEMENT, path))
+                break
+    tabular_path = os.path.join(models_dir, os.path.basename(TABULAR_MODEL_PATH))
+    if os.path.exists(tabular_path):
+        references.append(AgentSpec("RL TABULAR", AgentType.REINFORCEMENT, tabular_path))
+    return references
+
+
+def evaluate_policy(policy, reference: AgentSpec, num_games: int, seed: int, deterministic: bool) -> EvaluationResult:
+    """
+    Play a policy (a picklable NumpyPolicy) against a reference with the
+    vectorized BatchGame, as the ReinforcementAgent using it would play.
+    """
+    agent = ReinforcementAgent(backend=InferenceBackend.NUMPY, deterministic=deterministic)
+    agent.model = policy
+    opponent = reference.build()
+    agent.seed(seed)
+    opponent.seed(seed + 1)
+
+    as_x = BatchGame(agent, opponent, shuffle_symbols=False).play(num_games // 2)
+    as_o = BatchGame(opponent, agent, shuffle_symbols=False).play(num_games - num_games // 2)
+    return EvaluationResult(
+        wins=as_x[Game.Winner.PLAYER_A] + as_o[Game.Winner.PLAYER_B],
+        draws=as_x[Game.Winner.DRAW] + as_o[Game.Winner.DRAW],
+        losses=as_x[Game.Winner.PLAYER_B] + as_o[Game.Winner.PLAYER_A],
+    )
+
+
+class ParallelEvaluator:
+    """
+    Evaluations of policy snapshots in background processes, one task per
+    reference, so the caller (the training loop) keeps running meanwhile.
+    """
+
+    def __init__(
+        self,
+        references: List[AgentSpec],
+        num_games: int = 10_000,
+        num_workers: int = 2,
+        deterministic: bool = False,
+        seed: int = 0,
+        start_method: str = None,
+    ):
+        self.references = references
+        self.num_games = num_games
+        self.num_workers = num_workers
+        self.deterministic = deterministic
+        self.seed = seed
+        self.start_method = start_method
+        self._executor = None
+
+    def submit(self, policy) -> Dict[str, Future]:
+        """Start evaluating a policy against every reference, returns a future per reference name."""
+        if self._executor is None:
+            # Training has already imported torch, workers are not forked from it
+            start_method = self.start_method
+            if start_method is None:
+                start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(self.num_workers, mp_context=mp.get_context(start_method))
+        return {
+            reference.name: self._executor.submit(
+                evaluate_policy, policy, reference, self.num_games, self.seed + i, self.deterministic
+            )
+            for i, reference in enumerate(self.references)
+        }
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,40 @@
+import torch as th
+
+from stable_baselines3.common.policies import ActorCriticPolicy
+
+# Logit given to occupied squares: finite, so that the entropy stays defined
+MASKED_LOGIT = -1e8
+
+
+class MaskedActorCriticPolicy(ActorCriticPolicy):
+    """
+    MlpPolicy whose action distribution only covers empty squares.
+
+    The observation is the board itself (empty squares are 0), so the legal
+    action mask is derived from it: occupied squares get a -1e8 logit in
+    rollouts, PPO updates and `predict` alike. The networks are those of
+    MlpPolicy, so `NumpyPolicy.from_sb3_policy` exports it unchanged (pass
+    the mask to `NumpyPolicy.predict` to get the same actions).
+    """
+
+    _action_mask = None
+
+    def forward(self, obs: th.Tensor, deterministic: bool = False):
+        self._action_mask = obs == 0
+        return super().forward(obs, deterministic)
+
+    def evaluate_actions(self, obs: th.Tensor, actions: th.Tensor):
+        self._action_mask = obs == 0
+        return super().evaluate_actions(obs, actions)
+
+    def get_distribution(self, obs: th.Tensor):
+        self._action_mask = obs == 0
+        return super().get_distribution(obs)
+
+    def _get_action_dist_from_latent(self, latent_pi: th.Tensor):
+        logits = self.action_net(latent_pi)
+        if self._action_mask is not None:
+            # A full board (never fed to the policy by the envs) keeps its logits
+            mask = self._action_mask | ~self._action_mask.any(dim=1, keepdim=True)
+            logits = th.where(mask, logits, th.full_like(logits, MASKED_LOGIT))
+        return self.action_dist.proba_distribution(action_logits=logits)
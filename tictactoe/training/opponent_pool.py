@@ -0,0 +1,158 @@
+import logging
+import os
+import random
+import re
+import time
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+MODELS_DIR = "./models"
+CHECKPOINT_PREFIX = "ppo_tictactoe_batch"
+
+
+def _load_ppo(path: str):
+    # Imported lazily so that the pool itself does not pull in torch
+    from stable_baselines3 import PPO
+
+    return PPO.load(path)
+
+
+class OpponentPool:
+    """
+    In-memory pool of past PPO checkpoints used as opponents by TicTacToeEnv.
+
+    Each checkpoint is deserialized at most once while it stays in the pool,
+    and at most `max_size` policies are kept in memory (least recently used
+    ones are evicted first). New checkpoints are discovered by comparing the
+    modification time of the models directory, which is only re-listed when
+    it changed, and that check itself runs at most once per `refresh_interval`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        models_dir: str = MODELS_DIR,
+        prefix: str = CHECKPOINT_PREFIX,
+        max_size: int = 4,
+        refresh_interval: float = 1.0,
+        loader: Callable[[str], object] = _load_ppo,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self.models_dir = models_dir
+        self.max_size = max_size
+        self.refresh_interval = refresh_interval
+        self.loader = loader
+
+        self._pattern = re.compile(rf"^{re.escape(prefix)}_(\d+)\.zip$")
+        self._checkpoints: List[Tuple[int, str]] = []  # (batch number, path), sorted
+        self._policies: "OrderedDict[str, object]" = OrderedDict()
+        self._dir_mtime: Optional[int] = None
+        self._last_check = float("-inf")
+
+        self.loads = 0
+        self.hits = 0
+        self.scans = 0
+        self.evictions = 0
+
+    @property
+    def checkpoints(self) -> List[str]:
+        """Paths of the known checkpoints, oldest batch first."""
+        return [path for _, path in self._checkpoints]
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Pick up new checkpoints if the models directory changed.
+        Args:
+            force (bool): Skip the refresh interval and mtime check
+        Returns:
+            bool: True if the directory was re-listed
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self.refresh_interval:
+            return False
+        self._last_check = now
+
+        try:
+            mtime = os.stat(self.models_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._checkpoints = []
+            self._dir_mtime = None
+            return False
+
+        if not force and mtime == self._dir_mtime:
+            return False
+        self._dir_mtime = mtime
+
+        checkpoints = []
+        for filename in os.listdir(self.models_dir):
+            match = self._pattern.match(filename)
+            if match:
+                checkpoints.append((int(match.group(1)), os.path.join(self.models_dir, filename)))
+        checkpoints.sort()
+        self._checkpoints = checkpoints
+        self.scans += 1
+        return True
+
+    def get(self, path: str):
+        """
+        Return the policy stored at `path`, loading it only if it is not cached.
+        """
+        policy = self._policies.get(path)
+        if policy is not None:
+            self._policies.move_to_end(path)
+            self.hits += 1
+            return policy
+
+        policy = self.loader(path)
+        self.loads += 1
+        logging.info(f"Loaded opponent checkpoint {path}")
+
+        self._policies[path] = policy
+        if len(self._policies) > self.max_size:
+            self._policies.popitem(last=False)
+            self.evictions += 1
+        return policy
+
+    def latest(self):
+        """
+        Return the most recent checkpoint policy, or None if there is none yet.
+        """
+        self.refresh()
+        if not self._checkpoints:
+            return None
+        return self.get(self._checkpoints[-1][1])
+
+    def sample(self, rng: random.Random = random):
+        """
+        Return a policy drawn uniformly among the `max_size` most recent
+        checkpoints, or None if there is none yet.
+        """
+        self.refresh()
+        if not self._checkpoints:
+            return None
+        _, path = rng.choice(self._checkpoints[-self.max_size:])
+        return self.get(path)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "checkpoints": len(self._checkpoints),
+            "cached": len(self._policies),
+            "loads": self.loads,
+            "hits": self.hits,
+            "scans": self.scans,
+            "evictions": self.evictions,
+        }
+
+
+_default_pool: Optional[OpponentPool] = None
+
+
+def default_pool() -> OpponentPool:
+    """Process-wide pool shared by every environment created in this process."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = OpponentPool()
+    return _default_pool
@@ -0,0 +1,148 @@
+import multiprocessing as mp
+
+from typing import Any, List
+
+import numpy as np
+
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+
+def _worker(remote, parent_remote, num_envs: int):
+    parent_remote.close()
+    env = TicTacToeVecEnv(num_envs, use_opponent_pool=False)
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "step":
+                remote.send(env.step(data))
+            elif command == "reset":
+                if data is not None:
+                    env.seed(data)
+                remote.send(env.reset())
+            elif command == "set_opponent":
+                env.set_opponent(data)
+            elif command == "close":
+                break
+            else:
+                raise NotImplementedError(f"Unknown command: {command}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        remote.close()
+
+
+class SubprocTicTacToeVecEnv(VecEnv):
+    """
+    TicTacToeVecEnv sharded over worker processes: each worker steps its own
+    block of environments as one NumPy array, so rollouts use several cores.
+
+    Workers never read checkpoint files. They keep a local copy of the
+    opponent policy, replaced when `set_opponent` pushes new weights (a
+    picklable policy such as NumpyPolicy), and play randomly until then.
+    """
+
+    render_mode = None
+
+    def __init__(self, num_envs: int, num_workers: int, start_method: str = None):
+        num_workers = max(1, min(num_workers, num_envs))
+        # Spread the environments as evenly as possible over the workers
+        self.env_counts = [len(block) for block in np.array_split(np.arange(num_envs), num_workers)]
+        self._splits = np.cumsum(self.env_counts)[:-1]
+
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self.remotes, self.processes = [], []
+        for count in self.env_counts:
+            remote, work_remote = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(work_remote, remote, count), daemon=True)
+            process.start()
+            work_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+        self.waiting = False
+        self.closed = False
+        self._observations = np.zeros((num_envs, 9), dtype=np.int8)
+        super().__init__(
+            num_envs,
+            spaces.Box(low=-1, high=1, shape=(9,), dtype=np.int8),
+            spaces.Discrete(9),
+        )
+
+    def set_opponent(self, opponent):
+        """Push a new opponent policy to every worker."""
+        for remote in self.remotes:
+            remote.send(("set_opponent", opponent))
+
+    def reset(self):
+        seeds = self._seeds
+        for i, remote in enumerate(self.remotes):
+            seed = None if seeds[0] is None else seeds[0] + 1_000_003 * i
+            remote.send(("reset", seed))
+        observations = [remote.recv() for remote in self.remotes]
+        self._reset_seeds()
+        self._reset_options()
+        self._observations = np.concatenate(observations)
+        return self._observations.copy()
+
+    def action_masks(self) -> np.ndarray:
+        """(num_envs, 9) bool, True for the empty squares of each current board."""
+        return self._observations == 0
+
+    def step_async(self, actions: np.ndarray):
+        for remote, block in zip(self.remotes, np.split(np.asarray(actions), self._splits)):
+            remote.send(("step", block))
+        self.waiting = True
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        observations, rewards, dones, infos = zip(*results)
+        self._observations = np.concatenate(observations)
+        return (
+            self._observations.copy(),
+            np.concatenate(rewards),
+            np.concatenate(dones),
+            [info for block in infos for info in block],
+        )
+
+    def close(self):
+        if self.closed:
+            return
+        if self.waiting:
+            for remote in self.remotes:
+                remote.recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.closed = True
+
+    def _indices(self, indices) -> List[int]:
+        if indices is None:
+            return list(range(self.num_envs))
+        if isinstance(indices, int):
+            return [indices]
+        return list(indices)
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        return [getattr(self, attr_name)] * len(self._indices(indices))
+
+    def set_attr(self, attr_name: str, value: Any, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs) -> List[Any]:
+        """
+        Call a method of this class, which must return one value per environment
+        (as TicTacToeVecEnv.env_method, e.g. "action_masks").
+        """
+        results = getattr(self, method_name)(*method_args, **method_kwargs)
+        return [results[i] for i in self._indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False] * len(self._indices(indices))
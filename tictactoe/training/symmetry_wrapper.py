@@ -0,0 +1,42 @@
+import gymnasium as gym
+import numpy as np
+
+from tictactoe.symmetry import TRANSFORMS
+
+_TRANSFORMS = np.array(TRANSFORMS, dtype=np.intp)
+
+
+class SymmetryAugmentation(gym.Wrapper):
+    """
+    Show each episode of a TicTacToeEnv through one of the 8 board symmetries,
+    drawn at random on reset, so that training sees all equivalent positions.
+
+    Observations are transformed before being returned and actions, chosen in
+    the transformed frame, are mapped back to the wrapped env's squares.
+    """
+
+    def __init__(self, env: gym.Env):
+        super().__init__(env)
+        self.transform = 0
+
+    def reset(self, **kwargs):
+        observation, info = self.env.reset(**kwargs)
+        self.transform = int(self.np_random.integers(len(TRANSFORMS)))
+        return self._observation(observation), self._info(info)
+
+    def step(self, action):
+        action = _TRANSFORMS[self.transform][int(action)]
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        return self._observation(observation), reward, terminated, truncated, self._info(info)
+
+    def action_masks(self):
+        return self._observation(self.env.unwrapped.action_masks())
+
+    def _info(self, info):
+        # Legal action masks are squares too
+        if "action_mask" in info:
+            info = dict(info, action_mask=self._observation(info["action_mask"]))
+        return info
+
+    def _observation(self, observation):
+        return np.asarray(observation)[_TRANSFORMS[self.transform]]
@@ -0,0 +1,183 @@
+import time
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from tictactoe.cells import random_legal_squares
+from tictactoe.tablebase import UNREACHABLE, Tablebase
+from tictactoe.tabular_policy import CHILDREN, IS_TERMINAL, SIDE_TO_MOVE, TERMINAL_VALUE, move_values
+
+# Square bits of the tablebase best-moves masks
+_SQUARE_BITS = 1 << np.arange(9)
+
+
+@dataclass
+class Evaluation:
+    """Convergence of the greedy policy after `games` self-play games."""
+    games: int
+    seconds: float
+    accuracy: float  # Share of the reachable positions where the greedy move is a perfect-play move
+    random_results: np.ndarray  # (win, draw, loss) rates against random moves
+    perfect_results: np.ndarray  # (win, draw, loss) rates against perfect play
+
+    def __str__(self):
+        random_win, random_draw, random_loss = self.random_results
+        _, perfect_draw, perfect_loss = self.perfect_results
+        return (
+            f"{self.games:>9,} games ({self.seconds:6.2f}s): best move in {self.accuracy:.2%} of the positions, "
+            f"vs random {random_win:.1%} won / {random_draw:.1%} draw / {random_loss:.1%} lost, "
+            f"vs perfect {perfect_draw:.1%} draw / {perfect_loss:.1%} lost"
+        )
+
+
+class TabularTrainer:
+    """
+    Self-play learning of the value of every position, indexed by its base-3
+    rank (Board.position_index), over `num_games` simultaneous games.
+
+    Each step plays one move in every game (epsilon-greedy on the current
+    values) and backs up the value of each position played from as the best
+    discounted value of its moves, for all games in one NumPy operation.
+    With `gamma` < 1, quick wins and slow losses are preferred, the same
+    tie-break as the solver, so the greedy policy converges to the
+    tablebase's best moves.
+    """
+
+    def __init__(
+        self,
+        num_games: int = 4096,
+        learning_rate: float = 0.5,
+        gamma: float = 0.9,
+        epsilon: float = 0.3,
+        seed: int = None,
+    ):
+        """
+        Args:
+            num_games (int): Games played simultaneously
+            learning_rate (float): Step of each value towards its backed-up target
+            gamma (float): Discount per move
+            epsilon (float): Probability of a random move instead of the greedy one
+            seed (int): Seed of the move selection
+        """
+        self.num_games = num_games
+        self.learning_rate = learning_rate
+        self.gamma = gamma
+        self.epsilon = epsilon
+        self.rng = np.random.default_rng(seed)
+        self.values = TERMINAL_VALUE.copy()
+        self.positions = np.zeros(num_games, dtype=np.intp)
+        self.games_played = 0
+        self.steps = 0
+
+    def step(self):
+        positions = self.positions
+        move_value = move_values(self.values, positions)
+        target = self.gamma * move_value.max(axis=1)
+        # Games at the same position share the same target, the duplicate writes agree
+        self.values[positions] += self.learning_rate * (target - self.values[positions])
+
+        legal = np.isfinite(move_value)
+        # Random tie-break between equally valued moves, not always the first square
+        move_value += self.rng.random(move_value.shape) * 1e-6
+        squares = move_value.argmax(axis=1)
+        explore = self.rng.random(self.num_games) < self.epsilon
+        squares[explore] = random_legal_squares(legal[explore], self.rng)
+
+        positions = CHILDREN[positions, squares]
+        finished = IS_TERMINAL[positions]
+        positions[finished] = 0
+        self.positions = positions
+        self.games_played += int(finished.sum())
+        self.steps += 1
+
+    def policy_squares(self, positions: np.ndarray) -> np.ndarray:
+        """Greedy square of each position."""
+        return move_values(self.values, positions).argmax(axis=1)
+
+    def train(
+        self,
+        max_games: int,
+        tablebase: Tablebase,
+        eval_every: int = 100_000,
+        eval_games: int = 10_000,
+        target_accuracy: float = 1.0,
+        callback: Optional[Callable[[Evaluation], None]] = None,
+    ) -> List[Evaluation]:
+        """
+        Self-play until `max_games` games are played, or until the greedy
+        policy plays a perfect-play move in `target_accuracy` of the positions.
+        Returns:
+            List[Evaluation]: One evaluation every `eval_every` games
+        """
+        evaluations = []
+        start_time = time.perf_counter()
+        next_eval = eval_every
+        while self.games_played < max_games:
+            self.step()
+            if self.games_played >= next_eval or self.games_played >= max_games:
+                next_eval += eval_every
+                evaluation = evaluate(self, tablebase, eval_games, time.perf_counter() - start_time)
+                evaluations.append(evaluation)
+                if callback is not None:
+                    callback(evaluation)
+                if evaluation.accuracy >= target_accuracy:
+                    break
+        return evaluations
+
+
+def perfect_play_accuracy(trainer: TabularTrainer, tablebase: Tablebase) -> float:
+    """Share of the reachable unfinished positions whose greedy move keeps the perfect-play value."""
+    records = tablebase.records
+    positions = np.flatnonzero((records["depth"] != UNREACHABLE) & (records["best_moves"] != 0))
+    squares = trainer.policy_squares(positions)
+    return float(np.mean(records["best_moves"][positions] >> squares & 1))
+
+
+def play_games(
+    trainer: TabularTrainer, opponent: Callable[[np.ndarray], np.ndarray], num_games: int, rng
+) -> np.ndarray:
+    """
+    (win, draw, loss) rates of the greedy policy, playing X in half of the
+    games and O in the other half, against `opponent(positions) -> squares`.
+    """
+    policy_cells = np.where(np.arange(num_games) % 2 == 0, 1, -1)
+    positions = np.zeros(num_games, dtype=np.intp)
+    # Result for the side to move when the game ended, kept for the finished games
+    results = np.zeros(num_games)
+    playing = np.ones(num_games, dtype=bool)
+    while playing.any():
+        games = np.flatnonzero(playing)
+        current = positions[games]
+        policy_turn = SIDE_TO_MOVE[current] == policy_cells[games]
+        squares = opponent(current)
+        squares[policy_turn] = trainer.policy_squares(current[policy_turn])
+        current = CHILDREN[current, squares]
+        positions[games] = current
+        finished = IS_TERMINAL[current]
+        # The value of a finished position is for the side to move, the policy's opponent when it just played
+        value = np.where(policy_turn, -TERMINAL_VALUE[current], TERMINAL_VALUE[current])
+        results[games[finished]] = value[finished]
+        playing[games[finished]] = False
+    return np.array([np.mean(results > 0), np.mean(results == 0), np.mean(results < 0)])
+
+
+def evaluate(trainer: TabularTrainer, tablebase: Tablebase, num_games: int, seconds: float) -> Evaluation:
+    rng = np.random.default_rng(0)
+    best_moves = tablebase.records["best_moves"]
+
+    def random_opponent(positions):
+        return random_legal_squares(CHILDREN[positions] >= 0, rng)
+
+    def perfect_opponent(positions):
+        # Random choice between the perfect-play moves
+        return random_legal_squares((best_moves[positions][:, None] & _SQUARE_BITS) != 0, rng)
+
+    return Evaluation(
+        games=trainer.games_played,
+        seconds=seconds,
+        accuracy=perfect_play_accuracy(trainer, tablebase),
+        random_results=play_games(trainer, random_opponent, num_games, rng),
+        perfect_results=play_games(trainer, perfect_opponent, num_games, rng),
+    )
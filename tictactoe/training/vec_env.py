@@ -0,0 +1,158 @@
+from typing import Any, List
+
+import numpy as np
+
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from tictactoe.cells import random_legal_squares, winning_boards
+from tictactoe.numpy_policy import NumpyPolicy
+from tictactoe.training.env import AGENT_CELL, DRAW_REWARD, LOSS_REWARD, OPPONENT_CELL, WIN_REWARD
+from tictactoe.training.opponent_pool import OpponentPool, default_pool
+
+
+class TicTacToeVecEnv(VecEnv):
+    """
+    Vectorized TicTacToeEnv: the boards of all environments are one
+    (num_envs, 9) int8 array, stepped with NumPy operations only.
+
+    The rules and rewards are those of TicTacToeEnv. The opponent (the latest
+    checkpoint of the opponent pool, or a policy given to `set_opponent`)
+    plays all environments in one batched predict call, and finished
+    environments are reset in place, their last board being returned in
+    `info["terminal_observation"]` as SB3 expects. Every board is its own
+    legal action mask (`action_masks`): empty squares are 0.
+    """
+
+    render_mode = None
+
+    def __init__(self, num_envs: int = 4, opponent_pool: OpponentPool = None, use_opponent_pool: bool = True):
+        """
+        Args:
+            num_envs (int): Number of environments
+            opponent_pool (OpponentPool): Pool providing the opponent, the process-wide one by default
+            use_opponent_pool (bool): If False, only play against the policy given to set_opponent
+                (random moves until there is one)
+        """
+        self.opponent_pool = opponent_pool if opponent_pool is not None else default_pool()
+        self.use_opponent_pool = use_opponent_pool
+        self.opponent = None
+        self.boards = np.zeros((num_envs, 9), dtype=np.int8)
+        self.rng = np.random.default_rng()
+        self._actions = None
+        self._rows = np.arange(num_envs)
+        # Agent actions on occupied squares, replaced by a random valid move (always 0 with masking)
+        self.illegal_actions = 0
+        super().__init__(
+            num_envs,
+            spaces.Box(low=-1, high=1, shape=(9,), dtype=np.int8),
+            spaces.Discrete(9),
+        )
+
+    def set_opponent(self, opponent):
+        """
+        Play against a fixed policy instead of the opponent pool (None to go back to the pool).
+        """
+        self.opponent = opponent
+
+    def get_opponent_model(self):
+        if self.opponent is not None or not self.use_opponent_pool:
+            return self.opponent
+        return self.opponent_pool.latest()
+
+    def reset(self):
+        if self._seeds[0] is not None:
+            self.rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+        self.boards[:] = 0
+        return self.boards.copy()
+
+    def action_masks(self) -> np.ndarray:
+        """(num_envs, 9) bool, True for the empty squares of each current board."""
+        return self.boards == 0
+
+    def step_async(self, actions: np.ndarray):
+        self._actions = np.asarray(actions, dtype=np.intp).reshape(self.num_envs)
+
+    def step_wait(self):
+        boards = self.boards
+        actions = self._actions.copy()
+
+        # Invalid actions are replaced by a random valid move, as in TicTacToeEnv
+        illegal = boards[self._rows, actions] != 0
+        if illegal.any():
+            self.illegal_actions += int(illegal.sum())
+            actions[illegal] = random_legal_squares(boards[illegal] == 0, self.rng)
+        boards[self._rows, actions] = AGENT_CELL
+
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        won = winning_boards(boards, AGENT_CELL)
+        rewards[won] = WIN_REWARD
+        dones = won | (boards != 0).all(axis=1)
+        rewards[dones & ~won] = DRAW_REWARD
+
+        ongoing = np.flatnonzero(~dones)
+        if ongoing.size:
+            self._play_opponent(ongoing, rewards, dones)
+
+        infos: List[dict] = [{} for _ in range(self.num_envs)]
+        finished = np.flatnonzero(dones)
+        for i in finished:
+            infos[i]["terminal_observation"] = boards[i].copy()
+            infos[i]["TimeLimit.truncated"] = False
+        boards[finished] = 0
+
+        return boards.copy(), rewards, dones, infos
+
+    def _play_opponent(self, envs: np.ndarray, rewards: np.ndarray, dones: np.ndarray):
+        boards = self.boards[envs]
+        mask = boards == 0
+        rows = np.arange(envs.size)
+
+        opponent = self.get_opponent_model()
+        if opponent is not None:
+            if isinstance(opponent, NumpyPolicy):
+                # Exported weights do not mask themselves as MaskedActorCriticPolicy does
+                actions, _ = opponent.predict(boards, deterministic=True, action_masks=mask)
+            else:
+                actions, _ = opponent.predict(boards, deterministic=True)
+            actions = np.asarray(actions, dtype=np.intp)
+            illegal = ~mask[rows, actions]
+            if illegal.any():
+                actions[illegal] = random_legal_squares(mask[illegal], self.rng)
+        else:
+            actions = random_legal_squares(mask, self.rng)
+
+        boards[rows, actions] = OPPONENT_CELL
+        self.boards[envs] = boards
+
+        lost = envs[winning_boards(boards, OPPONENT_CELL)]
+        rewards[lost] = LOSS_REWARD
+        dones[lost] = True
+
+    def close(self):
+        pass
+
+    def _indices(self, indices) -> List[int]:
+        if indices is None:
+            return list(range(self.num_envs))
+        if isinstance(indices, int):
+            return [indices]
+        return list(indices)
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        return [getattr(self, attr_name)] * len(self._indices(indices))
+
+    def set_attr(self, attr_name: str, value: Any, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs) -> List[Any]:
+        """
+        Call a method of this class, which must return one value per environment.
+        """
+        results = getattr(self, method_name)(*method_args, **method_kwargs)
+        return [results[i] for i in self._indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False] * len(self._indices(indices))
@@ -0,0 +1,13 @@
+import random
+
+# Zobrist hashing: a position's key is the XOR of one random 64-bit key per
+# occupied (square, symbol), so playing or removing a symbol updates it with
+# a single XOR. Keys are drawn from a fixed seed: they are the same in every
+# process and for every board engine.
+_rng = random.Random(0x7A0B)
+
+# Indexed by square (row * 3 + col)
+X_KEYS = tuple(_rng.getrandbits(64) for _ in range(9))
+O_KEYS = tuple(_rng.getrandbits(64) for _ in range(9))
+
+EMPTY_KEY = 0
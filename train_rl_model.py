@@ -1,145 +1,153 @@
-import os
+import argparse
 import random
 import time
-import gymnasium as gym
 import numpy as np
 import torch
 
-from gymnasium import spaces
 from stable_baselines3 import PPO
 from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.torch_layers import MlpExtractor
-
-
-class TicTacToeEnv(gym.Env):
-    def __init__(self):
-        super(TicTacToeEnv, self).__init__()
-        self.observation_space = spaces.Box(low=-1, high=1, shape=(9,), dtype=np.int8)
-        self.action_space = spaces.Discrete(9)
-        self.reset()
-
-    def reset(self, seed=None, options=None):
-        super().reset(seed=seed)
-        self.board = np.zeros(9, dtype=np.int8)
-        self.done = False  # Explicitly track if game is done
-        return self.board, {}  # Return initial state
-
-    def get_opponent_model(self):
-        """Load a fixed opponent model for consistent evaluation."""
-        past_models = sorted(
-            [f for f in os.listdir("./models") if "ppo_tictactoe_batch" in f],
-            key=lambda f: int(f.split("_")[-1])  # Sort numerically by batch number
-        )
-        if past_models:
-            latest_model = past_models[-1]  # Always load the most recent model
-            return PPO.load(f"./models/{latest_model}")
-        return None
-
-    def step(self, action):
-        if self.board[action] != 0:  # If action is invalid, force a valid choice
-            empty_spots = np.where(self.board == 0)[0]
-            if empty_spots.size > 0:
-                action = np.random.choice(empty_spots)  # Pick a random valid move
-            else:
-                return self.board, -10, True, False, {}  # No moves left, shouldn't happen
-
-        self.board[action] = 1  # Agent plays '1'
-
-        if self.check_win(1):
-            return self.board, 10, True, False, {}
-
-        if np.all(self.board != 0):
-            return self.board, 0, True, False, {}  # Draw
-
-        # Opponent move
-        opponent = self.get_opponent_model()
-        if opponent:
-            opponent_action, _ = opponent.predict(self.board, deterministic=True)
-        else:
-            empty_spots = np.where(self.board == 0)[0]
-            opponent_action = np.random.choice(empty_spots) if empty_spots.size > 0 else None
-
-        if opponent_action is not None:
-            self.board[opponent_action] = -1
-            if self.check_win(-1):
-                return self.board, -10, True, False, {}
-
-        # Encourage strategic positions
-        reward = 0.1 if action in [0, 2, 4, 6, 8] else 0
-        if action == 4:
-            reward += 0.2  # Extra reward for center move
-
-        return self.board, 0, False, False, {}
-
-    def check_win(self, player):
-        win_states = [
-            (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
-            (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
-            (0, 4, 8), (2, 4, 6)  # Diagonals
-        ]
-        return any(all(self.board[i] == player for i in state) for state in win_states)
-
-
-# Create vectorized Tic-Tac-Toe environment
-env = make_vec_env(TicTacToeEnv, n_envs=4)
-
-SEED = 42
-random.seed(SEED)
-np.random.seed(SEED)
-torch.manual_seed(SEED)
-env.seed(SEED)
-
-# Define policy architecture
-policy_kwargs = dict(
-    net_arch=[128, 128],
-    activation_fn=torch.nn.ReLU
-)
-
-# Initialize PPO model
-model = PPO(
-    "MlpPolicy",
-    env,
-    policy_kwargs=policy_kwargs,
-    verbose=1,
-    gamma=0.99,
-    learning_rate=lambda f: 0.0003 * f,
-    batch_size=64,
-    n_steps=1024,
-    ent_coef=0.05,
-    clip_range=0.2,
-    tensorboard_log="./ppo_tictactoe_log",
-)
-
-# Training time limit
-TRAIN_TIME_SECONDS = 21600  # 6 hours
-
-# Track time
-start_time = time.time()
-total_trained_timesteps = 0
-batch_num = 0
-timesteps_per_batch = 100_000
-
-# Training loop (stops after 10 minutes)
-while time.time() - start_time < TRAIN_TIME_SECONDS:
-    model.learn(total_timesteps=timesteps_per_batch)
-    total_trained_timesteps += timesteps_per_batch
-    batch_num += 1
-    model.save(f"./models/ppo_tictactoe_batch_{batch_num}")
-
-print(f"Training stopped after {time.time() - start_time:.2f} seconds (~{total_trained_timesteps} timesteps).")
-
-# Save final model
-model.save("./models/ppo_tictactoe_final")
-
-# Evaluate performance
-obs = env.reset()
-total_reward = np.zeros(env.num_envs)
-
-for _ in range(10):  # Test over 10 games
-    action, _ = model.predict(obs, deterministic=True)
-    obs, rewards, dones, _, _ = env.step(action)
-    total_reward += rewards
-
-# Compute average reward
-avg_reward = total_reward.mean() / 10
-print(f"Final Model: Average Reward = {avg_reward}")
\ No newline at end of file
+from stable_baselines3.common.vec_env import VecMonitor
+
+from tictactoe.numpy_policy import NumpyPolicy
+from tictactoe.training.callbacks import EvaluationCallback, RolloutThroughputCallback
+from tictactoe.training.env import TicTacToeEnv
+from tictactoe.training.evaluation import ParallelEvaluator, default_references
+from tictactoe.training.masked_policy import MaskedActorCriticPolicy
+from tictactoe.training.opponent_pool import default_pool
+from tictactoe.training.subproc_vec_env import SubprocTicTacToeVecEnv
+from tictactoe.training.symmetry_wrapper import SymmetryAugmentation
+from tictactoe.training.vec_env import TicTacToeVecEnv
+
+# Transitions collected per rollout, whatever the number of environments
+ROLLOUT_SIZE = 4096
+
+
+def make_env(vec_env: str, n_envs: int, n_workers: int, symmetry_augmentation: bool):
+    if vec_env in ("numpy", "subproc") and symmetry_augmentation:
+        raise ValueError("Symmetry augmentation is only available with --vec-env dummy.")
+    if vec_env == "numpy":
+        return VecMonitor(TicTacToeVecEnv(n_envs))
+    if vec_env == "subproc":
+        return VecMonitor(SubprocTicTacToeVecEnv(n_envs, n_workers))
+    # The symmetry wrapper shows each episode through a random rotation/reflection of the board
+    return make_vec_env(
+        TicTacToeEnv,
+        n_envs=n_envs,
+        wrapper_class=SymmetryAugmentation if symmetry_augmentation else None,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the PPO Tic-Tac-Toe agent against its past checkpoints.")
+    parser.add_argument(
+        "--vec-env",
+        choices=["numpy", "subproc", "dummy"],
+        default="numpy",
+        help=(
+            "numpy: all boards in one array (TicTacToeVecEnv), subproc: the boards split over "
+            "--n-workers processes, dummy: make_vec_env(TicTacToeEnv)."
+        ),
+    )
+    parser.add_argument("--n-envs", type=int, default=4)
+    parser.add_argument("--n-workers", type=int, default=2, help="Worker processes of --vec-env subproc.")
+    parser.add_argument("--symmetry-augmentation", action="store_true")
+    parser.add_argument(
+        "--eval-games",
+        type=int,
+        default=10_000,
+        help="Games against each reference (random, minimax, RL models) after every batch, 0 to disable.",
+    )
+    parser.add_argument("--eval-workers", type=int, default=2, help="Background processes playing the evaluations.")
+    parser.add_argument(
+        "--target-draw-rate",
+        type=float,
+        default=0.99,
+        help="Stop training once the draw rate against perfect play (minimax) reaches this.",
+    )
+    args = parser.parse_args()
+
+    # Create vectorized Tic-Tac-Toe environment
+    env = make_env(args.vec_env, args.n_envs, args.n_workers, args.symmetry_augmentation)
+
+    def push_opponent(policy):
+        # Subprocess workers keep their own copy of the opponent instead of reading checkpoints
+        if args.vec_env == "subproc":
+            env.venv.set_opponent(NumpyPolicy.from_sb3_policy(policy))
+
+    SEED = 42
+    random.seed(SEED)
+    np.random.seed(SEED)
+    torch.manual_seed(SEED)
+    env.seed(SEED)
+
+    # Define policy architecture
+    policy_kwargs = dict(
+        net_arch=[128, 128],
+        activation_fn=torch.nn.ReLU
+    )
+
+    # Initialize PPO model, occupied squares are masked out of the action distribution
+    model = PPO(
+        MaskedActorCriticPolicy,
+        env,
+        policy_kwargs=policy_kwargs,
+        verbose=1,
+        gamma=0.99,
+        learning_rate=lambda f: 0.0003 * f,
+        batch_size=64,
+        n_steps=max(ROLLOUT_SIZE // args.n_envs, 1),
+        ent_coef=0.05,
+        clip_range=0.2,
+        tensorboard_log="./ppo_tictactoe_log",
+    )
+
+    latest_checkpoint = default_pool().latest()
+    if latest_checkpoint is not None:
+        push_opponent(latest_checkpoint.policy)
+    throughput_callback = RolloutThroughputCallback(verbose=1)
+    callbacks = [throughput_callback]
+    evaluation_callback = None
+    if args.eval_games > 0:
+        evaluator = ParallelEvaluator(default_references(), args.eval_games, args.eval_workers, seed=SEED)
+        evaluation_callback = EvaluationCallback(evaluator, args.target_draw_rate, verbose=1)
+        callbacks.append(evaluation_callback)
+
+    # Training time limit
+    TRAIN_TIME_SECONDS = 21600  # 6 hours
+
+    # Track time
+    start_time = time.time()
+    total_trained_timesteps = 0
+    batch_num = 0
+    timesteps_per_batch = 100_000
+
+    # Training loop (stops after TRAIN_TIME_SECONDS, or once the evaluations reach the target draw rate)
+    while time.time() - start_time < TRAIN_TIME_SECONDS:
+        # Timesteps keep counting across batches: one TensorBoard run with continuous curves
+        model.learn(total_timesteps=timesteps_per_batch, callback=callbacks, reset_num_timesteps=batch_num == 0)
+        total_trained_timesteps += timesteps_per_batch
+        batch_num += 1
+        model.save(f"./models/ppo_tictactoe_batch_{batch_num}")
+        push_opponent(model.policy)
+        if evaluation_callback is not None and evaluation_callback.target_reached:
+            print(f"Target draw rate of {args.target_draw_rate:.0%} against perfect play reached.")
+            break
+
+    print(f"Training stopped after {time.time() - start_time:.2f} seconds (~{total_trained_timesteps} timesteps).")
+    print(f"Opponent pool: {default_pool().stats()}")
+
+    # Save final model
+    model.save("./models/ppo_tictactoe_final")
+
+    # Evaluate performance: wait for the evaluations still running in the background
+    if evaluation_callback is not None:
+        evaluation_callback.wait()
+        evaluator.close()
+        if evaluation_callback.history:
+            timesteps, results = evaluation_callback.history[-1]
+            print(f"Final Model ({timesteps} timesteps):")
+            for name, result in results.items():
+                print(
+                    f"  vs {name}: {result.win_rate:.1%} won, {result.draw_rate:.1%} draw, "
+                    f"{result.loss_rate:.1%} lost"
+                )
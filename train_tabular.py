@@ -0,0 +1,50 @@
+import argparse
+import os
+
+from tictactoe.agents_collection.reinforcement_agent import TABULAR_MODEL_PATH
+from tictactoe.tablebase import TABLEBASE_PATH, Tablebase, build_tablebase
+from tictactoe.tabular_policy import TabularPolicy
+from tictactoe.training.tabular_trainer import TabularTrainer
+
+DEFAULT_OUTPUT = TABULAR_MODEL_PATH
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Learn the value of every position by self-play over many simultaneous games (NumPy only), "
+            "and export a policy for ReinforcementAgent(backend=InferenceBackend.TABULAR)."
+        )
+    )
+    parser.add_argument("--num-games", type=int, default=4096, help="Games played simultaneously.")
+    parser.add_argument("--max-games", type=int, default=5_000_000, help="Stop after this many self-play games.")
+    parser.add_argument("--eval-every", type=int, default=50_000, help="Games between two evaluations.")
+    parser.add_argument("--eval-games", type=int, default=10_000, help="Games against each evaluation opponent.")
+    parser.add_argument(
+        "--target-accuracy",
+        type=float,
+        default=1.0,
+        help="Stop once the greedy move is a perfect-play move in this share of the positions.",
+    )
+    parser.add_argument("--learning-rate", type=float, default=0.5)
+    parser.add_argument("--gamma", type=float, default=0.9)
+    parser.add_argument("--epsilon", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tablebase", default=TABLEBASE_PATH, help="Perfect play used by the evaluations.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.tablebase):
+        build_tablebase(args.tablebase)
+
+    trainer = TabularTrainer(args.num_games, args.learning_rate, args.gamma, args.epsilon, args.seed)
+    evaluations = trainer.train(
+        args.max_games,
+        Tablebase(args.tablebase),
+        eval_every=args.eval_every,
+        eval_games=args.eval_games,
+        target_accuracy=args.target_accuracy,
+        callback=print,
+    )
+
+    TabularPolicy(trainer.values).save(args.output)
+    print(f"Trained on {trainer.games_played:,} games in {evaluations[-1].seconds:.2f}s, saved to {args.output}")